@@ -0,0 +1,482 @@
+# agent/lexicon_audit.py
+"""
+Аудит лексикона на корпусе отзывов: мёртвые и избыточные правила.
+
+Прогоняет все паттерны всех слоёв (тональность — по нормализованному
+тексту отзыва, темы и аспекты — по предложениям, как в reviews_core) по
+корпусу — тексты из вкладки reviews_history и/или XLS-выгрузки — и
+проверяет каждый паттерн-кандидат литерального префильтра без
+short-circuit. Отчёт:
+
+1. Мёртвые паттерны: ни разу не сработали на корпусе. Язык считается,
+   только если в корпусе достаточно отзывов, где он среди кандидатов
+   (_candidate_langs: язык отзыва + en), иначе «мёртвым» будет всё.
+2. Затенённые паттерны: на корпусе срабатывают только там, где уже
+   срабатывает другой паттерн того же правила и языка, — правило от них
+   не зависит.
+3. Правила-подмножества: хиты правила (объединение по паттернам и
+   языкам) на корпусе всегда внутри хитов другого правила того же слоя.
+   Аспекты — по совпадению паттернов, без привязки к подтемам.
+
+Всё это — на корпусе, а не статически: паттерн, мёртвый на истории, может
+понадобиться завтра. Поэтому пакет без мёртвых (и затенённых) паттернов
+пишется отдельным каталогом (--prune-out), его можно сравнить с текущим
+через lexicon_diff и переносить правки в lexicon_packs руками.
+В reviews_history лежит обрезанный текст (text_trimmed) — для полноты
+лучше добавить исходные выгрузки (--reviews).
+
+Запуск:
+    python -m agent.lexicon_audit --history [--reviews reviews.xls] [--prune-out /tmp/pruned_packs]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from . import reviews_io
+from .lexicon_module import (
+    COMPILE_MODE_PER_PATTERN,
+    LEXICON_COMMON_PACK,
+    LEXICON_PACKS_DIR,
+    Lexicon,
+    _candidate_langs,
+    normalize_text,
+    split_sentences,
+)
+
+LOG = logging.getLogger("lexicon_audit")
+
+HISTORY_SHEET_NAME = "reviews_history"
+DEFAULT_MIN_LANG_REVIEWS = 50
+DEFAULT_TOP = 50
+
+# слой -> раздел языкового пакета
+_PACK_SECTIONS = {"sentiment": "sentiment", "topic": "topics", "aspect": "aspects"}
+
+RuleKey = Tuple[str, Any]            # (слой, правило) — как в Lexicon.rule_patterns
+OwnerKey = Tuple[str, Any, str]      # (слой, правило, язык)
+
+
+@dataclass
+class PatternFinding:
+    layer: str
+    rule: Any
+    lang: str
+    pattern: str
+    hits: int = 0
+    # затенённый паттерн: кем и сколько хитов у того
+    by: str = ""
+    by_hits: int = 0
+
+
+@dataclass
+class RuleSubset:
+    layer: str
+    rule: Any
+    of_rule: Any
+    hits: int
+    of_hits: int
+
+
+@dataclass
+class LexiconAudit:
+    reviews: int = 0
+    sentences: int = 0
+    lang_reviews: Dict[str, int] = field(default_factory=dict)
+    skipped_langs: List[str] = field(default_factory=list)
+    dead: List[PatternFinding] = field(default_factory=list)
+    shadowed: List[PatternFinding] = field(default_factory=list)
+    subsets: List[RuleSubset] = field(default_factory=list)
+
+    def prune_map(self, shadowed: bool = True) -> Dict[OwnerKey, Set[str]]:
+        """
+        (слой, правило, язык) -> паттерны, которые можно выкинуть.
+        """
+        out: Dict[OwnerKey, Set[str]] = {}
+        for f in self.dead + (self.shadowed if shadowed else []):
+            out.setdefault((f.layer, f.rule, f.lang), set()).add(f.pattern)
+        return out
+
+    def summary(self) -> str:
+        return (
+            f"отзывов {self.reviews}, предложений {self.sentences}; мёртвых паттернов {len(self.dead)}, "
+            f"затенённых {len(self.shadowed)}, правил-подмножеств {len(self.subsets)}"
+        )
+
+
+# -----------------------------------------------------------------------------
+# Сбор срабатываний
+# -----------------------------------------------------------------------------
+
+class _FireLog:
+    """
+    Где сработал каждый скомпилированный паттерн (по id, паттерны общие
+    из пула лексикона): номера отзывов — для тональности, номера
+    предложений — для тем и аспектов. Плюс кандидаты языка каждого отзыва,
+    чтобы засчитывать паттерну языка L только отзывы, где L проверяется.
+    """
+
+    def __init__(self) -> None:
+        self.text_fires: Dict[int, List[int]] = {}
+        self.sentence_fires: Dict[int, List[int]] = {}
+        self.sentence_review: List[int] = []
+        self.review_langs: List[Tuple[str, ...]] = []
+        self.lang_reviews: Counter = Counter()
+
+    def add(self, lexicon: Lexicon, lang: str, text: str) -> None:
+        review_idx = len(self.review_langs)
+        cands = tuple(dict.fromkeys(_candidate_langs(lang)))
+        self.review_langs.append(cands)
+        self.lang_reviews.update(cands)
+
+        norm = lexicon.fold_text(normalize_text(text or ""))
+        if not norm:
+            return
+        screen = lexicon.prefilter(norm, lang)
+        self._search(screen.sentiment.values(), norm, review_idx, self.text_fires)
+        for sent in split_sentences(norm, normalized=True):
+            sent_idx = len(self.sentence_review)
+            self.sentence_review.append(review_idx)
+            screen = lexicon.prefilter(sent, lang)
+            groups = [pats for _pair, pats in screen.topics]
+            groups.extend(screen.aspect_by_id.values())
+            self._search(groups, sent, sent_idx, self.sentence_fires)
+
+    @staticmethod
+    def _search(groups: Iterable[List[Any]], text: str, unit: int, fires: Dict[int, List[int]]) -> None:
+        seen: Set[int] = set()
+        for pats in groups:
+            for rx in pats:
+                key = id(rx)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if rx.search(text):
+                    fires.setdefault(key, []).append(unit)
+
+    def hits(self, layer: str, rx: Any, lang: str) -> frozenset:
+        """
+        Единицы (отзывы / предложения), где паттерн rx языка lang сработал.
+        """
+        if layer == "sentiment":
+            units = self.text_fires.get(id(rx), ())
+            return frozenset(u for u in units if lang in self.review_langs[u])
+        units = self.sentence_fires.get(id(rx), ())
+        return frozenset(u for u in units if lang in self.review_langs[self.sentence_review[u]])
+
+
+# -----------------------------------------------------------------------------
+# Аудит
+# -----------------------------------------------------------------------------
+
+def _compiled_by_owner(lexicon: Lexicon) -> Dict[OwnerKey, Dict[str, Any]]:
+    # в per_pattern rx.pattern — исходная строка паттерна из пакета
+    return {
+        owner: {rx.pattern: rx for rx in compiled}
+        for owner, compiled in lexicon.compiled_rules().items()
+    }
+
+
+def _dominator(
+    idx: int,
+    hit_sets: List[frozenset],
+) -> Optional[int]:
+    """
+    Паттерн, внутри хитов которого лежат хиты паттерна idx: строгое
+    надмножество или равное множество у паттерна раньше по списку (так из
+    группы одинаковых остаётся первый). Из нескольких — с наибольшим числом хитов.
+    """
+    mine = hit_sets[idx]
+    best = None
+    for j, other in enumerate(hit_sets):
+        if j == idx or not other or len(other) < len(mine):
+            continue
+        if mine <= other and (len(other) > len(mine) or j < idx):
+            if best is None or len(other) > len(hit_sets[best]):
+                best = j
+    return best
+
+
+def audit_lexicon(
+    corpus: Iterable[Tuple[str, str]],
+    lexicon: Optional[Lexicon] = None,
+    min_lang_reviews: int = DEFAULT_MIN_LANG_REVIEWS,
+) -> LexiconAudit:
+    """
+    corpus — пары (lang, text). lexicon должен быть в режиме per_pattern
+    (в fused паттерны правила слиты и по отдельности не видны).
+    """
+    lexicon = lexicon or Lexicon(compile_mode=COMPILE_MODE_PER_PATTERN)
+    if lexicon.compile_mode != COMPILE_MODE_PER_PATTERN:
+        raise ValueError("lexicon audit needs compile_mode='per_pattern'")
+
+    rules = lexicon.rule_patterns()
+    lexicon.preload({lang for by_lang in rules.values() for lang in by_lang})
+
+    log = _FireLog()
+    t0 = time.perf_counter()
+    for lang, text in corpus:
+        log.add(lexicon, lang, text)
+    LOG.info(
+        "Корпус: %d отзывов, %d предложений, проход за %.1fs",
+        len(log.review_langs), len(log.sentence_review), time.perf_counter() - t0,
+    )
+
+    audit = LexiconAudit(
+        reviews=len(log.review_langs),
+        sentences=len(log.sentence_review),
+        lang_reviews=dict(log.lang_reviews),
+    )
+    covered = {lang for lang, n in log.lang_reviews.items() if n >= min_lang_reviews}
+    audit.skipped_langs = sorted({lang for by_lang in rules.values() for lang in by_lang} - covered)
+
+    compiled = _compiled_by_owner(lexicon)
+    rule_hits: Dict[RuleKey, Set[int]] = {}
+    for (layer, rule), by_lang in rules.items():
+        union: Set[int] = set()
+        for lang, pats in by_lang.items():
+            owner_rx = compiled.get((layer, rule, lang), {})
+            present = [p for p in dict.fromkeys(pats) if p in owner_rx]
+            hit_sets = [log.hits(layer, owner_rx[p], lang) for p in present]
+            for hs in hit_sets:
+                union |= hs
+            if lang not in covered:
+                continue
+            for i, pattern in enumerate(present):
+                hs = hit_sets[i]
+                if not hs:
+                    audit.dead.append(PatternFinding(layer=layer, rule=rule, lang=lang, pattern=pattern))
+                    continue
+                j = _dominator(i, hit_sets)
+                if j is not None:
+                    audit.shadowed.append(PatternFinding(
+                        layer=layer, rule=rule, lang=lang, pattern=pattern, hits=len(hs),
+                        by=present[j], by_hits=len(hit_sets[j]),
+                    ))
+        rule_hits[(layer, rule)] = union
+
+    audit.subsets = _rule_subsets(rule_hits)
+    LOG.info("Аудит: %s", audit.summary())
+    return audit
+
+
+def _rule_subsets(rule_hits: Dict[RuleKey, Set[int]]) -> List[RuleSubset]:
+    """
+    Пары правил одного слоя, где хиты первого внутри хитов второго
+    (равные множества — одна пара, более позднее правило внутри раннего).
+    Кандидаты во «второе» — только правила, сработавшие на первой единице
+    первого.
+    """
+    order = {key: i for i, key in enumerate(rule_hits)}
+    by_unit: Dict[Tuple[str, int], List[RuleKey]] = {}
+    for key, units in rule_hits.items():
+        for u in units:
+            by_unit.setdefault((key[0], u), []).append(key)
+
+    out: List[RuleSubset] = []
+    for key, units in rule_hits.items():
+        if not units:
+            continue
+        layer = key[0]
+        for other in by_unit[(layer, min(units))]:
+            if other == key:
+                continue
+            other_units = rule_hits[other]
+            if len(other_units) < len(units) or not units <= other_units:
+                continue
+            if len(other_units) == len(units) and order[other] > order[key]:
+                continue
+            out.append(RuleSubset(
+                layer=layer, rule=key[1], of_rule=other[1], hits=len(units), of_hits=len(other_units),
+            ))
+    out.sort(key=lambda s: (s.layer, -s.hits))
+    return out
+
+
+# -----------------------------------------------------------------------------
+# Урезанный пакет
+# -----------------------------------------------------------------------------
+
+def write_pruned_packs(
+    prune: Dict[OwnerKey, Set[str]],
+    out_dir: str,
+    packs_dir: Optional[str] = None,
+) -> int:
+    """
+    Копия lexicon_packs в out_dir без паттернов из prune. common.json —
+    как есть; правило, у которого на языке не осталось паттернов, из
+    пакета языка убирается. Возвращает число выкинутых паттернов.
+    """
+    packs_dir = packs_dir or LEXICON_PACKS_DIR
+    os.makedirs(out_dir, exist_ok=True)
+    removed = 0
+    for name in sorted(os.listdir(packs_dir)):
+        if not name.endswith(".json"):
+            continue
+        src = os.path.join(packs_dir, name)
+        dst = os.path.join(out_dir, name)
+        if name == f"{LEXICON_COMMON_PACK}.json":
+            shutil.copyfile(src, dst)
+            continue
+        with open(src, encoding="utf-8") as fh:
+            pack = json.load(fh)
+        lang = pack.get("lang") or name[: -len(".json")]
+
+        def keep(layer: str, rule: Any, patterns: List[str]) -> List[str]:
+            nonlocal removed
+            drop = prune.get((layer, rule, lang))
+            if not drop:
+                return patterns
+            kept = [p for p in patterns if p not in drop]
+            removed += len(patterns) - len(kept)
+            return kept
+
+        for layer, section in _PACK_SECTIONS.items():
+            rules = pack.get(section)
+            if not rules:
+                continue
+            if layer == "topic":
+                for topic_key in list(rules):
+                    subtopics = rules[topic_key]
+                    for sub_key in list(subtopics):
+                        subtopics[sub_key] = keep(layer, (topic_key, sub_key), subtopics[sub_key])
+                        if not subtopics[sub_key]:
+                            del subtopics[sub_key]
+                    if not subtopics:
+                        del rules[topic_key]
+            else:
+                for rule in list(rules):
+                    rules[rule] = keep(layer, rule, rules[rule])
+                    if not rules[rule]:
+                        del rules[rule]
+
+        with open(dst, "w", encoding="utf-8") as fh:
+            json.dump(pack, fh, ensure_ascii=False, indent=2)
+            fh.write("\n")
+    return removed
+
+
+# -----------------------------------------------------------------------------
+# Корпус
+# -----------------------------------------------------------------------------
+
+def corpus_from_xls(paths: Iterable[str]) -> List[Tuple[str, str]]:
+    corpus: List[Tuple[str, str]] = []
+    for path in paths:
+        with open(path, "rb") as fh:
+            df = reviews_io.read_reviews_xls(fh.read())
+        corpus.extend(zip(df["lang"].astype(str), df["text"].astype(str)))
+    return corpus
+
+
+def corpus_from_history() -> List[Tuple[str, str]]:
+    """
+    (lang, text_trimmed) из вкладки reviews_history
+    (SHEETS_HISTORY_ID + GOOGLE_SERVICE_ACCOUNT_JSON_B64, как у агентов).
+    """
+    from .connectors import build_credentials_from_b64, get_sheets_client
+
+    sheets_id = os.environ.get("SHEETS_HISTORY_ID")
+    if not sheets_id:
+        raise RuntimeError("ENV SHEETS_HISTORY_ID is required for --history")
+    sheets = get_sheets_client(build_credentials_from_b64())
+    resp = sheets.spreadsheets().values().get(
+        spreadsheetId=sheets_id, range=f"'{HISTORY_SHEET_NAME}'!A:Z",
+    ).execute()
+    values = resp.get("values", [])
+    if not values:
+        return []
+    header = [str(h).strip().lower() for h in values[0]]
+    try:
+        lang_col, text_col = header.index("lang"), header.index("text_trimmed")
+    except ValueError:
+        raise RuntimeError(f"{HISTORY_SHEET_NAME}: нет колонок lang / text_trimmed")
+    corpus: List[Tuple[str, str]] = []
+    for row in values[1:]:
+        text = row[text_col] if len(row) > text_col else ""
+        if text.strip():
+            corpus.append((row[lang_col] if len(row) > lang_col else "", text))
+    return corpus
+
+
+# -----------------------------------------------------------------------------
+# Отчёт / CLI
+# -----------------------------------------------------------------------------
+
+def _rule_label(layer: str, rule: Any) -> str:
+    if isinstance(rule, tuple):
+        rule = "/".join(str(part) for part in rule)
+    return f"{layer}:{rule}"
+
+
+def format_audit(audit: LexiconAudit, top: int = DEFAULT_TOP) -> str:
+    lines = [f"Аудит лексикона: {audit.summary()}"]
+    if audit.skipped_langs:
+        lines.append(
+            "Языки без достаточного покрытия (не проверялись на мёртвые/затенённые): "
+            + ", ".join(f"{lang} ({audit.lang_reviews.get(lang, 0)})" for lang in audit.skipped_langs)
+        )
+
+    dead_by_rule = Counter((f.layer, f.rule, f.lang) for f in audit.dead)
+    lines.append("")
+    lines.append(f"Мёртвые паттерны: {len(audit.dead)} (правил с мёртвыми: {len(dead_by_rule)})")
+    for (layer, rule, lang), n in dead_by_rule.most_common(top):
+        lines.append(f"  {_rule_label(layer, rule):<56}[{lang}] {n}")
+
+    lines.append("")
+    lines.append(f"Затенённые паттерны: {len(audit.shadowed)}")
+    for f in sorted(audit.shadowed, key=lambda f: -f.hits)[:top]:
+        lines.append(
+            f"  {_rule_label(f.layer, f.rule)} [{f.lang}] {f.pattern!r} ({f.hits}) ⊆ {f.by!r} ({f.by_hits})"
+        )
+
+    lines.append("")
+    lines.append(f"Правила-подмножества: {len(audit.subsets)}")
+    for s in audit.subsets[:top]:
+        lines.append(
+            f"  {_rule_label(s.layer, s.rule)} ({s.hits}) ⊆ {_rule_label(s.layer, s.of_rule)} ({s.of_hits})"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Мёртвые и избыточные правила лексикона на корпусе отзывов")
+    parser.add_argument("--history", action="store_true", help="взять тексты из вкладки reviews_history")
+    parser.add_argument("--reviews", action="append", default=[],
+                        help="XLS/XLSX-файл с отзывами (можно несколько раз)")
+    parser.add_argument("--packs", default=None, help="каталог lexicon_packs (по умолчанию текущий)")
+    parser.add_argument("--min-lang-reviews", type=int, default=DEFAULT_MIN_LANG_REVIEWS,
+                        help="минимум отзывов на язык, чтобы искать у него мёртвые паттерны")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="сколько строк показать в каждом разделе")
+    parser.add_argument("--prune-out", default=None,
+                        help="записать сюда lexicon_packs без мёртвых и затенённых паттернов")
+    parser.add_argument("--keep-shadowed", action="store_true",
+                        help="в --prune-out выкидывать только мёртвые паттерны")
+    args = parser.parse_args(argv)
+    if not args.history and not args.reviews:
+        parser.error("нужен корпус: --history и/или --reviews")
+
+    corpus = corpus_from_xls(args.reviews)
+    if args.history:
+        corpus.extend(corpus_from_history())
+    LOG.info("Отзывов в корпусе: %d", len(corpus))
+
+    lexicon = Lexicon(compile_mode=COMPILE_MODE_PER_PATTERN, packs_dir=args.packs)
+    audit = audit_lexicon(corpus, lexicon, min_lang_reviews=args.min_lang_reviews)
+    print(format_audit(audit, args.top))
+
+    if args.prune_out:
+        removed = write_pruned_packs(audit.prune_map(shadowed=not args.keep_shadowed), args.prune_out, args.packs)
+        print(f"\nУрезанный пакет: {args.prune_out} (выкинуто паттернов: {removed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# agent/lexicon_bench.py
+"""
+Бенчмарк движков матчинга лексикона на реальном файле отзывов.
+
+Прогоняет один и тот же набор отзывов через analyze_reviews_bulk с разными
+настройками Lexicon (движок отбора, режим компиляции, регистр), меряет время и сверяет
+результаты с эталоном (engine="loop" — полный перебор паттернов, как было
+исходно).
+
+Запуск:
+    python -m agent.lexicon_bench path/to/reviews.xls [--limit 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import reviews_io, reviews_core
+from .lexicon_module import (
+    Lexicon,
+    ENGINE_LITERAL,
+    ENGINE_MEGA,
+    ENGINE_LOOP,
+    COMPILE_MODE_PER_PATTERN,
+    COMPILE_MODE_FUSED,
+    CASE_MODE_FOLDED,
+)
+
+LOG = logging.getLogger("lexicon_bench")
+
+# (имя конфигурации, kwargs для Lexicon); первая — эталон
+DEFAULT_CONFIGS: List[Tuple[str, Dict[str, Any]]] = [
+    ("loop", {"engine": ENGINE_LOOP, "compile_mode": COMPILE_MODE_PER_PATTERN}),
+    ("loop+fused", {"engine": ENGINE_LOOP, "compile_mode": COMPILE_MODE_FUSED}),
+    ("literal", {"engine": ENGINE_LITERAL, "compile_mode": COMPILE_MODE_PER_PATTERN}),
+    ("literal+fused", {"engine": ENGINE_LITERAL, "compile_mode": COMPILE_MODE_FUSED}),
+    ("literal+folded", {"engine": ENGINE_LITERAL, "compile_mode": COMPILE_MODE_PER_PATTERN,
+                        "case_mode": CASE_MODE_FOLDED}),
+    ("mega", {"engine": ENGINE_MEGA, "compile_mode": COMPILE_MODE_PER_PATTERN}),
+]
+
+
+@dataclass
+class BenchRow:
+    name: str
+    build_sec: float
+    analyze_sec: float
+    reviews: int
+    mismatches: int
+
+
+def _result_signature(res: reviews_core.ReviewAnalysisResult) -> Tuple[Any, ...]:
+    """
+    Всё, что попадает в отчёт/историю, в сравнимом виде.
+    """
+    return (
+        res.review_id,
+        res.sentiment_overall,
+        tuple(sorted(res.sentiment_detail.items())),
+        res.sentiment_score,
+        tuple(sorted(res.topic_hits)),
+        tuple((a.aspect_code, a.topic_key, a.subtopic_key) for a in res.aspects),
+    )
+
+
+def run_benchmark(
+    records: Sequence[reviews_core.ReviewRecordInput],
+    configs: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+) -> List[BenchRow]:
+    """
+    Прогоняет records через каждую конфигурацию. Первая конфигурация —
+    эталон, с ней сверяются результаты остальных.
+    """
+    configs = configs or DEFAULT_CONFIGS
+    rows: List[BenchRow] = []
+    reference: Optional[List[Tuple[Any, ...]]] = None
+
+    for name, kwargs in configs:
+        t0 = time.perf_counter()
+        lexicon = Lexicon(**kwargs)
+        t1 = time.perf_counter()
+        analyzed = reviews_core.analyze_reviews_bulk(list(records), lexicon)
+        t2 = time.perf_counter()
+
+        signatures = [_result_signature(r) for r in analyzed]
+        if reference is None:
+            reference = signatures
+            mismatches = 0
+        else:
+            mismatches = sum(1 for a, b in zip(reference, signatures) if a != b)
+            mismatches += abs(len(reference) - len(signatures))
+
+        rows.append(BenchRow(
+            name=name,
+            build_sec=t1 - t0,
+            analyze_sec=t2 - t1,
+            reviews=len(analyzed),
+            mismatches=mismatches,
+        ))
+        LOG.info("%s: build %.2fs, analyze %.2fs", name, t1 - t0, t2 - t1)
+    return rows
+
+
+def format_rows(rows: List[BenchRow]) -> str:
+    lines = [
+        f"{'config':<16}{'build, s':>10}{'analyze, s':>12}{'ms/review':>11}{'mismatch':>10}",
+    ]
+    for r in rows:
+        per_review = (r.analyze_sec / r.reviews * 1000.0) if r.reviews else 0.0
+        lines.append(
+            f"{r.name:<16}{r.build_sec:>10.2f}{r.analyze_sec:>12.2f}{per_review:>11.2f}{r.mismatches:>10d}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Бенчмарк движков матчинга лексикона")
+    parser.add_argument("path", help="XLS/XLSX-файл с отзывами (формат как у выгрузки на Drive)")
+    parser.add_argument("--limit", type=int, default=0, help="взять только первые N отзывов")
+    args = parser.parse_args(argv)
+
+    with open(args.path, "rb") as fh:
+        df_raw = reviews_io.read_reviews_xls(fh.read())
+    records = reviews_io.df_to_inputs(df_raw)
+    if args.limit > 0:
+        records = records[: args.limit]
+    LOG.info("Отзывов для бенчмарка: %d", len(records))
+
+    print(format_rows(run_benchmark(records)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+# agent/lexicon_casefold_check.py
+"""
+Сверка режима case_mode="folded" с историческим ignorecase.
+
+В режиме folded текст один раз приводится к регистру (_fold_case), а
+паттерны переписаны в тот же регистр и идут без re.IGNORECASE. Результаты
+обязаны совпадать с ignorecase; здесь это проверяется на трёх уровнях:
+
+  1. алфавит — каждый символ Unicode: _fold_case не меняет длину,
+     идемпотентна и согласована с IGNORECASE (символ совпадает со своим
+     образом, все его регистровые варианты дают тот же образ);
+  2. контрольные случаи — кириллица (Ё/ё, диапазоны [А-Я]), турецкие
+     i/ı/İ/I, латиница (ſ, знак кельвина, ß/ẞ): каждый паттерн по каждому
+     тексту в обоих режимах;
+  3. корпус — каждый паттерн, который пропустил префильтр, по каждому
+     тексту/предложению корпуса в обоих режимах (как в lexicon_audit),
+     плюс итоговые результаты analyze_reviews_bulk и время анализа.
+
+Запуск:
+    python -m agent.lexicon_casefold_check --reviews reviews.xls
+    python -m agent.lexicon_casefold_check --history --limit 20000
+Код выхода 1 — нашлось расхождение.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import reviews_core
+from .lexicon_audit import corpus_from_history, corpus_from_xls
+from .lexicon_bench import _result_signature
+from .lexicon_module import (
+    CASE_MODE_FOLDED,
+    CASE_MODE_IGNORECASE,
+    _RE_EXTRA_CASES,
+    _REGEX_FLAGS,
+    _casefolded_regex,
+    _fold_case,
+    Lexicon,
+    normalize_text,
+    split_sentences,
+)
+
+LOG = logging.getLogger("lexicon_casefold_check")
+
+# сколько расхождений каждого вида показывать в отчёте
+_SHOW = 10
+
+# (группа, паттерн, тексты): паттерн — как в пакетах (с IGNORECASE)
+CONTROL_CASES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("cyrillic", r"\bотличн", ("Отличный завтрак", "ОТЛИЧНО", "неотличный", "oтличный")),
+    ("cyrillic", r"ёлк|елк", ("ЁЛКА в холле", "Ёлка", "ЕЛКА", "ёЛкА")),
+    ("cyrillic", r"[А-Я]{3}", ("абв", "АБВ", "ёжи", "ЁЖИ", "a-b")),
+    ("cyrillic", r"[а-яё]+ый\b", ("ХОЛОДНЫЙ душ", "Ёмкий", "ЁМКИЙ", "чистый.")),
+    ("cyrillic", r"[^а-я]ресепшн", ("Ресепшн", " РЕСЕПШН", "-ресепшн", "xресепшн")),
+    ("turkish", r"\bkahvaltı", ("KAHVALTI", "Kahvaltı", "kahvalti", "KAHVALTİ")),
+    ("turkish", r"iyi", ("İYİ", "IYI", "ıyı", "İyi", "iyi")),
+    ("turkish", r"\bİstanbul\b", ("istanbul", "ISTANBUL", "İSTANBUL", "ıstanbul")),
+    ("turkish", r"ş[ıi]k", ("ŞIK", "şık", "ŞİK", "sik")),
+    ("turkish", r"[ıi]", ("I", "İ", "ı", "i")),
+    ("latin", r"\bstaff\b", ("STAFF", "Staff", "ſtaff", "staƒf")),
+    ("latin", r"\bok\b", ("OK", "oK", "ok", "Ok")),
+    ("latin", r"kelvin", ("KELVIN", "\u212aelvin", "Kelvin")),
+    ("latin", r"straße|strasse", ("STRASSE", "STRAẞE", "Straße", "strasse")),
+    ("latin", r"[a-z]+ing\b", ("AMAZING", "Amazing view", "Ünique thing")),
+    ("latin", r"caf[eé]", ("CAFÉ", "Cafe", "cafè")),
+]
+
+
+@dataclass
+class Mismatch:
+    pattern: str
+    text: str
+    ignorecase: bool
+    folded: bool
+
+
+@dataclass
+class CasefoldReport:
+    alphabet_checked: int = 0
+    alphabet_bad: List[Tuple[int, str]] = field(default_factory=list)
+    control_checked: int = 0
+    control_bad: List[Mismatch] = field(default_factory=list)
+    patterns_total: int = 0
+    patterns_ignorecase: int = 0
+    corpus_reviews: int = 0
+    corpus_checked: int = 0
+    corpus_bad: List[Mismatch] = field(default_factory=list)
+    results_total: int = 0
+    results_bad: List[str] = field(default_factory=list)
+    seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.alphabet_bad or self.control_bad or self.corpus_bad or self.results_bad)
+
+
+# -----------------------------------------------------------------------------
+# 1. Алфавит
+# -----------------------------------------------------------------------------
+
+def check_alphabet() -> Tuple[int, List[Tuple[int, str]]]:
+    """
+    (символов проверено, [(код, что не так), ...]) по всему Unicode
+    (без суррогатов).
+    """
+    bad: List[Tuple[int, str]] = []
+    checked = 0
+    for cp in range(0x110000):
+        if 0xD800 <= cp <= 0xDFFF:
+            continue
+        ch = chr(cp)
+        checked += 1
+        folded = _fold_case(ch)
+        if len(folded) != 1:
+            bad.append((cp, f"length {len(folded)}"))
+            continue
+        if _fold_case(folded) != folded:
+            bad.append((cp, "not idempotent"))
+        if not re.fullmatch(re.escape(ch), folded, _REGEX_FLAGS):
+            bad.append((cp, f"does not match its image {folded!r} with IGNORECASE"))
+        variants = {ch.lower(), ch.upper(), ch.title()}
+        variants.update(chr(other) for other in _RE_EXTRA_CASES.get(cp, ()))
+        for variant in variants:
+            if len(variant) == 1 and re.fullmatch(re.escape(ch), variant, _REGEX_FLAGS):
+                if _fold_case(variant) != folded:
+                    bad.append((cp, f"case variant {variant!r} folds differently"))
+    return checked, bad
+
+
+# -----------------------------------------------------------------------------
+# 2. Контрольные случаи
+# -----------------------------------------------------------------------------
+
+def _pair(pattern: str) -> Tuple[re.Pattern, re.Pattern]:
+    folded = _casefolded_regex(pattern)
+    folded_rx = re.compile(*folded) if folded is not None else re.compile(pattern, _REGEX_FLAGS)
+    return re.compile(pattern, _REGEX_FLAGS), folded_rx
+
+
+def check_control_cases(
+    cases: Sequence[Tuple[str, str, Tuple[str, ...]]] = CONTROL_CASES,
+) -> Tuple[int, List[Mismatch]]:
+    bad: List[Mismatch] = []
+    checked = 0
+    for _group, pattern, texts in cases:
+        original, folded = _pair(pattern)
+        for text in texts:
+            checked += 1
+            want = original.search(text) is not None
+            got = folded.search(_fold_case(text)) is not None
+            if want != got:
+                bad.append(Mismatch(pattern, text, want, got))
+    return checked, bad
+
+
+# -----------------------------------------------------------------------------
+# 3. Корпус
+# -----------------------------------------------------------------------------
+
+def _folded_twins(reference: Lexicon, folded: Lexicon) -> Dict[int, re.Pattern]:
+    """
+    id(паттерна ignorecase) -> тот же паттерн режима folded (правила и
+    порядок паттернов у лексиконов одинаковые, режим компиляции — поштучный).
+    """
+    twins: Dict[int, re.Pattern] = {}
+    folded_rules = folded.compiled_rules()
+    for owner, compiled in reference.compiled_rules().items():
+        for rx, twin in zip(compiled, folded_rules.get(owner, [])):
+            twins[id(rx)] = twin
+    return twins
+
+
+def _compare(
+    groups: Iterable[List[re.Pattern]],
+    text: str,
+    folded_text: str,
+    twins: Dict[int, re.Pattern],
+    seen: set,
+    bad: List[Mismatch],
+) -> int:
+    checked = 0
+    for pats in groups:
+        for rx in pats:
+            if id(rx) in seen:
+                continue
+            seen.add(id(rx))
+            checked += 1
+            want = rx.search(text) is not None
+            got = twins[id(rx)].search(folded_text) is not None
+            if want != got:
+                bad.append(Mismatch(rx.pattern, text, want, got))
+    return checked
+
+
+def check_corpus(
+    corpus: Sequence[Tuple[str, str]],
+    reference: Lexicon,
+    folded: Lexicon,
+    report: CasefoldReport,
+) -> None:
+    """
+    Попаттерновая сверка на корпусе: тональность — по нормализованному
+    тексту, темы и аспекты — по предложениям (как в analyze_text).
+    """
+    langs = sorted({lang for lang, _text in corpus})
+    reference.preload(langs)
+    folded.preload(langs)
+    twins = _folded_twins(reference, folded)
+    report.patterns_total = len(twins)
+    report.patterns_ignorecase = sum(1 for rx in twins.values() if rx.flags & re.IGNORECASE)
+
+    for lang, text in corpus:
+        report.corpus_reviews += 1
+        norm = normalize_text(text or "")
+        if not norm:
+            continue
+        screen = reference.prefilter(norm, lang)
+        report.corpus_checked += _compare(
+            screen.sentiment.values(), norm, folded.fold_text(norm), twins, set(), report.corpus_bad,
+        )
+        for sent in split_sentences(norm, normalized=True):
+            screen = reference.prefilter(sent, lang)
+            groups = [pats for _pair, pats in screen.topics]
+            groups.extend(screen.aspect_by_id.values())
+            report.corpus_checked += _compare(
+                groups, sent, folded.fold_text(sent), twins, set(), report.corpus_bad,
+            )
+
+
+def check_results(
+    corpus: Sequence[Tuple[str, str]],
+    reference: Lexicon,
+    folded: Lexicon,
+    report: CasefoldReport,
+) -> None:
+    """
+    Итоговые результаты analyze_reviews_bulk в обоих режимах + время
+    (языки загружены заранее, кэш предложений выключен — меряем сам матчинг).
+    """
+    records = [
+        reviews_core.ReviewRecordInput(
+            review_id=f"r{i}", source="", created_at=date(2024, 1, 1),
+            rating10=None, lang=lang, text=text,
+        )
+        for i, (lang, text) in enumerate(corpus)
+    ]
+    signatures: Dict[str, List[Tuple[Any, ...]]] = {}
+    langs = sorted({rec.lang for rec in records})
+    for name, lexicon in ((CASE_MODE_IGNORECASE, reference), (CASE_MODE_FOLDED, folded)):
+        lexicon.preload(langs)
+        reviews_core.configure_sentence_cache(lexicon, 0)
+        t0 = time.perf_counter()
+        results = reviews_core.analyze_reviews_bulk(records, lexicon, workers=1)
+        report.seconds[name] = time.perf_counter() - t0
+        signatures[name] = [_result_signature(res) for res in results]
+    report.results_total = len(signatures[CASE_MODE_IGNORECASE])
+    for want, got in zip(signatures[CASE_MODE_IGNORECASE], signatures[CASE_MODE_FOLDED]):
+        if want != got:
+            report.results_bad.append(str(want[0]))
+    if len(signatures[CASE_MODE_IGNORECASE]) != len(signatures[CASE_MODE_FOLDED]):
+        report.results_bad.append("<different number of results>")
+
+
+def run_check(
+    corpus: Sequence[Tuple[str, str]],
+    packs_dir: Optional[str] = None,
+    alphabet: bool = True,
+) -> CasefoldReport:
+    report = CasefoldReport()
+    if alphabet:
+        report.alphabet_checked, report.alphabet_bad = check_alphabet()
+    report.control_checked, report.control_bad = check_control_cases()
+    if corpus:
+        check_corpus(
+            corpus,
+            Lexicon(packs_dir=packs_dir, case_mode=CASE_MODE_IGNORECASE),
+            Lexicon(packs_dir=packs_dir, case_mode=CASE_MODE_FOLDED),
+            report,
+        )
+        check_results(
+            corpus,
+            Lexicon(packs_dir=packs_dir, case_mode=CASE_MODE_IGNORECASE),
+            Lexicon(packs_dir=packs_dir, case_mode=CASE_MODE_FOLDED),
+            report,
+        )
+    return report
+
+
+# -----------------------------------------------------------------------------
+# Отчёт / CLI
+# -----------------------------------------------------------------------------
+
+def _format_mismatches(bad: List[Mismatch]) -> List[str]:
+    return [
+        f"    {m.pattern!r} / {m.text[:80]!r}: ignorecase={m.ignorecase} folded={m.folded}"
+        for m in bad[:_SHOW]
+    ]
+
+
+def format_report(report: CasefoldReport) -> str:
+    lines: List[str] = []
+    if report.alphabet_checked:
+        lines.append(f"Алфавит: {report.alphabet_checked} символов, расхождений {len(report.alphabet_bad)}")
+        lines.extend(f"    U+{cp:04X}: {why}" for cp, why in report.alphabet_bad[:_SHOW])
+    lines.append(f"Контрольные случаи: {report.control_checked} проверок, расхождений {len(report.control_bad)}")
+    lines.extend(_format_mismatches(report.control_bad))
+    if report.corpus_reviews:
+        lines.append(
+            f"Паттерны: {report.patterns_total}, оставлены с IGNORECASE: {report.patterns_ignorecase}"
+        )
+        lines.append(
+            f"Корпус: {report.corpus_reviews} отзывов, {report.corpus_checked} проверок паттернов, "
+            f"расхождений {len(report.corpus_bad)}"
+        )
+        lines.extend(_format_mismatches(report.corpus_bad))
+        lines.append(
+            f"Результаты анализа: {report.results_total} отзывов, расхождений {len(report.results_bad)}"
+            + (f" ({', '.join(report.results_bad[:_SHOW])})" if report.results_bad else "")
+        )
+        if report.seconds:
+            base = report.seconds.get(CASE_MODE_IGNORECASE) or 0.0
+            folded = report.seconds.get(CASE_MODE_FOLDED) or 0.0
+            speedup = f", x{base / folded:.2f}" if folded else ""
+            lines.append(f"Время анализа: ignorecase {base:.2f}s, folded {folded:.2f}s{speedup}")
+    lines.append("OK" if report.ok else "РАСХОЖДЕНИЯ")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Сверка режима case_mode=folded с ignorecase")
+    parser.add_argument("--history", action="store_true", help="взять тексты из вкладки reviews_history")
+    parser.add_argument("--reviews", action="append", default=[],
+                        help="XLS/XLSX-файл с отзывами (можно несколько раз)")
+    parser.add_argument("--packs", default=None, help="каталог lexicon_packs (по умолчанию текущий)")
+    parser.add_argument("--limit", type=int, default=0, help="взять только первые N отзывов корпуса")
+    parser.add_argument("--skip-alphabet", action="store_true", help="не проверять весь алфавит Unicode")
+    args = parser.parse_args(argv)
+
+    corpus = corpus_from_xls(args.reviews)
+    if args.history:
+        corpus.extend(corpus_from_history())
+    if args.limit:
+        corpus = corpus[: args.limit]
+    LOG.info("Отзывов в корпусе: %d", len(corpus))
+
+    report = run_check(corpus, packs_dir=args.packs, alphabet=not args.skip_alphabet)
+    print(format_report(report))
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+# agent/lexicon_diff.py
+"""
+Инкрементальный пересчёт истории после правки лексикона.
+
+1. diff_lexicons(old, new) — сравнение двух версий лексикона с точностью
+   до правила и языка: какие корзины тональности, подтемы и аспекты
+   поменялись (паттерны, привязка аспекта к подтемам, порядок правил)
+   и у каких аспектов поменялись только тексты/полярность.
+2. reanalyze_with_diff(records, old, new, cache) — берёт результаты старой
+   версии из кэша результатов (reviews_cache), прогоняет по каждому отзыву
+   только изменившиеся правила (старые и новые паттерны) и:
+     - если ни одно из них не срабатывает — результат не мог измениться,
+       переносим его под новую версию (с подменой текстов аспектов);
+     - иначе — полный анализ отзыва новым лексиконом.
+   Всё сохраняется в кэш под новой версией лексикона, так что следующий
+   weekly-запуск берёт историю из кэша.
+3. migrate_result_cache(records, lexicon, cache) — то же без старых пакетов
+   на руках: прошлая версия пересобирается из снимка в кэше результатов.
+   Так weekly-агент сам переносит историю после правки правил (до prune).
+
+Запуск (старые пакеты — например, из git):
+    git archive HEAD~1 agent/lexicon_packs | tar -x -C /tmp/old
+    python -m agent.lexicon_diff /tmp/old/agent/lexicon_packs --reviews reviews.xls
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import logging
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from . import reviews_io, reviews_core, reviews_cache
+from .lexicon_module import (
+    Lexicon,
+    _compile_regex_list,
+    lexicon_settings_from_env,
+)
+from .reviews_core import ReviewAnalysisResult, ReviewRecordInput
+
+LOG = logging.getLogger("lexicon_diff")
+
+# почему правило попало в diff
+CHANGE_PATTERNS = "patterns"   # поменялись паттерны на части языков
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_MAPPING = "mapping"     # аспект: поменялась привязка к подтемам
+CHANGE_ORDER = "order"         # поменялся порядок правил слоя
+
+
+@dataclass(frozen=True)
+class RuleChange:
+    """
+    Изменение одного правила. langs — языки, на которых правило
+    может сработать иначе (для них сверяем старые и новые паттерны).
+    """
+    layer: str   # "sentiment" / "topic" / "aspect"
+    rule: Any    # ключ корзины / (topic, subtopic) / код аспекта
+    langs: Tuple[str, ...]
+    reason: str
+
+
+@dataclass
+class LexiconDiff:
+    """
+    Разница между двумя версиями лексикона.
+
+    changes:
+        правила, чьё срабатывание могло измениться.
+    aspect_meta:
+        аспекты, у которых поменялись только display_short / long_hint /
+        polarity_hint — такие хиты правим без регексов.
+    """
+    changes: List[RuleChange] = field(default_factory=list)
+    aspect_meta: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not self.changes and not self.aspect_meta
+
+    def rules(self, layer: str) -> List[Any]:
+        return [c.rule for c in self.changes if c.layer == layer]
+
+    def summary(self) -> str:
+        if self.is_empty():
+            return "Лексиконы совпадают по правилам."
+        lines = []
+        for c in self.changes:
+            rule = "/".join(c.rule) if isinstance(c.rule, tuple) else c.rule
+            lines.append(f"{c.layer:<10}{rule:<48}{c.reason:<10}{','.join(c.langs)}")
+        for code in self.aspect_meta:
+            lines.append(f"{'aspect':<10}{code:<48}{'meta':<10}")
+        return "\n".join(lines)
+
+
+# -----------------------------------------------------------------------------
+# Сравнение версий
+# -----------------------------------------------------------------------------
+
+def _aspect_meta(lexicon: Any, aspect_code: str) -> Tuple[Any, ...]:
+    rule = lexicon.aspect_rules.get(aspect_code)
+    if rule is None:
+        return ()
+    return (
+        getattr(rule, "display_short", aspect_code),
+        getattr(rule, "long_hint", ""),
+        rule.polarity_hint,
+    )
+
+
+def diff_lexicons(old: Lexicon, new: Lexicon) -> LexiconDiff:
+    """
+    Правило считается изменённым на языке, если на нём разные списки
+    паттернов (порядок внутри списка на результат не влияет, но сравниваем
+    как есть — перестановка лишь даст лишний пересчёт). Если поменялся
+    порядок правил слоя, весь слой считается изменённым: от порядка
+    зависит порядок хитов в результате.
+    """
+    old_rules = old.rule_patterns()
+    new_rules = new.rule_patterns()
+    diff = LexiconDiff()
+
+    reordered: Set[str] = set()
+    for layer in ("sentiment", "topic", "aspect"):
+        old_order = [key for lyr, key in old_rules if lyr == layer]
+        new_order = [key for lyr, key in new_rules if lyr == layer]
+        common = set(old_order) & set(new_order)
+        if [k for k in old_order if k in common] != [k for k in new_order if k in common]:
+            reordered.add(layer)
+
+    keys = list(new_rules) + [k for k in old_rules if k not in new_rules]
+    for key in keys:
+        layer, rule = key
+        old_by_lang = old_rules.get(key, {})
+        new_by_lang = new_rules.get(key, {})
+        all_langs = tuple(sorted(set(old_by_lang) | set(new_by_lang)))
+
+        if key not in old_rules:
+            reason, langs = CHANGE_ADDED, all_langs
+        elif key not in new_rules:
+            reason, langs = CHANGE_REMOVED, all_langs
+        elif layer in reordered:
+            reason, langs = CHANGE_ORDER, all_langs
+        elif layer == "aspect" and (
+            list(old.aspect_to_subtopics.get(rule, [])) != list(new.aspect_to_subtopics.get(rule, []))
+        ):
+            reason, langs = CHANGE_MAPPING, all_langs
+        else:
+            reason = CHANGE_PATTERNS
+            langs = tuple(l for l in all_langs if old_by_lang.get(l) != new_by_lang.get(l))
+
+        if langs:
+            diff.changes.append(RuleChange(layer=layer, rule=rule, langs=langs, reason=reason))
+        elif layer == "aspect" and _aspect_meta(old, rule) != _aspect_meta(new, rule):
+            diff.aspect_meta.append(rule)
+    return diff
+
+
+# -----------------------------------------------------------------------------
+# Проверка отзыва изменившимися правилами
+# -----------------------------------------------------------------------------
+
+class _DiffScreen:
+    """
+    По языку — слитые регексы изменившихся правил (старые + новые паттерны):
+    отдельно для тональности (проверяется по всему тексту отзыва) и для
+    тем/аспектов (проверяются по предложениям), как в reviews_core.
+    """
+
+    def __init__(self, diff: LexiconDiff, old: Lexicon, new: Lexicon) -> None:
+        old_rules = old.rule_patterns()
+        new_rules = new.rule_patterns()
+        sentiment: Dict[str, List[str]] = {}
+        sentence: Dict[str, List[str]] = {}
+        for c in diff.changes:
+            target = sentiment if c.layer == "sentiment" else sentence
+            key = (c.layer, c.rule)
+            for lang in c.langs:
+                bucket = target.setdefault(lang, [])
+                for rules in (old_rules, new_rules):
+                    bucket.extend(rules.get(key, {}).get(lang) or [])
+        self._sentiment = {lang: self._compile(p) for lang, p in sentiment.items()}
+        self._sentence = {lang: self._compile(p) for lang, p in sentence.items()}
+
+    @staticmethod
+    def _compile(patterns: List[str]) -> List[re.Pattern]:
+        # дубли (старый и новый вариант часто совпадают) выкидываем
+        return _compile_regex_list(dict.fromkeys(patterns), fused=True)
+
+    def touches(self, rec: ReviewRecordInput) -> bool:
+        """
+        Может ли хоть одно изменившееся правило сработать на отзыве.
+        """
+        langs = reviews_core._candidate_langs(rec.lang)
+        sent_pats = [rx for lang in langs for rx in self._sentiment.get(lang, [])]
+        if sent_pats and reviews_core._match_any(sent_pats, reviews_core._normalize_text(rec.text)):
+            return True
+        pats = [rx for lang in langs for rx in self._sentence.get(lang, [])]
+        if not pats:
+            return False
+        return any(reviews_core._match_any(pats, sent) for sent in reviews_core._split_into_sentences(rec.text))
+
+
+def _patch_aspect_meta(res: ReviewAnalysisResult, codes: Set[str], new: Lexicon) -> ReviewAnalysisResult:
+    """
+    Подставить в хиты аспектов codes новые тексты/полярность.
+    """
+    if not codes or not any(a.aspect_code in codes for a in res.aspects):
+        return res
+    aspects = []
+    for a in res.aspects:
+        if a.aspect_code in codes:
+            display_short, long_hint, polarity_hint = _aspect_meta(new, a.aspect_code)
+            a = a.replace(display_short=display_short, long_hint=long_hint, polarity_hint=polarity_hint)
+        aspects.append(a)
+    return dataclasses.replace(res, aspects=aspects)
+
+
+# -----------------------------------------------------------------------------
+# Пересчёт
+# -----------------------------------------------------------------------------
+
+@dataclass
+class ReanalysisStats:
+    total: int = 0
+    reused: int = 0        # результат перенесён без изменений
+    patched: int = 0       # перенесён с подменой текстов аспектов
+    reanalyzed: int = 0    # задет изменившимися правилами — полный анализ
+    missing: int = 0       # не было в кэше под старой версией — полный анализ
+    failed: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"всего {self.total}: перенесено {self.reused}, с правкой текстов {self.patched}, "
+            f"пересчитано {self.reanalyzed}, не было в кэше {self.missing}, ошибок {self.failed}"
+        )
+
+
+def reanalyze_with_diff(
+    records: Sequence[ReviewRecordInput],
+    old: Lexicon,
+    new: Lexicon,
+    cache: Any,
+    diff: Optional[LexiconDiff] = None,
+) -> Tuple[List[ReviewAnalysisResult], ReanalysisStats]:
+    """
+    Результаты для records под лексиконом new с минимумом работы
+    (см. docstring модуля). Свежие результаты пишутся в cache под
+    версией new. Порядок результатов — порядок records (отзывы,
+    упавшие при анализе, пропускаются, как в analyze_reviews_bulk).
+    """
+    diff = diff if diff is not None else diff_lexicons(old, new)
+    stats = ReanalysisStats(total=len(records))
+    screen = _DiffScreen(diff, old, new)
+    meta_codes = set(diff.aspect_meta)
+
+    old_results = cache.lookup(records, old)
+    results: List[ReviewAnalysisResult] = []
+    pairs: List[Tuple[ReviewRecordInput, ReviewAnalysisResult]] = []
+
+    for rec, prev in zip(records, old_results):
+        if prev is not None and not screen.touches(rec):
+            res = _patch_aspect_meta(prev, meta_codes, new)
+            if res is prev:
+                stats.reused += 1
+            else:
+                stats.patched += 1
+        else:
+            try:
+                res = reviews_core.analyze_single_review(rec, new)
+            except Exception:
+                LOG.exception("Ошибка при анализе отзыва %s", rec.review_id)
+                stats.failed += 1
+                continue
+            if prev is None:
+                stats.missing += 1
+            else:
+                stats.reanalyzed += 1
+        results.append(res)
+        pairs.append((rec, res))
+
+    cache.store(pairs, new)
+    return results, stats
+
+
+def migrate_result_cache(
+    records: Sequence[ReviewRecordInput],
+    lexicon: Lexicon,
+    cache: Any,
+) -> Optional[ReanalysisStats]:
+    """
+    Перенос результатов records из последней прошлой версии лексикона
+    в кэше (см. ReviewResultCache.previous_lexicon_packs) под lexicon.
+    Прошлую версию собираем из снимка её пакетов с настройками lexicon;
+    если снимок не загружается (другой формат пакетов) или отпечаток
+    не сошёлся (правила жили не только в пакетах) — не переносим,
+    отзывы просто проанализируются заново.
+    None — переносить было нечего.
+    """
+    if not records:
+        return None
+    try:
+        found = cache.previous_lexicon_packs(lexicon)
+    except ValueError as e:
+        LOG.warning("Снимок прошлой версии лексикона не разбирается — перенос пропущен: %s", e)
+        return None
+    if found is None:
+        return None
+    old_fp, packs = found
+    with tempfile.TemporaryDirectory(prefix="lexicon-packs-") as packs_dir:
+        try:
+            for name, pack in packs.items():
+                with open(os.path.join(packs_dir, f"{name}.json"), "w", encoding="utf-8") as fh:
+                    json.dump(pack, fh, ensure_ascii=False)
+            old = Lexicon(
+                packs_dir=packs_dir,
+                compile_mode=lexicon.compile_mode,
+                engine=lexicon.engine,
+                case_mode=lexicon.case_mode,
+            )
+            old_fp_rebuilt = reviews_cache.result_fingerprint(old)
+        except Exception as e:
+            # например, снимок старого формата пакетов из восстановленного кэша
+            LOG.warning("Снимок прошлой версии лексикона не загружается — перенос пропущен: %s", e)
+            return None
+        if old_fp_rebuilt != old_fp:
+            LOG.warning("Снимок прошлой версии лексикона не воспроизводит её отпечаток — перенос пропущен")
+            return None
+        diff = diff_lexicons(old, lexicon)
+        LOG.info("Перенос кэша результатов на новую версию лексикона:\n%s", diff.summary())
+        # пакеты читаются лениво — анализ старым лексиконом тоже внутри with
+        _, stats = reanalyze_with_diff(records, old, lexicon, cache, diff=diff)
+    return stats
+
+
+# -----------------------------------------------------------------------------
+# CLI
+# -----------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Diff лексиконов и инкрементальный пересчёт кэша результатов")
+    parser.add_argument("old_packs", help="каталог lexicon_packs старой версии")
+    parser.add_argument("--new-packs", default=None, help="каталог lexicon_packs новой версии (по умолчанию текущий)")
+    parser.add_argument("--reviews", action="append", default=[],
+                        help="XLS/XLSX-файл с отзывами (можно несколько раз); без него — только diff")
+    parser.add_argument("--cache", default=None,
+                        help=f"SQLite-файл кэша результатов (по умолчанию из {reviews_cache.RESULT_CACHE_PATH_ENV})")
+    args = parser.parse_args(argv)
+
+    # case_mode входит в версию результатов — настройки те же, что у агентов
+    settings = lexicon_settings_from_env()
+    old = Lexicon(packs_dir=args.old_packs, **settings)
+    new = Lexicon(packs_dir=args.new_packs, **settings)
+
+    diff = diff_lexicons(old, new)
+    print(diff.summary())
+    if not args.reviews or diff.is_empty():
+        return
+
+    records: List[ReviewRecordInput] = []
+    for path in args.reviews:
+        with open(path, "rb") as fh:
+            records.extend(reviews_io.df_to_inputs(reviews_io.read_reviews_xls(fh.read())))
+    LOG.info("Отзывов: %d", len(records))
+
+    cache = (
+        reviews_cache.ReviewResultCache(args.cache) if args.cache
+        else reviews_cache.get_default_result_cache()
+    )
+    if cache is None:
+        parser.error("кэш результатов выключен — пересчитывать нечего")
+
+    t0 = time.perf_counter()
+    _, stats = reanalyze_with_diff(records, old, new, cache, diff=diff)
+    LOG.info("Пересчёт за %.2fs: %s", time.perf_counter() - t0, stats.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# agent/lexicon_profile.py
+"""
+Профиль стоимости правил лексикона и статическая проверка паттернов.
+
+1. Прогоняет отзывы через analyze_reviews_bulk с включённым профилем
+   Lexicon (start_profiling) и собирает по каждому правилу (слой, правило,
+   язык): сколько раз его паттерны реально проверялись, сколько совпали и
+   сколько времени ушло на search(). Сверху отчёта — самые дорогие правила.
+2. Проверяет все паттерны всех языков на риск катастрофического
+   бэктрекинга (lexicon_module.backtracking_risks): вложенные
+   квантификаторы, пересекающиеся альтернативы под повтором, соседние
+   неограниченные повторы.
+
+Общий паттерн из пула засчитывается каждому правилу, где он есть.
+
+Запуск:
+    python -m agent.lexicon_profile path/to/reviews.xls [--limit 2000] [--top 30]
+    python -m agent.lexicon_profile --check-only
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import reviews_io, reviews_core
+from .lexicon_module import Lexicon, backtracking_risks
+
+LOG = logging.getLogger("lexicon_profile")
+
+DEFAULT_TOP = 30
+_PATTERN_WIDTH = 60
+
+
+@dataclass
+class RuleCost:
+    layer: str
+    rule: Any
+    lang: str
+    calls: int = 0
+    hits: int = 0
+    total_ns: int = 0
+    # самый дорогой паттерн правила и его время
+    worst_pattern: str = ""
+    worst_ns: int = 0
+    risks: List[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1e6
+
+    @property
+    def us_per_call(self) -> float:
+        return self.total_ns / self.calls / 1e3 if self.calls else 0.0
+
+
+@dataclass
+class PatternRisk:
+    layer: str
+    rule: Any
+    lang: str
+    pattern: str
+    risks: List[str]
+
+
+def _rule_label(layer: str, rule: Any) -> str:
+    if isinstance(rule, tuple):
+        rule = "/".join(str(part) for part in rule)
+    return f"{layer}:{rule}"
+
+
+def _short(pattern: str, width: int = _PATTERN_WIDTH) -> str:
+    return pattern if len(pattern) <= width else pattern[: width - 1] + "…"
+
+
+def profile_rules(
+    records: Sequence[reviews_core.ReviewRecordInput],
+    lexicon: Optional[Lexicon] = None,
+) -> Tuple[List[RuleCost], float]:
+    """
+    Профиль правил на records: (правила по убыванию времени search(),
+    время прогона analyze_reviews_bulk в секундах). Анализ — в одном
+    процессе поштучным бэкендом, без кэша результатов: иначе search()
+    не попадёт в профиль.
+    """
+    lexicon = lexicon or Lexicon()
+    lexicon.start_profiling()
+    t0 = time.perf_counter()
+    try:
+        reviews_core.analyze_reviews_bulk(
+            list(records), lexicon, workers=1, backend=reviews_core.BACKEND_PYTHON,
+        )
+    finally:
+        profiler = lexicon.stop_profiling()
+    elapsed = time.perf_counter() - t0
+
+    owners = lexicon.pattern_owners()
+    by_rule: Dict[Tuple[str, Any, str], RuleCost] = {}
+    for rx, calls, hits, ns in profiler.items():
+        for layer, rule, lang in owners.get(id(rx), [("?", rx.pattern, "?")]):
+            cost = by_rule.get((layer, rule, lang))
+            if cost is None:
+                cost = by_rule[(layer, rule, lang)] = RuleCost(layer=layer, rule=rule, lang=lang)
+            cost.calls += calls
+            cost.hits += hits
+            cost.total_ns += ns
+            if ns > cost.worst_ns:
+                cost.worst_ns = ns
+                cost.worst_pattern = rx.pattern
+    costs = sorted(by_rule.values(), key=lambda c: c.total_ns, reverse=True)
+    for cost in costs:
+        cost.risks = backtracking_risks(cost.worst_pattern) if cost.worst_pattern else []
+    LOG.info(
+        "Профиль: %d отзывов за %.2fs, search() %.2fs, правил с проверками %d",
+        len(records), elapsed, profiler.total_ns() / 1e9, len(costs),
+    )
+    return costs, elapsed
+
+
+def check_patterns(lexicon: Optional[Lexicon] = None) -> List[PatternRisk]:
+    """
+    Все исходные паттерны всех языков с риском бэктрекинга
+    (без компиляции языков; см. Lexicon.rule_patterns).
+    """
+    lexicon = lexicon or Lexicon()
+    found: List[PatternRisk] = []
+    for (layer, rule), by_lang in lexicon.rule_patterns().items():
+        for lang, patterns in by_lang.items():
+            for pattern in patterns:
+                risks = backtracking_risks(pattern)
+                if risks:
+                    found.append(PatternRisk(layer=layer, rule=rule, lang=lang, pattern=pattern, risks=risks))
+    return found
+
+
+def format_costs(costs: List[RuleCost], top: int = DEFAULT_TOP) -> str:
+    total_ns = sum(c.total_ns for c in costs) or 1
+    lines = [
+        f"{'rule':<44}{'lang':>6}{'calls':>10}{'hits':>8}{'ms':>10}{'share':>8}{'us/call':>9}  worst pattern",
+    ]
+    for c in costs[:top]:
+        risk = f"  [{', '.join(c.risks)}]" if c.risks else ""
+        lines.append(
+            f"{_short(_rule_label(c.layer, c.rule), 43):<44}{c.lang:>6}{c.calls:>10d}{c.hits:>8d}"
+            f"{c.total_ms:>10.1f}{c.total_ns / total_ns:>8.1%}{c.us_per_call:>9.1f}"
+            f"  {_short(c.worst_pattern)}{risk}"
+        )
+    return "\n".join(lines)
+
+
+def format_risks(risks: List[PatternRisk]) -> str:
+    if not risks:
+        return "Паттернов с риском бэктрекинга не найдено"
+    lines = [f"Паттерны с риском бэктрекинга: {len(risks)}"]
+    for r in risks:
+        lines.append(f"  {_rule_label(r.layer, r.rule)} [{r.lang}] {', '.join(r.risks)}: {r.pattern}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Профиль стоимости правил лексикона")
+    parser.add_argument("path", nargs="?", help="XLS/XLSX-файл с отзывами (формат как у выгрузки на Drive)")
+    parser.add_argument("--limit", type=int, default=0, help="взять только первые N отзывов")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="сколько самых дорогих правил показать")
+    parser.add_argument("--check-only", action="store_true", help="только статическая проверка паттернов")
+    args = parser.parse_args(argv)
+    if not args.check_only and not args.path:
+        parser.error("нужен файл с отзывами (или --check-only)")
+
+    lexicon = Lexicon()
+    print(format_risks(check_patterns(lexicon)))
+    if args.check_only:
+        return
+
+    with open(args.path, "rb") as fh:
+        df_raw = reviews_io.read_reviews_xls(fh.read())
+    records = reviews_io.df_to_inputs(df_raw)
+    if args.limit > 0:
+        records = records[: args.limit]
+    LOG.info("Отзывов для профиля: %d", len(records))
+
+    costs, _elapsed = profile_rules(records, lexicon)
+    print()
+    print(format_costs(costs, args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ from datetime import date, datetime, timedelta
 import pandas as pd
 
 # --- наши модули (пакетные импорты) ---
-from . import reviews_io, reviews_core
+from . import reviews_io, reviews_core, reviews_cache
 from .metrics_core import iso_week_monday, period_ranges_for_week
 from .connectors import build_credentials_from_b64, get_drive_client, get_sheets_client
 
@@ -39,6 +39,14 @@ DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
 HISTORY_SHEET_NAME = "reviews_history"  # отдельная вкладка в общем SHEETS_HISTORY_ID
+# порядок колонок reviews_history (review_key — 11-я колонка, K)
+HISTORY_COLUMNS = [
+    "date", "iso_week", "source", "lang", "rating10",
+    "sentiment_score", "sentiment_overall",
+    "aspects", "topics", "has_response",
+    "review_key", "text_trimmed", "ingested_at",
+    "degraded",
+]
 
 # Поддерживаемые паттерны имён файлов (даты в именах)
 _RE_FNAME_DMY = re.compile(r"(?i)\breviews?_?(\d{2})-(\d{2})-(\d{4})\b")
@@ -116,6 +124,29 @@ def _ensure_sheet_exists(sheets, spreadsheet_id: str, title: str) -> None:
     body = {"requests": [{"addSheet": {"properties": {"title": title}}}]}
     sheets.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
 
+def _ensure_history_degraded_column(sheets, spreadsheet_id: str) -> None:
+    """
+    Листы reviews_history, заведённые до колонки degraded, получают её
+    заголовок последней колонкой (строки пишутся в порядке HISTORY_COLUMNS).
+    Пустой лист не трогаем — заголовок пишется вместе с первыми строками.
+    """
+    resp = sheets.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=f"'{HISTORY_SHEET_NAME}'!1:1"
+    ).execute()
+    header = (resp.get("values") or [[]])[0]
+    if not header or "degraded" in header:
+        return
+    if header != HISTORY_COLUMNS[:-1]:
+        LOG.warning("Неожиданный заголовок %s: колонку degraded не добавляем", HISTORY_SHEET_NAME)
+        return
+    cell = chr(ord("A") + len(header))
+    sheets.spreadsheets().values().update(
+        spreadsheetId=spreadsheet_id,
+        range=f"'{HISTORY_SHEET_NAME}'!{cell}1",
+        valueInputOption="RAW",
+        body={"values": [["degraded"]]},
+    ).execute()
+
 def _read_sheet_as_df(sheets, spreadsheet_id: str, title: str) -> pd.DataFrame:
     try:
         resp = sheets.spreadsheets().values().get(
@@ -248,6 +279,7 @@ def _upsert_reviews_history_week(
             review_key,
             text_trimmed,
             now,
+            str(row.get("degraded") or ""),
         ]
         to_append.append(vals)
         existing_keys.add(review_key)  # пополняем набор, чтобы не словить дубликат в этом же запуске
@@ -309,6 +341,7 @@ def _upsert_reviews_history_bulk(
             review_key,
             text_trimmed,
             now,
+            str(row.get("degraded") or ""),
         ]
         to_append.append(vals)
         existing_keys.add(review_key)
@@ -453,16 +486,24 @@ def main() -> None:
         return
 
     # --- Анализ через лексикон ---
-    from .lexicon_module import Lexicon
-    lexicon = Lexicon()
-
-    analyzed = reviews_core.analyze_reviews_bulk(all_inputs, lexicon)
-    LOG.info(f"Анализировано записей: {len(analyzed)}")
-    if not analyzed:
+    from .lexicon_module import get_default_lexicon
+    lexicon = get_default_lexicon()
+
+    # пачками: результаты анализа сразу сворачиваются в DataFrame и не копятся
+    # (backfill многолетнего файла — десятки тысяч отзывов)
+    builder = reviews_core.AnalysisFramesBuilder(aspects=False)
+    slow_log = reviews_core.slow_log_from_env()
+    for batch in reviews_core.iter_analyze_reviews(
+        all_inputs, lexicon, cache=reviews_cache.get_default_result_cache(), slow_log=slow_log,
+    ):
+        builder.add(batch)
+    slow_summary = reviews_core.publish_slow_log(slow_log)
+    LOG.info(f"Анализировано записей: {builder.rows_reviews}")
+    if not builder.rows_reviews:
         LOG.warning("После анализа записей нет (analyzed=0).")
         return
 
-    df_reviews = reviews_core.build_reviews_dataframe(analyzed)
+    df_reviews = builder.reviews_frame()
     df_raw_map = (
         pd.DataFrame(raw_has_response_pairs, columns=["review_id", "has_response"])
         .drop_duplicates("review_id")
@@ -488,6 +529,7 @@ def main() -> None:
     else:
         # 1) гарантируем, что лист существует (один read-запрос)
         _ensure_sheet_exists(sheets, sheets_id, HISTORY_SHEET_NAME)
+        _ensure_history_degraded_column(sheets, sheets_id)
 
         # 2) читаем все уже существующие review_key (один read-запрос)
         existing_keys = _read_existing_review_keys_all(
@@ -516,7 +558,10 @@ def main() -> None:
                 fh.write(f"- Файлов к обработке: {len(selected)}\n")
                 fh.write(f"- Входных записей (inputs): {len(all_inputs)}\n")
                 fh.write(f"- DRY_RUN: {'true' if dry_run else 'false'}\n")
-                fh.write(f"- Новых строк добавлено: {total_appended}\n\n")
+                fh.write(f"- Новых строк добавлено: {total_appended}\n")
+                fh.write(reviews_core.format_budget_summary() + "\n")
+                if slow_summary:
+                    fh.write(slow_summary + "\n")
         except Exception as e:
             LOG.debug("Не удалось записать summary для backfill: %s", e)
 
@@ -0,0 +1,335 @@
+# agent/reviews_cache.py
+"""
+Персистентный кэш результатов анализа отзывов (SQLite).
+
+Ключ — (review_id, версия лексикона). Версия = отпечаток правил
+лексикона (Lexicon.rules_fingerprint: без версии Python, compile_mode и
+движка — от них результат не зависит) + RESULT_CACHE_VERSION (поднимаем
+при изменении логики reviews_core, влияющей на результат). Вместе с
+результатом храним дайджест входа (текст, язык, дата, оценка, источник):
+если отзыв с тем же review_id пришёл с другим содержимым — это промах.
+
+Еженедельный отчёт пересчитывает аспекты по всей истории; с кэшем
+это поиск по ключу, а регексы гоняются только для новых отзывов и
+после правки лексикона.
+
+Для каждой версии, под которой что-то сохранено, храним и снимок пакетов
+лексикона (Lexicon.packs_snapshot): после правки правил weekly-агент
+пересобирает по нему прошлую версию и переносит результаты через
+lexicon_diff.migrate_result_cache, а уже потом чистит прежние версии.
+
+Использование:
+    cache = reviews_cache.get_default_result_cache()
+    analyzed = reviews_core.analyze_reviews_bulk(records, lexicon, cache=cache)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .reviews_core import ReviewAnalysisResult, ReviewRecordInput, _aspect_hits
+
+LOG = logging.getLogger("reviews_cache")
+
+# Поднимать при любом изменении reviews_core, которое меняет результат
+# анализа при том же лексиконе, или при смене формата payload.
+RESULT_CACHE_VERSION = 1
+
+RESULT_CACHE_PATH_ENV = "REVIEWS_RESULT_CACHE"
+RESULT_CACHE_DEFAULT_PATH = os.path.join("~", ".cache", "reviews_analysis", "results", "reviews.sqlite")
+
+# лимит параметров в одном запросе SQLite (SQLITE_MAX_VARIABLE_NUMBER в старых сборках — 999)
+_SQL_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_results (
+    review_id    TEXT NOT NULL,
+    lexicon_fp   TEXT NOT NULL,
+    input_digest TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    PRIMARY KEY (review_id, lexicon_fp)
+) WITHOUT ROWID
+"""
+
+_VERSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lexicon_versions (
+    lexicon_fp TEXT PRIMARY KEY,
+    packs      TEXT NOT NULL,
+    stored_at  REAL NOT NULL
+)
+"""
+
+
+# -----------------------------------------------------------------------------
+# Ключи и сериализация
+# -----------------------------------------------------------------------------
+
+def result_fingerprint(lexicon: Any) -> Optional[str]:
+    """
+    Версия результата для лексикона. None — у лексикона нет rules_fingerprint
+    (реализует только LexiconProtocol), такие результаты не кэшируем.
+    """
+    fingerprint = getattr(lexicon, "rules_fingerprint", None)
+    if not fingerprint:
+        return None
+    return f"v{RESULT_CACHE_VERSION}:{fingerprint}"
+
+
+def input_digest(rec: ReviewRecordInput) -> str:
+    """
+    Дайджест всего, из чего складывается результат анализа отзыва.
+    """
+    created = rec.created_at.isoformat() if isinstance(rec.created_at, date) else str(rec.created_at)
+    blob = json.dumps(
+        [rec.source, created, rec.rating10, rec.lang, rec.text],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def _result_to_payload(res: ReviewAnalysisResult) -> str:
+    """
+    Храним только вычисленное анализом: source/rating10/lang/raw_text
+    совпадают со входом (это гарантирует дайджест) и берутся из него.
+    """
+    return json.dumps({
+        "created_at": res.created_at.isoformat(),
+        "week_key": res.week_key,
+        "sentiment_overall": res.sentiment_overall,
+        "sentiment_detail": res.sentiment_detail,
+        "sentiment_score": res.sentiment_score,
+        "topic_hits": [list(pair) for pair in res.topic_hits],
+        "aspects": [
+            [a.aspect_code, a.topic_key, a.subtopic_key, a.display_short, a.long_hint, a.polarity_hint]
+            for a in res.aspects
+        ],
+    }, ensure_ascii=False)
+
+
+def _result_from_payload(rec: ReviewRecordInput, payload: str) -> ReviewAnalysisResult:
+    data = json.loads(payload)
+    created_at = date.fromisoformat(data["created_at"])
+    base_meta = {
+        "review_id": rec.review_id,
+        "created_at": created_at,
+        "week_key": data["week_key"],
+        "source": rec.source,
+        "rating10": rec.rating10,
+        "sentiment_overall": data["sentiment_overall"],
+        "lang": rec.lang,
+    }
+    return ReviewAnalysisResult(
+        review_id=rec.review_id,
+        source=rec.source,
+        created_at=created_at,
+        week_key=data["week_key"],
+        rating10=rec.rating10,
+        lang=rec.lang,
+        sentiment_overall=data["sentiment_overall"],
+        sentiment_detail=data["sentiment_detail"],
+        sentiment_score=data["sentiment_score"],
+        topic_hits={tuple(pair) for pair in data["topic_hits"]},
+        aspects=_aspect_hits((tuple(a) for a in data["aspects"]), base_meta),
+        raw_text=rec.text,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Кэш
+# -----------------------------------------------------------------------------
+
+class ReviewResultCache:
+    """
+    SQLite-файл с результатами анализа. Методы lookup/store вызывает
+    reviews_core.analyze_reviews_bulk(..., cache=...).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(_VERSIONS_SCHEMA)
+        # версии, снимок которых этот процесс уже записал
+        self._remembered: set = set()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ReviewResultCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def lookup(
+        self,
+        records: Sequence[ReviewRecordInput],
+        lexicon: Any,
+    ) -> List[Optional[ReviewAnalysisResult]]:
+        """
+        Результаты из кэша в порядке records; None — промах
+        (нет записи или вход изменился).
+        """
+        out: List[Optional[ReviewAnalysisResult]] = [None] * len(records)
+        fp = result_fingerprint(lexicon)
+        if fp is None or not records:
+            return out
+
+        ids = list({rec.review_id for rec in records})
+        rows: Dict[str, Tuple[str, str]] = {}
+        with self._lock:
+            for i in range(0, len(ids), _SQL_CHUNK):
+                chunk = ids[i:i + _SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                cur = self._conn.execute(
+                    f"SELECT review_id, input_digest, payload FROM review_results "
+                    f"WHERE lexicon_fp = ? AND review_id IN ({marks})",
+                    [fp, *chunk],
+                )
+                for review_id, digest, payload in cur:
+                    rows[review_id] = (digest, payload)
+
+        for idx, rec in enumerate(records):
+            row = rows.get(rec.review_id)
+            if row is None or row[0] != input_digest(rec):
+                self.misses += 1
+                continue
+            try:
+                out[idx] = _result_from_payload(rec, row[1])
+                self.hits += 1
+            except Exception:
+                LOG.warning("Битая запись кэша для %s — пересчитаем", rec.review_id, exc_info=True)
+                self.misses += 1
+        return out
+
+    def store(
+        self,
+        pairs: Iterable[Tuple[ReviewRecordInput, ReviewAnalysisResult]],
+        lexicon: Any,
+    ) -> int:
+        """
+        Сохранить результаты (вход, результат). Возвращает число записей.
+        Урезанные бюджетом результаты (res.degraded) не сохраняем: при
+        другом бюджете или нагрузке отзыв разберётся иначе.
+        """
+        fp = result_fingerprint(lexicon)
+        if fp is None:
+            return 0
+        rows = [
+            (rec.review_id, fp, input_digest(rec), _result_to_payload(res))
+            for rec, res in pairs
+            if not getattr(res, "degraded", "")
+        ]
+        if not rows:
+            return 0
+        self._remember_lexicon(fp, lexicon)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO review_results "
+                "(review_id, lexicon_fp, input_digest, payload) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def _remember_lexicon(self, fp: str, lexicon: Any) -> None:
+        """
+        Снимок пакетов версии fp (раз на процесс; stored_at — когда версию
+        последний раз писали). Лексикон без снимка просто не попадёт
+        в previous_lexicon_packs.
+        """
+        if fp in self._remembered:
+            return
+        self._remembered.add(fp)
+        snapshot = getattr(lexicon, "packs_snapshot", lambda: None)()
+        if snapshot is None:
+            return
+        packs = json.dumps(snapshot, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lexicon_versions (lexicon_fp, packs, stored_at) VALUES (?, ?, ?)",
+                (fp, packs, time.time()),
+            )
+
+    def previous_lexicon_packs(self, lexicon: Any) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        (версия, снимок пакетов) последней другой версии лексикона, под
+        которой в кэше ещё есть результаты; None — переносить нечего.
+        """
+        fp = result_fingerprint(lexicon)
+        if fp is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT v.lexicon_fp, v.packs FROM lexicon_versions v "
+                "WHERE v.lexicon_fp != ? AND EXISTS "
+                "(SELECT 1 FROM review_results r WHERE r.lexicon_fp = v.lexicon_fp) "
+                "ORDER BY v.stored_at DESC LIMIT 1",
+                (fp,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def prune(self, lexicon: Any) -> int:
+        """
+        Удалить результаты (и снимки) всех прочих версий лексикона. Вызывать
+        после lexicon_diff.migrate_result_cache — иначе результаты прошлой
+        версии пропадут до переноса. Возвращает число удалённых строк.
+        """
+        fp = result_fingerprint(lexicon)
+        if fp is None:
+            return 0
+        with self._lock, self._conn:
+            cur = self._conn.execute("DELETE FROM review_results WHERE lexicon_fp != ?", (fp,))
+            self._conn.execute("DELETE FROM lexicon_versions WHERE lexicon_fp != ?", (fp,))
+        return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# -----------------------------------------------------------------------------
+# Общий экземпляр на процесс
+# -----------------------------------------------------------------------------
+
+_DEFAULT_CACHE: Optional[ReviewResultCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_default_result_cache() -> Optional[ReviewResultCache]:
+    """
+    Кэш по пути из REVIEWS_RESULT_CACHE (по умолчанию
+    ~/.cache/reviews_analysis/results/reviews.sqlite; "off" — без кэша).
+    Если файл открыть не удалось — работаем без кэша (None).
+    """
+    global _DEFAULT_CACHE
+    path = (os.environ.get(RESULT_CACHE_PATH_ENV) or RESULT_CACHE_DEFAULT_PATH).strip()
+    if path.lower() == "off":
+        return None
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            try:
+                _DEFAULT_CACHE = ReviewResultCache(path)
+            except (OSError, sqlite3.Error) as e:
+                LOG.warning("Кэш результатов недоступен (%s): %s", path, e)
+                return None
+        return _DEFAULT_CACHE
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import (
@@ -8,19 +12,45 @@ from typing import (
     Tuple,
     Any,
     Iterable,
+    Iterator,
     Optional,
     Set,
     Protocol,
 )
+import heapq
+import json
+import os
 import re
 import logging
+import multiprocessing
+import sys
+import threading
+import time
+import traceback
+import warnings
+import weakref
+import numpy as np
 import pandas as pd
 
 LOG = logging.getLogger("reviews_core")
 
 # --- пакетные импорты внутри agent ---
 from .metrics_core import iso_week_monday, period_ranges_for_week
-from .lexicon_module import AspectRule
+from .lexicon_module import (
+    AspectRule,
+    CASE_MODE_FOLDED,
+    SENTIMENT_BUCKETS as _SENTIMENT_BUCKETS,
+    STOP_SENTENCES,
+    STOP_TIME,
+    _EMAIL_RE,
+    _URL_RE,
+    _WS_RE,
+    _SENTENCE_SPLIT_RE,
+    _candidate_langs,
+    _match_any,
+    normalize_text as _normalize_text,
+    split_sentences as _split_into_sentences,
+)
 
 
 # -----------------------------------------------------------------------------
@@ -95,29 +125,317 @@ class ReviewRecordInput:
     text: str
 
 
-@dataclass(frozen=True)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _str_column(values: Any, default: str) -> List[str]:
+    """
+    Колонка -> список str; пустые значения (None / NaN / "") -> default.
+    """
+    s = pd.Series(values, dtype=object).fillna(default).astype(str)
+    return s.mask(s.eq(""), default).tolist()
+
+
+class ReviewBatch:
+    """
+    Колоночная пачка входных отзывов: выровненные массивы review_ids,
+    sources, texts, langs (списки str), date_ordinals (int64, date.toordinal)
+    и ratings (float64, NaN — нет оценки). Собирается из нормализованного
+    DataFrame без построчной работы (from_frame).
+
+    Это Sequence[ReviewRecordInput]: len / итерация / batch[i] отдают
+    ReviewRecordInput, создаваемые по требованию, batch[i:j] и take() —
+    снова ReviewBatch. Поэтому её принимают все входы анализа
+    (analyze_reviews_bulk, iter_analyze_reviews, кэш результатов,
+    lexicon_diff) наравне со списком.
+    """
+
+    __slots__ = ("review_ids", "sources", "texts", "langs", "date_ordinals", "ratings")
+
+    def __init__(
+        self,
+        review_ids: List[str],
+        sources: List[str],
+        date_ordinals: np.ndarray,
+        ratings: np.ndarray,
+        langs: List[str],
+        texts: List[str],
+    ) -> None:
+        n = len(review_ids)
+        if not (len(sources) == len(date_ordinals) == len(ratings) == len(langs) == len(texts) == n):
+            raise ValueError("ReviewBatch columns must have the same length")
+        self.review_ids = review_ids
+        self.sources = sources
+        self.date_ordinals = np.asarray(date_ordinals, dtype=np.int64)
+        self.ratings = np.asarray(ratings, dtype=np.float64)
+        self.langs = langs
+        self.texts = texts
+
+    @classmethod
+    def from_records(cls, records: Iterable[ReviewRecordInput]) -> "ReviewBatch":
+        records = list(records)
+        return cls(
+            review_ids=[r.review_id for r in records],
+            sources=[r.source for r in records],
+            date_ordinals=np.fromiter(
+                (_safe_to_date(r.created_at).toordinal() for r in records), dtype=np.int64, count=len(records),
+            ),
+            ratings=np.fromiter(
+                (np.nan if r.rating10 is None else float(r.rating10) for r in records),
+                dtype=np.float64, count=len(records),
+            ),
+            langs=[r.lang for r in records],
+            texts=[r.text for r in records],
+        )
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        id_col: str = "review_id",
+        date_col: str = "created_at",
+        text_col: str = "text",
+        default_lang: str = "other",
+    ) -> "ReviewBatch":
+        """
+        Из DataFrame с колонками id_col, source, date_col, rating10, lang,
+        text_col. Строки без даты (или с нераспознаваемой датой)
+        пропускаются, как в reviews_io.df_to_inputs.
+        """
+        if df is None or len(df) == 0:
+            return cls.empty()
+        dates = pd.to_datetime(pd.Series(df[date_col].to_numpy(dtype=object)), errors="coerce")
+        keep = dates.notna().to_numpy()
+        if not keep.all():
+            df = df.loc[keep]
+            dates = dates[keep]
+        ordinals = dates.to_numpy(dtype="datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+
+        def column(name: str) -> Any:
+            return df[name].to_numpy(dtype=object) if name in df.columns else [None] * len(df)
+
+        ratings = (
+            pd.to_numeric(df["rating10"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            if "rating10" in df.columns else np.full(len(df), np.nan)
+        )
+        return cls(
+            review_ids=_str_column(column(id_col), ""),
+            sources=_str_column(column("source"), ""),
+            date_ordinals=ordinals,
+            ratings=ratings,
+            langs=_str_column(column("lang"), default_lang),
+            texts=_str_column(column(text_col), ""),
+        )
+
+    @classmethod
+    def empty(cls) -> "ReviewBatch":
+        return cls([], [], np.empty(0, dtype=np.int64), np.empty(0), [], [])
+
+    def __len__(self) -> int:
+        return len(self.review_ids)
+
+    def _record(self, i: int) -> ReviewRecordInput:
+        rating = self.ratings[i]
+        return ReviewRecordInput(
+            review_id=self.review_ids[i],
+            source=self.sources[i],
+            created_at=date.fromordinal(int(self.date_ordinals[i])),
+            rating10=None if rating != rating else float(rating),
+            lang=self.langs[i],
+            text=self.texts[i],
+        )
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return ReviewBatch(
+                self.review_ids[key], self.sources[key], self.date_ordinals[key],
+                self.ratings[key], self.langs[key], self.texts[key],
+            )
+        n = len(self)
+        i = key + n if key < 0 else key
+        if not 0 <= i < n:
+            raise IndexError("ReviewBatch index out of range")
+        return self._record(i)
+
+    def __iter__(self) -> Iterator[ReviewRecordInput]:
+        for i in range(len(self)):
+            yield self._record(i)
+
+    def take(self, indices: Iterable[int]) -> "ReviewBatch":
+        idx = np.fromiter(indices, dtype=np.intp)
+        return ReviewBatch(
+            [self.review_ids[i] for i in idx],
+            [self.sources[i] for i in idx],
+            self.date_ordinals[idx],
+            self.ratings[idx],
+            [self.langs[i] for i in idx],
+            [self.texts[i] for i in idx],
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable["ReviewBatch"]) -> "ReviewBatch":
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return cls.empty()
+        return cls(
+            [x for b in batches for x in b.review_ids],
+            [x for b in batches for x in b.sources],
+            np.concatenate([b.date_ordinals for b in batches]),
+            np.concatenate([b.ratings for b in batches]),
+            [x for b in batches for x in b.langs],
+            [x for b in batches for x in b.texts],
+        )
+
+    def records(self) -> List[ReviewRecordInput]:
+        return list(self)
+
+
+_ASPECT_HIT_FIELDS = (
+    "review_id", "aspect_code", "topic_key", "subtopic_key",
+    "display_short", "long_hint", "polarity_hint",
+    "created_at", "week_key", "source", "rating10", "sentiment_overall", "lang",
+)
+
+# (aspect_code, topic_key, subtopic_key, display_short, long_hint, polarity_hint)
+# -> тот же кортеж: одинаковые совпадения из разных отзывов хранятся один раз.
+# Различных совпадений немного (аспекты x подтемы), пул не разрастается.
+_MATCH_POOL: Dict[Tuple[str, str, str, str, str, str], Tuple[str, str, str, str, str, str]] = {}
+
+
+def _intern_str(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class _HitMeta:
+    """
+    Метаданные отзыва, общие для всех его AspectHit (одна копия на отзыв).
+    """
+
+    __slots__ = ("review_id", "created_at", "week_key", "source", "rating10", "sentiment_overall", "lang")
+
+    def __init__(
+        self,
+        review_id: str,
+        created_at: date,
+        week_key: str,
+        source: str,
+        rating10: Optional[float],
+        sentiment_overall: str,
+        lang: str,
+    ) -> None:
+        self.review_id = review_id
+        self.created_at = created_at
+        self.week_key = _intern_str(week_key)
+        self.source = _intern_str(source)
+        self.rating10 = rating10
+        self.sentiment_overall = _intern_str(sentiment_overall)
+        self.lang = _intern_str(lang)
+
+    @classmethod
+    def from_dict(cls, meta: Dict[str, Any]) -> "_HitMeta":
+        return cls(
+            review_id=meta["review_id"],
+            created_at=meta["created_at"],
+            week_key=meta["week_key"],
+            source=meta["source"],
+            rating10=meta["rating10"],
+            sentiment_overall=meta["sentiment_overall"],
+            lang=meta["lang"],
+        )
+
+
 class AspectHit:
     """
     Один зафиксированный аспект внутри отзыва.
     Мы сразу связываем его с (topic, subtopic), чтобы в отчёте можно было сказать:
     'Аспект X относится к теме Y / подтеме Z'.
-    """
-    review_id: str
-    aspect_code: str
-    topic_key: str
-    subtopic_key: str
-    display_short: str
-    long_hint: str
-    polarity_hint: str  # "positive"/"negative"/"neutral"
-    created_at: date
-    week_key: str
-    source: str
-    rating10: Optional[float]
-    sentiment_overall: str
-    lang: str
 
+    Поля те же, что были у frozen-датакласса (review_id, aspect_code, topic_key,
+    subtopic_key, display_short, long_hint, polarity_hint, created_at, week_key,
+    source, rating10, sentiment_overall, lang), но хранятся компактно: хит — две
+    ссылки, на метаданные отзыва (_HitMeta, общие для всех хитов отзыва) и на
+    кортеж совпадения из _MATCH_POOL (общий для всех одинаковых хитов).
+    Тексты аспекта — те же объекты строк, что в правилах лексикона.
+    """
 
-@dataclass
+    __slots__ = ("_meta", "_match")
+
+    def __init__(
+        self,
+        review_id: str,
+        aspect_code: str,
+        topic_key: str,
+        subtopic_key: str,
+        display_short: str,
+        long_hint: str,
+        polarity_hint: str,  # "positive"/"negative"/"neutral"
+        created_at: date,
+        week_key: str,
+        source: str,
+        rating10: Optional[float],
+        sentiment_overall: str,
+        lang: str,
+    ) -> None:
+        meta = _HitMeta(review_id, created_at, week_key, source, rating10, sentiment_overall, lang)
+        match = (aspect_code, topic_key, subtopic_key, display_short, long_hint, polarity_hint)
+        object.__setattr__(self, "_meta", meta)
+        object.__setattr__(self, "_match", _MATCH_POOL.setdefault(match, match))
+
+    @classmethod
+    def _from_parts(cls, meta: _HitMeta, match: Tuple[str, str, str, str, str, str]) -> "AspectHit":
+        hit = cls.__new__(cls)
+        object.__setattr__(hit, "_meta", meta)
+        object.__setattr__(hit, "_match", _MATCH_POOL.setdefault(match, match))
+        return hit
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"AspectHit is immutable, cannot set {name!r}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (AspectHit, self._astuple())
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in _ASPECT_HIT_FIELDS)
+
+    def replace(self, **changes: Any) -> "AspectHit":
+        """
+        Копия с изменёнными полями (аналог dataclasses.replace).
+        """
+        values = dict(zip(_ASPECT_HIT_FIELDS, self._astuple()))
+        values.update(changes)
+        return AspectHit(**values)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        fields_repr = ", ".join(f"{name}={getattr(self, name)!r}" for name in _ASPECT_HIT_FIELDS)
+        return f"AspectHit({fields_repr})"
+
+    # --- поля совпадения ---
+    aspect_code = property(lambda self: self._match[0])
+    topic_key = property(lambda self: self._match[1])
+    subtopic_key = property(lambda self: self._match[2])
+    display_short = property(lambda self: self._match[3])
+    long_hint = property(lambda self: self._match[4])
+    polarity_hint = property(lambda self: self._match[5])
+
+    # --- метаданные отзыва ---
+    review_id = property(lambda self: self._meta.review_id)
+    created_at = property(lambda self: self._meta.created_at)
+    week_key = property(lambda self: self._meta.week_key)
+    source = property(lambda self: self._meta.source)
+    rating10 = property(lambda self: self._meta.rating10)
+    sentiment_overall = property(lambda self: self._meta.sentiment_overall)
+    lang = property(lambda self: self._meta.lang)
+
+
+@dataclass(slots=True)
 class ReviewAnalysisResult:
     """
     То, что мы получаем после классификации одного отзыва.
@@ -144,6 +462,11 @@ class ReviewAnalysisResult:
             "neutral": bool
         }
         пригодится, если надо будет потом делать более тонкую агрегацию.
+
+    degraded:
+        "" — отзыв разобран целиком; иначе сработал бюджет на отзыв
+        (ReviewBudget) и анализ урезан: причины через запятую
+        ("chars" / "sentences" / "time").
     """
     review_id: str
     source: str
@@ -160,39 +483,15 @@ class ReviewAnalysisResult:
     aspects: List[AspectHit] = field(default_factory=list)
 
     raw_text: str = ""
+    degraded: str = ""
 
 
 # -----------------------------------------------------------------------------
 # 2. Утилиты
 # -----------------------------------------------------------------------------
 
-_SENTENCE_SPLIT_RE = re.compile(r"[.!?…]+|\n+")
-
-_URL_RE = re.compile(r"https?://\S+|www\.\S+", re.IGNORECASE)
-_EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
-
-def _normalize_text(text: str) -> str:
-    """
-    Мягкая нормализация: убираем URL/Email, схлопываем пробелы.
-    Ничего принципиального не выкидываем, чтобы не ломать матчи.
-    """
-    if not text:
-        return ""
-    s = _URL_RE.sub(" ", text)
-    s = _EMAIL_RE.sub(" ", s)
-    s = re.sub(r"\s+", " ", s, flags=re.UNICODE).strip()
-    return s
-
-def _split_into_sentences(text: str) -> List[str]:
-    """
-    Очень простой сплиттер на "предложения" / смысловые фрагменты.
-    Нормализуем мягко и режем по знакам конца фразы / переводу строки.
-    """
-    if not text:
-        return []
-    text = _normalize_text(text)
-    parts = _SENTENCE_SPLIT_RE.split(text)
-    return [p.strip() for p in parts if p and p.strip()]
+# нормализация текста и нарезка на предложения — в lexicon_module
+# (normalize_text / split_sentences), общие с Lexicon.analyze_text
 
 def _safe_to_date(d: Any) -> date:
     """
@@ -222,28 +521,6 @@ def _week_key_for_date(d: date) -> str:
     return f"{iso_year}-W{iso_week:02d}"
 
 
-def _match_any(patterns: List[re.Pattern], s: str) -> bool:
-    for rx in patterns:
-        if rx.search(s):
-            return True
-    return False
-
-def _candidate_langs(lang: str) -> List[str]:
-    """
-    "ru-RU" -> ["ru-ru", "ru", "en"]; пустой -> ["en"].
-    """
-    lang = (lang or "").strip().lower()
-    cands: List[str] = []
-    if lang:
-        cands.append(lang)
-        if "-" in lang:
-            short = lang.split("-")[0]
-            if short not in cands:
-                cands.append(short)
-    if "en" not in cands:
-        cands.append("en")
-    return cands
-
 def _label_pos_neg_neu(sentiment_overall: str, rating10: Optional[float]) -> str:
     """
     Классификация отзыва недели:
@@ -308,7 +585,7 @@ def build_source_pivot(df_period: "pd.DataFrame") -> "pd.DataFrame":
     df = df_period.copy()
     df["__label__"] = df.apply(lambda r: _label_pos_neg_neu(r.get("sentiment_overall"), r.get("rating10")), axis=1)
 
-    grp = df.groupby("source", dropna=False)
+    grp = df.groupby("source", dropna=False, observed=True)
     agg = grp.agg(
         reviews=("review_id", "nunique"),
         avg10=("rating10", "mean"),
@@ -342,6 +619,77 @@ def _score_from_flags_and_rating(flags: Dict[str, bool], rating10: Optional[floa
     rating_norm = max(-1.0, min(1.0, rating_norm))
     return float(round(0.6 * text_score + 0.4 * rating_norm, 4))
 
+# -----------------------------------------------------------------------------
+# Таблицы правил по кандидатам языка (для лексиконов без analyze_text)
+# -----------------------------------------------------------------------------
+
+def _fuse_patterns(pats: List[re.Pattern]) -> List[re.Pattern]:
+    """
+    Список паттернов одного правила -> один regex-альтернация (если можно:
+    одинаковые флаги, нет групп), иначе как есть. Для вопроса "есть ли
+    совпадение" альтернация эквивалентна перебору.
+    """
+    if len(pats) <= 1:
+        return list(pats)
+    flags = {rx.flags for rx in pats}
+    if len(flags) == 1:
+        try:
+            rx = re.compile("|".join(f"(?:{p.pattern})" for p in pats), flags.pop())
+        except re.error:
+            rx = None
+        if rx is not None and not rx.groups:
+            return [rx]
+    return list(pats)
+
+
+class _RuleTables:
+    """
+    Паттерны лексикона для одного набора кандидатов языка, собранные
+    один раз (а не pats.extend(...) на каждое предложение) и слитые по
+    правилам, в порядке обхода правил. Нужны лексиконам без
+    analyze_text (только LexiconProtocol) и векторному бэкенду.
+    """
+
+    def __init__(self, lexicon: Any, cands: Tuple[str, ...]) -> None:
+        def _collect(lang_map: Dict[str, List[re.Pattern]]) -> List[re.Pattern]:
+            pats: List[re.Pattern] = []
+            for cand in cands:
+                pats.extend(lang_map.get(cand, []))
+            return _fuse_patterns(pats)
+
+        self.sentiment: List[Tuple[str, List[re.Pattern]]] = [
+            (b, _collect(lexicon.compiled_sentiment.get(b, {}))) for b in _SENTIMENT_BUCKETS
+        ]
+        self.topics: List[Tuple[Tuple[str, str], List[re.Pattern]]] = []
+        for topic_key, topic_data in lexicon.topic_schema.items():
+            for subtopic_key in topic_data.get("subtopics", {}):
+                compiled_map = lexicon.compiled_topics.get(topic_key, {}).get(subtopic_key, {})
+                self.topics.append(((topic_key, subtopic_key), _collect(compiled_map)))
+        self.aspects: List[Tuple[str, Any, List[re.Pattern], set]] = [
+            (
+                aspect_code,
+                rule,
+                _collect(lexicon.compiled_aspects.get(aspect_code, {})),
+                set(lexicon.aspect_to_subtopics.get(aspect_code, [])),
+            )
+            for aspect_code, rule in lexicon.aspect_rules.items()
+        ]
+
+
+_RULE_TABLES: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, ...], _RuleTables]]" = weakref.WeakKeyDictionary()
+
+
+def _rule_tables(lexicon: Any, cands: Tuple[str, ...]) -> _RuleTables:
+    try:
+        per_lexicon = _RULE_TABLES.setdefault(lexicon, {})
+    except TypeError:
+        per_lexicon = {}
+    tables = per_lexicon.get(cands)
+    if tables is None:
+        tables = per_lexicon[cands] = _RuleTables(lexicon, cands)
+    return tables
+
+
 # -----------------------------------------------------------------------------
 # 3. Поиск тональности на уровне всего отзыва
 # -----------------------------------------------------------------------------
@@ -350,6 +698,7 @@ def detect_sentiment_for_review(
     review_text: str,
     lang: str,
     lexicon: LexiconProtocol,
+    memo: Optional[Dict[int, bool]] = None,
 ) -> Tuple[str, Dict[str, bool]]:
     """
     Возвращает:
@@ -358,129 +707,576 @@ def detect_sentiment_for_review(
       - ищем ключевые корзины тональностей по списку кандидатов языков,
       - учитываем мягкую нормализацию текста,
       - итог: 'negative' / 'positive' / 'mixed' / 'neutral'.
+    Лексикон с analyze_text считает сам; memo — мемо search() для
+    нормализованного текста (см. _match_any) в общем пути.
     """
-    buckets = [
-        "positive_strong",
-        "positive_soft",
-        "negative_soft",
-        "negative_strong",
-        "neutral",
-    ]
-    flags: Dict[str, bool] = {b: False for b in buckets}
+    analyze_text = getattr(lexicon, "analyze_text", None)
+    if analyze_text is not None:
+        flags = analyze_text(review_text, lang, sentences=False).sentiment
+        return _overall_from_flags(flags), flags
+
+    flags = {b: False for b in _SENTIMENT_BUCKETS}
     if not review_text:
         return "neutral", flags
 
     text = _normalize_text(review_text)
-    for b in buckets:
-        lang_map = lexicon.compiled_sentiment.get(b, {})
-        pats: List[re.Pattern] = []
-        for cand in _candidate_langs(lang):
-            pats.extend(lang_map.get(cand, []))
-        if pats and _match_any(pats, text):
+    tables = _rule_tables(lexicon, tuple(_candidate_langs(lang)))
+    for b, pats in tables.sentiment:
+        if pats and _match_any(pats, text, memo):
             flags[b] = True
 
+    return _overall_from_flags(flags), flags
+
+
+def _overall_from_flags(flags: Dict[str, bool]) -> str:
+    """
+    Флаги корзин -> 'negative' / 'positive' / 'mixed' / 'neutral'.
+    """
     any_pos = flags["positive_strong"] or flags["positive_soft"]
     any_neg = flags["negative_strong"] or flags["negative_soft"]
 
     if any_neg and not any_pos:
-        overall = "negative"
+        return "negative"
     elif any_pos and not any_neg:
-        overall = "positive"
+        return "positive"
     elif any_pos and any_neg:
-        overall = "mixed"
-    else:
-        overall = "neutral"
-
-    return overall, flags
+        return "mixed"
+    return "neutral"
 
 
 
 # -----------------------------------------------------------------------------
 # 4. Поиск тем/подтем и аспектов в пределах одного предложения
+#
+# Лексикон с analyze_sentence / analyze_text (lexicon_module.Lexicon) делает
+# это сам за один проход префильтра; ниже — общий путь для лексиконов,
+# реализующих только LexiconProtocol.
 # -----------------------------------------------------------------------------
 
 def _topics_in_sentence(
     sent: str,
-    lang: str,
-    lexicon: LexiconProtocol,
+    tables: _RuleTables,
+    memo: Optional[Dict[int, bool]] = None,
 ) -> List[Tuple[str, str]]:
     """
     Вернёт список (topic_key, subtopic_key), которые встречаются в тексте sent.
-    Учитываем кандидатов языка: lang, short-lang, en.
+    tables — правила по кандидатам языка (lang, short-lang, en).
+    memo — мемо search() для sent, общее с аспектами (см. _match_any).
     """
-    hits: List[Tuple[str, str]] = []
     if not sent:
-        return hits
-
-    for topic_key, topic_data in lexicon.topic_schema.items():
-        subtopics = topic_data.get("subtopics", {})
-        for subtopic_key, _sub_def in subtopics.items():
-            pats: List[re.Pattern] = []
-            compiled_map = lexicon.compiled_topics.get(topic_key, {}).get(subtopic_key, {})
-            for cand in _candidate_langs(lang):
-                pats.extend(compiled_map.get(cand, []))
-            if pats and _match_any(pats, sent):
-                hits.append((topic_key, subtopic_key))
-    return hits
-
+        return []
+    return [pair for pair, pats in tables.topics if pats and _match_any(pats, sent, memo)]
 
 
-def _aspects_in_sentence(
+def _sentence_aspect_matches(
     sent: str,
-    lang: str,
-    lexicon: LexiconProtocol,
+    tables: _RuleTables,
     sentence_topics: List[Tuple[str, str]],
-    base_review_meta: Dict[str, Any],
-) -> List[AspectHit]:
+    memo: Optional[Dict[int, bool]] = None,
+) -> List[Tuple[str, str, str, str, str, str]]:
     """
     Валидируем аспект только если он "подвязан" к найденным в предложении подтемам.
+    Возвращает то, что зависит только от предложения (без метаданных отзыва):
+        [(aspect_code, topic_key, subtopic_key, display_short, long_hint, polarity_hint), ...]
+    memo — мемо search() для sent, общее с темами (см. _match_any).
     """
     if not sentence_topics or not sent:
         return []
 
     sentence_topic_set = set(sentence_topics)
-    out: List[AspectHit] = []
-
-    for aspect_code, rule in lexicon.aspect_rules.items():
-        pats: List[re.Pattern] = []
-        compiled_lang_map = lexicon.compiled_aspects.get(aspect_code, {})
-        for cand in _candidate_langs(lang):
-            pats.extend(compiled_lang_map.get(cand, []))
-        if not pats or not _match_any(pats, sent):
+    out: List[Tuple[str, str, str, str, str, str]] = []
+
+    for aspect_code, rule, pats, allowed_pairs in tables.aspects:
+        if not pats or not _match_any(pats, sent, memo):
             continue
 
-        allowed_pairs = set(lexicon.aspect_to_subtopics.get(aspect_code, []))
         common_pairs = sentence_topic_set.intersection(allowed_pairs)
         if not common_pairs:
             continue
 
         topic_key, subtopic_key = next(iter(common_pairs))
-        out.append(AspectHit(
-            review_id=base_review_meta["review_id"],
-            aspect_code=aspect_code,
-            topic_key=topic_key,
-            subtopic_key=subtopic_key,
-            display_short=getattr(rule, "display_short", aspect_code),
-            long_hint=getattr(rule, "long_hint", ""),
-            polarity_hint=rule.polarity_hint,
-            created_at=base_review_meta["created_at"],
-            week_key=base_review_meta["week_key"],
-            source=base_review_meta["source"],
-            rating10=base_review_meta["rating10"],
-            sentiment_overall=base_review_meta["sentiment_overall"],
-            lang=base_review_meta["lang"],
+        out.append((
+            aspect_code,
+            topic_key,
+            subtopic_key,
+            getattr(rule, "display_short", aspect_code),
+            getattr(rule, "long_hint", ""),
+            rule.polarity_hint,
         ))
 
     return out
 
 
+def _aspect_hits(
+    matches: Iterable[Tuple[str, str, str, str, str, str]],
+    base_review_meta: Any,
+) -> List[AspectHit]:
+    """
+    Совпадения аспектов предложения + метаданные отзыва -> AspectHit.
+    base_review_meta — _HitMeta отзыва или dict с теми же ключами.
+    """
+    meta = base_review_meta if isinstance(base_review_meta, _HitMeta) else _HitMeta.from_dict(base_review_meta)
+    return [AspectHit._from_parts(meta, tuple(match)) for match in matches]
+
+
+def _analyze_sentence(
+    sent: str,
+    lang: str,
+    lexicon: LexiconProtocol,
+    memo: Optional[Dict[int, bool]] = None,
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str, str, str, str, str], ...]]:
+    """
+    Темы и аспекты одного предложения — всё, что не зависит от метаданных отзыва
+    (и поэтому может лежать в SentenceCache).
+    """
+    analyze_sentence = getattr(lexicon, "analyze_sentence", None)
+    if analyze_sentence is not None:
+        return analyze_sentence(sent, lang, memo=memo)
+
+    tables = _rule_tables(lexicon, tuple(_candidate_langs(lang)))
+    # на уровне предложения находим темы/подтемы
+    st_topics = _topics_in_sentence(sent, tables, memo=memo)
+
+    # на уровне предложения находим аспекты,
+    # разрешая только те, которые "подвязаны" к найденным здесь подтемам.
+    st_aspects = _sentence_aspect_matches(sent, tables, st_topics, memo=memo)
+    return tuple(st_topics), tuple(st_aspects)
+
+
+# -----------------------------------------------------------------------------
+# LRU-кэш результатов по предложениям
+#
+# Короткие фразы в отзывах повторяются постоянно ("Всё отлично", "Спасибо",
+# "Great location"). Темы и аспекты предложения зависят только от его текста
+# и кандидатов языка, поэтому повторы берём из кэша, не трогая регексы.
+# Кэш свой у каждого экземпляра лексикона (другие правила — другие ответы).
+# -----------------------------------------------------------------------------
+
+SENTENCE_CACHE_SIZE_ENV = "REVIEWS_SENTENCE_CACHE_SIZE"
+DEFAULT_SENTENCE_CACHE_SIZE = 50000
+
+
+class SentenceCache:
+    """
+    Ограниченный LRU: (нормализованное предложение, кандидаты языка) ->
+    (темы, совпадения аспектов). При переполнении вытесняется самое давно
+    использованное предложение. Счётчики hits / misses / evictions — для логов.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SENTENCE_CACHE_SIZE) -> None:
+        self.maxsize = max(0, int(maxsize))
+        self._data: "OrderedDict[Tuple[str, Tuple[str, ...]], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple[str, Tuple[str, ...]]) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Tuple[str, Tuple[str, ...]], value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_SENTENCE_CACHES: "weakref.WeakKeyDictionary[Any, SentenceCache]" = weakref.WeakKeyDictionary()
+
+
+def _sentence_cache_size_from_env() -> int:
+    raw = (os.environ.get(SENTENCE_CACHE_SIZE_ENV) or "").strip()
+    if not raw:
+        return DEFAULT_SENTENCE_CACHE_SIZE
+    try:
+        return int(raw)
+    except ValueError:
+        LOG.warning("%s=%r не число, используем %d", SENTENCE_CACHE_SIZE_ENV, raw, DEFAULT_SENTENCE_CACHE_SIZE)
+        return DEFAULT_SENTENCE_CACHE_SIZE
+
+
+def configure_sentence_cache(lexicon: Any, maxsize: int) -> Optional[SentenceCache]:
+    """
+    Задать размер кэша предложений для лексикона (старый кэш сбрасывается).
+    maxsize <= 0 — кэш выключен. По умолчанию размер берётся из
+    REVIEWS_SENTENCE_CACHE_SIZE (или DEFAULT_SENTENCE_CACHE_SIZE).
+    """
+    cache = SentenceCache(maxsize)
+    try:
+        _SENTENCE_CACHES[lexicon] = cache
+    except TypeError:
+        # лексикон без weakref (например, с __slots__) — работаем без кэша
+        return None
+    return cache if cache.maxsize > 0 else None
+
+
+def sentence_cache_for(lexicon: Any) -> Optional[SentenceCache]:
+    """
+    Кэш предложений лексикона (создаётся при первом обращении);
+    None — кэш выключен или лексикон его не поддерживает.
+    """
+    try:
+        cache = _SENTENCE_CACHES.get(lexicon)
+    except TypeError:
+        return None
+    if cache is None:
+        return configure_sentence_cache(lexicon, _sentence_cache_size_from_env())
+    return cache if cache.maxsize > 0 else None
+
+
+# -----------------------------------------------------------------------------
+# Бюджет на отзыв
+#
+# Один вставленный многокилобайтный текст (или патологичный паттерн) не
+# должен тормозить всю пачку: текст режем по длине, предложения — по
+# количеству, новое предложение не начинаем после дедлайна (только если он
+# задан: время зависит от загрузки машины, поэтому по умолчанию лимита нет).
+# Такой отзыв получает урезанный, но помеченный результат
+# (ReviewAnalysisResult.degraded), пометка доходит до reviews_history.
+# Уже начатый search() прервать нельзя — дедлайн проверяется между
+# предложениями, а длину одного search() ограничивает лимит символов.
+# -----------------------------------------------------------------------------
+
+REVIEW_MAX_CHARS_ENV = "REVIEWS_MAX_CHARS"
+REVIEW_MAX_SENTENCES_ENV = "REVIEWS_MAX_SENTENCES"
+REVIEW_MAX_SECONDS_ENV = "REVIEWS_MAX_SECONDS"
+DEFAULT_REVIEW_MAX_CHARS = 20000
+DEFAULT_REVIEW_MAX_SENTENCES = 300
+DEFAULT_REVIEW_MAX_SECONDS = 0.0
+
+DEGRADED_CHARS = "chars"
+DEGRADED_SENTENCES = STOP_SENTENCES
+DEGRADED_TIME = STOP_TIME
+DEGRADED_REASONS = (DEGRADED_CHARS, DEGRADED_SENTENCES, DEGRADED_TIME)
+
+
+@dataclass(frozen=True)
+class ReviewBudget:
+    """
+    Лимиты на один отзыв; 0 — без лимита.
+    max_chars — сколько символов текста анализируем,
+    max_sentences — сколько предложений разбираем,
+    max_seconds — после скольких секунд не начинаем новое предложение.
+    """
+    max_chars: int = DEFAULT_REVIEW_MAX_CHARS
+    max_sentences: int = DEFAULT_REVIEW_MAX_SENTENCES
+    max_seconds: float = DEFAULT_REVIEW_MAX_SECONDS
+
+
+UNLIMITED_BUDGET = ReviewBudget(max_chars=0, max_sentences=0, max_seconds=0.0)
+
+_DEFAULT_BUDGET: Optional[ReviewBudget] = None
+
+
+def review_budget_from_env() -> ReviewBudget:
+    """
+    Бюджет из REVIEWS_MAX_CHARS / REVIEWS_MAX_SENTENCES / REVIEWS_MAX_SECONDS
+    (незаданные — по умолчанию, некорректные — с предупреждением).
+    """
+    def _read(name: str, default: Any, cast: Any) -> Any:
+        raw = (os.environ.get(name) or "").strip()
+        if not raw:
+            return default
+        try:
+            return max(cast(raw), 0)
+        except ValueError:
+            LOG.warning("%s=%r не число, используем %s", name, raw, default)
+            return default
+
+    return ReviewBudget(
+        max_chars=_read(REVIEW_MAX_CHARS_ENV, DEFAULT_REVIEW_MAX_CHARS, int),
+        max_sentences=_read(REVIEW_MAX_SENTENCES_ENV, DEFAULT_REVIEW_MAX_SENTENCES, int),
+        max_seconds=_read(REVIEW_MAX_SECONDS_ENV, DEFAULT_REVIEW_MAX_SECONDS, float),
+    )
+
+
+def default_review_budget() -> ReviewBudget:
+    """
+    Бюджет по умолчанию для analyze_single_review (ENV читается один раз на процесс).
+    """
+    global _DEFAULT_BUDGET
+    if _DEFAULT_BUDGET is None:
+        _DEFAULT_BUDGET = review_budget_from_env()
+    return _DEFAULT_BUDGET
+
+
+# сколько раз сработал бюджет (в этом процессе; считает iter_analyze_reviews)
+_BUDGET_COUNTS: Dict[str, int] = {}
+_BUDGET_LOCK = threading.Lock()
+
+
+def _count_degraded(degraded: str) -> None:
+    with _BUDGET_LOCK:
+        _BUDGET_COUNTS["reviews"] = _BUDGET_COUNTS.get("reviews", 0) + 1
+        for reason in degraded.split(","):
+            _BUDGET_COUNTS[reason] = _BUDGET_COUNTS.get(reason, 0) + 1
+
+
+def budget_stats() -> Dict[str, int]:
+    """
+    Счётчики бюджета за процесс: {"reviews": урезанных отзывов,
+    "chars": ..., "sentences": ..., "time": ...} (по причинам).
+    """
+    with _BUDGET_LOCK:
+        stats = {"reviews": _BUDGET_COUNTS.get("reviews", 0)}
+        for reason in DEGRADED_REASONS:
+            stats[reason] = _BUDGET_COUNTS.get(reason, 0)
+    return stats
+
+
+def reset_budget_stats() -> None:
+    with _BUDGET_LOCK:
+        _BUDGET_COUNTS.clear()
+
+
+def format_budget_summary(stats: Optional[Dict[str, int]] = None) -> str:
+    """
+    Строка для GitHub step summary: сколько отзывов разобрано не целиком.
+    """
+    stats = stats or budget_stats()
+    reasons = ", ".join(f"{reason}: {stats.get(reason, 0)}" for reason in DEGRADED_REASONS)
+    return f"- Отзывов с урезанным анализом (бюджет на отзыв): {stats.get('reviews', 0)} ({reasons})\n"
+
+
+# -----------------------------------------------------------------------------
+# Журнал медленных отзывов
+#
+# Бюджет отвечает на вопрос «сколько отзывов урезали», журнал — «какие
+# отзывы дороже всего и почему»: N самых долгих за прогон с длиной текста,
+# числом предложений и проверенных/сработавших паттернов. Держим min-кучу
+# размера N, поэтому журнал не растёт с объёмом истории. Замеряется только
+# поштучный анализ (бэкенд "python", в том числе в воркерах пула);
+# векторный бэкенд и отзывы из кэша результатов в журнал не попадают.
+# -----------------------------------------------------------------------------
+
+SLOW_LOG_SIZE_ENV = "REVIEWS_SLOW_LOG_SIZE"
+SLOW_LOG_JSON_ENV = "REVIEWS_SLOW_LOG_JSON"
+DEFAULT_SLOW_LOG_SIZE = 20
+
+
+@dataclass(frozen=True)
+class SlowReview:
+    """
+    Один отзыв журнала. patterns_checked / patterns_hit — вызовы search()
+    и совпадения за время отзыва (-1, если счётчик занят профилем паттернов).
+    """
+    review_id: str
+    lang: str
+    chars: int
+    sentences: int
+    patterns_checked: int
+    patterns_hit: int
+    elapsed_ms: float
+    degraded: str = ""
+
+
+class SlowReviewLog:
+    """
+    N самых медленных отзывов. Передаётся в iter_analyze_reviews /
+    analyze_reviews_bulk (slow_log=...); один журнал можно вести через
+    несколько прогонов.
+    """
+
+    def __init__(self, size: int = DEFAULT_SLOW_LOG_SIZE) -> None:
+        if size <= 0:
+            raise ValueError(f"size must be positive, got {size}")
+        self.size = size
+        self.seen = 0
+        self._heap: List[Tuple[float, int, SlowReview]] = []
+        self._lock = threading.Lock()
+
+    def offer(
+        self,
+        rec: ReviewRecordInput,
+        res: "ReviewAnalysisResult",
+        elapsed: float,
+        patterns_checked: int = -1,
+        patterns_hit: int = -1,
+    ) -> None:
+        with self._lock:
+            self.seen += 1
+            if len(self._heap) >= self.size and elapsed <= self._heap[0][0]:
+                return
+            text = rec.text or ""
+            entry = SlowReview(
+                review_id=str(rec.review_id),
+                lang=str(rec.lang),
+                chars=len(text),
+                # предложения считаем только для попавших в журнал
+                sentences=len(_split_into_sentences(text)),
+                patterns_checked=patterns_checked,
+                patterns_hit=patterns_hit,
+                elapsed_ms=round(elapsed * 1000.0, 3),
+                degraded=getattr(res, "degraded", "") or "",
+            )
+            item = (elapsed, self.seen, entry)
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, item)
+            else:
+                heapq.heapreplace(self._heap, item)
+
+    def top(self) -> List[SlowReview]:
+        """Отзывы журнала, самые медленные первыми."""
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._heap, key=lambda item: item[0], reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "reviews_measured": self.seen,
+            "slowest": [entry.__dict__.copy() for entry in self.top()],
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
+
+    def format_markdown(self) -> str:
+        """
+        Таблица для GitHub step summary (пустая строка, если замеров не было).
+        """
+        top = self.top()
+        if not top:
+            return ""
+        lines = [
+            f"#### Самые медленные отзывы ({len(top)} из {self.seen})",
+            "",
+            "| review_id | lang | мс | символов | предложений | проверок паттернов | совпадений | бюджет |",
+            "|---|---|---:|---:|---:|---:|---:|---|",
+        ]
+        for e in top:
+            lines.append(
+                f"| `{e.review_id}` | {e.lang} | {e.elapsed_ms:.1f} | {e.chars} | {e.sentences} "
+                f"| {e.patterns_checked} | {e.patterns_hit} | {e.degraded or '—'} |"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def slow_log_from_env() -> Optional[SlowReviewLog]:
+    """
+    Журнал размера REVIEWS_SLOW_LOG_SIZE (по умолчанию 20; 0 — выключен).
+    """
+    raw = (os.environ.get(SLOW_LOG_SIZE_ENV) or "").strip()
+    size = DEFAULT_SLOW_LOG_SIZE
+    if raw:
+        try:
+            size = int(raw)
+        except ValueError:
+            LOG.warning("%s=%r не число, используем %d", SLOW_LOG_SIZE_ENV, raw, DEFAULT_SLOW_LOG_SIZE)
+    return SlowReviewLog(size) if size > 0 else None
+
+
+def publish_slow_log(slow_log: Optional[SlowReviewLog]) -> str:
+    """
+    Записать журнал в JSON из REVIEWS_SLOW_LOG_JSON (если задан — это
+    артефакт workflow) и вернуть markdown для GitHub step summary.
+    """
+    if slow_log is None:
+        return ""
+    path = (os.environ.get(SLOW_LOG_JSON_ENV) or "").strip()
+    if path:
+        try:
+            slow_log.write_json(path)
+        except OSError as e:
+            LOG.warning("Не удалось записать журнал медленных отзывов в %s: %s", path, e)
+    return slow_log.format_markdown()
+
+
 # -----------------------------------------------------------------------------
 # 5. Анализ одного отзыва целиком
 # -----------------------------------------------------------------------------
 
+def _analyze_text(
+    text: str,
+    lang: str,
+    lexicon: LexiconProtocol,
+    max_sentences: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[Dict[str, bool], List[Tuple[str, str]], List[Tuple[str, str, str, str, str, str]], str]:
+    """
+    (флаги корзин тональности, темы по предложениям, совпадения аспектов
+    по предложениям, причина остановки) для текста отзыва. Лексикон с
+    analyze_text делает всё за один вызов; для прочих — тональность +
+    предложения по отдельности. Результаты по предложениям берутся из
+    SentenceCache лексикона. max_sentences / deadline — см. Lexicon.analyze_text.
+    """
+    cache = sentence_cache_for(lexicon)
+    analyze_text = getattr(lexicon, "analyze_text", None)
+    if analyze_text is not None:
+        analysis = analyze_text(
+            text, lang, sentence_cache=cache, max_sentences=max_sentences, deadline=deadline,
+        )
+        return analysis.sentiment, analysis.topics, analysis.aspects, analysis.stopped
+
+    # мемо search() по текстам этого отзыва: одинаковые паттерны тональности,
+    # тем и аспектов на одном и том же тексте проверяются один раз
+    memos: Dict[str, Dict[int, bool]] = {}
+    _, flags = detect_sentiment_for_review(
+        review_text=text,
+        lang=lang,
+        lexicon=lexicon,
+        memo=memos.setdefault(_normalize_text(text), {}),
+    )
+
+    topics: List[Tuple[str, str]] = []
+    aspects: List[Tuple[str, str, str, str, str, str]] = []
+    stopped = ""
+    langs_key = tuple(_candidate_langs(lang))
+    # нарежем на куски (условно "предложения") и пройдемся
+    for n, sent in enumerate(_split_into_sentences(text)):
+        if max_sentences is not None and n >= max_sentences:
+            stopped = STOP_SENTENCES
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            stopped = STOP_TIME
+            break
+        cached = cache.get((sent, langs_key)) if cache is not None else None
+        if cached is None:
+            cached = _analyze_sentence(sent, lang, lexicon, memo=memos.setdefault(sent, {}))
+            if cache is not None:
+                cache.put((sent, langs_key), cached)
+        topics.extend(cached[0])
+        aspects.extend(cached[1])
+    return flags, topics, aspects, stopped
+
+
 def analyze_single_review(
     raw: ReviewRecordInput,
     lexicon: LexiconProtocol,
+    budget: Optional[ReviewBudget] = None,
 ) -> ReviewAnalysisResult:
     """
     Основная функция для одного отзыва.
@@ -490,78 +1286,770 @@ def analyze_single_review(
       - определение тональности,
       - разбор по предложениям, поиск подтем и аспектов,
       - сбор всего результата в ReviewAnalysisResult.
+    budget — лимиты на отзыв (None — default_review_budget(), из ENV);
+    если сработал, результат урезан и помечен в degraded.
     """
 
     created_at_date = _safe_to_date(raw.created_at)
     week_key = _week_key_for_date(created_at_date)
 
-    sentiment_overall, sentiment_detail = detect_sentiment_for_review(
-        review_text=raw.text,
-        lang=raw.lang,
-        lexicon=lexicon,
+    if budget is None:
+        budget = default_review_budget()
+    degraded: List[str] = []
+    text = raw.text
+    if budget.max_chars and text and len(text) > budget.max_chars:
+        text = text[: budget.max_chars]
+        degraded.append(DEGRADED_CHARS)
+    deadline = time.perf_counter() + budget.max_seconds if budget.max_seconds else None
+
+    sentiment_detail, st_topics, st_aspects, stopped = _analyze_text(
+        text, raw.lang, lexicon, max_sentences=budget.max_sentences or None, deadline=deadline,
     )
+    if stopped:
+        degraded.append(stopped)
+    sentiment_overall = _overall_from_flags(sentiment_detail)
     # числовой скоринг тональности
     sentiment_score = _score_from_flags_and_rating(sentiment_detail, raw.rating10)
 
-
-    # метаданные, которые нужны аспектам:
-    base_meta = {
-        "review_id": raw.review_id,
-        "created_at": created_at_date,
-        "week_key": week_key,
-        "source": raw.source,
-        "rating10": raw.rating10,
-        "sentiment_overall": sentiment_overall,
-        "lang": raw.lang,
-    }
-
-    all_topic_hits: Set[Tuple[str, str]] = set()
-    all_aspect_hits: List[AspectHit] = []
-
-    # нарежем на куски (условно "предложения") и пройдемся
-    for sent in _split_into_sentences(raw.text):
-        # на уровне предложения находим темы/подтемы
-        st_topics = _topics_in_sentence(sent, raw.lang, lexicon)
-        if st_topics:
-            all_topic_hits.update(st_topics)
-
-        # на уровне предложения находим аспекты,
-        # разрешая только те, которые "подвязаны" к найденным здесь подтемам.
-        st_aspects = _aspects_in_sentence(
-            sent=sent,
-            lang=raw.lang,
-            lexicon=lexicon,
-            sentence_topics=st_topics,
-            base_review_meta=base_meta,
-        )
-        if st_aspects:
-            all_aspect_hits.extend(st_aspects)
-
-    result = ReviewAnalysisResult(
+    # метаданные, которые нужны аспектам (одна копия на все хиты отзыва):
+    base_meta = _HitMeta(
         review_id=raw.review_id,
-        source=raw.source,
         created_at=created_at_date,
         week_key=week_key,
+        source=raw.source,
         rating10=raw.rating10,
+        sentiment_overall=sentiment_overall,
         lang=raw.lang,
+    )
+    all_topic_hits: Set[Tuple[str, str]] = set(st_topics)
+    all_aspect_hits: List[AspectHit] = _aspect_hits(st_aspects, base_meta)
+
+    result = ReviewAnalysisResult(
+        review_id=raw.review_id,
+        source=base_meta.source,
+        created_at=created_at_date,
+        week_key=base_meta.week_key,
+        rating10=raw.rating10,
+        lang=base_meta.lang,
         sentiment_overall=sentiment_overall,
         sentiment_detail=sentiment_detail,
         sentiment_score=sentiment_score,
         topic_hits=all_topic_hits,
         aspects=all_aspect_hits,
         raw_text=raw.text,
+        degraded=",".join(degraded),
     )
     return result
 
 
+# -----------------------------------------------------------------------------
+# 5a. Векторный бэкенд (pandas)
+#
+# Та же логика, что в analyze_single_review, но на всю пачку сразу:
+# тексты нормализуются и режутся на предложения векторно (str.replace /
+# str.split + explode), каждый (правило, кандидаты языка) — один слитый
+# регекс, который прогоняется Series.str.contains по строкам этого языка.
+# Итог — булевы матрицы (предложение x подтема, предложение x аспект,
+# отзыв x корзина тональности), из которых собираются те же
+# ReviewAnalysisResult. Аспекты проверяются только на предложениях, где
+# есть хотя бы одна из их подтем (гейт).
+# -----------------------------------------------------------------------------
+
+ANALYSIS_BACKEND_ENV = "REVIEWS_ANALYSIS_BACKEND"
+BACKEND_PYTHON = "python"
+BACKEND_PANDAS = "pandas"
+ANALYSIS_BACKENDS = (BACKEND_PYTHON, BACKEND_PANDAS)
+
+
+def analysis_backend_from_env() -> str:
+    """
+    Бэкенд анализа из REVIEWS_ANALYSIS_BACKEND: python (по умолчанию) / pandas.
+    """
+    backend = (os.environ.get(ANALYSIS_BACKEND_ENV) or BACKEND_PYTHON).strip().lower()
+    if backend not in ANALYSIS_BACKENDS:
+        LOG.warning("Некорректное %s=%r, используем %s", ANALYSIS_BACKEND_ENV, backend, BACKEND_PYTHON)
+        return BACKEND_PYTHON
+    return backend
+
+
+_RuleRows = Dict[Any, Dict[re.Pattern, List[int]]]
+
+
+def _rule_candidates(
+    lexicon: Any,
+    rows: List[str],
+    lang: str,
+    tables: _RuleTables,
+) -> Tuple[_RuleRows, _RuleRows, _RuleRows]:
+    """
+    Для каждого правила (корзина / подтема / аспект): паттерн -> номера
+    строк, где его нужно проверить. С префильтром лексикона — только
+    строки, где префильтр пропустил паттерн (остальные гарантированно не
+    совпадут); без префильтра — все строки для каждого слитого паттерна.
+    """
+    sentiment: _RuleRows = {}
+    topics: _RuleRows = {}
+    aspects: _RuleRows = {}
+    prefilter = getattr(lexicon, "prefilter", None)
+    if prefilter is None:
+        everything = list(range(len(rows)))
+        for key, pats in tables.sentiment:
+            sentiment[key] = {rx: everything for rx in pats}
+        for key, pats in tables.topics:
+            topics[key] = {rx: everything for rx in pats}
+        for key, _rule, pats, _allowed in tables.aspects:
+            aspects[key] = {rx: everything for rx in pats}
+        return sentiment, topics, aspects
+
+    for r, text in enumerate(rows):
+        screen = prefilter(text, lang)
+        for key, pats in screen.sentiment.items():
+            per_rx = sentiment.setdefault(key, {})
+            for rx in pats:
+                per_rx.setdefault(rx, []).append(r)
+        for key, pats in screen.topics:
+            per_rx = topics.setdefault(key, {})
+            for rx in pats:
+                per_rx.setdefault(rx, []).append(r)
+        for key, pats in screen.aspects:
+            per_rx = aspects.setdefault(key, {})
+            for rx in pats:
+                per_rx.setdefault(rx, []).append(r)
+    return sentiment, topics, aspects
+
+
+def _contains_any(
+    texts: pd.Series,
+    candidates: Dict[re.Pattern, List[int]],
+    mask: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Булев вектор по texts: совпал ли хоть один паттерн на своих строках
+    (Series.str.contains; уже совпавшие строки и строки вне mask не проверяем).
+    """
+    hit = np.zeros(len(texts), dtype=bool)
+    for rx, rows in candidates.items():
+        idx = np.asarray(rows, dtype=np.intp)
+        keep = ~hit[idx]
+        if mask is not None:
+            keep &= mask[idx]
+        idx = idx[keep]
+        if not len(idx):
+            continue
+        with warnings.catch_warnings():
+            # паттерны лексикона могут содержать группы — нам нужен только факт совпадения
+            warnings.simplefilter("ignore", UserWarning)
+            hit[idx] = texts.iloc[idx].str.contains(rx, regex=True).to_numpy(dtype=bool)
+    return hit
+
+
+def _normalize_series(texts: pd.Series) -> pd.Series:
+    """
+    Векторный _normalize_text.
+    """
+    return (
+        texts.str.replace(_URL_RE, " ", regex=True)
+        .str.replace(_EMAIL_RE, " ", regex=True)
+        .str.replace(_WS_RE, " ", regex=True)
+        .str.strip()
+    )
+
+
+def _analyze_records_frame(
+    records: List[ReviewRecordInput],
+    lexicon: Any,
+    budget: Optional[ReviewBudget] = None,
+) -> List[Tuple[Any, ...]]:
+    """
+    Векторный анализ пачки. Исходы по records в том же порядке:
+    ("ok", ReviewAnalysisResult) / ("error", exc, None) — как у однопроцессного
+    пути в iter_analyze_reviews. Из бюджета на отзыв применяются лимиты
+    символов и предложений; времени — нет (пачка идёт целиком).
+    """
+    if budget is None:
+        budget = default_review_budget()
+    n = len(records)
+    outcomes: List[Optional[Tuple[Any, ...]]] = [None] * n
+
+    # даты и недели — поштучно (ошибка в дате — ошибка конкретного отзыва),
+    # одинаковые строки дат в пачке разбираем один раз
+    dates: List[Any] = [None] * n
+    parsed: Dict[str, Tuple[date, str]] = {}
+    alive: List[int] = []
+    for i, rec in enumerate(records):
+        raw_date = rec.created_at
+        if isinstance(raw_date, str) and raw_date in parsed:
+            dates[i] = parsed[raw_date]
+            alive.append(i)
+            continue
+        try:
+            created = _safe_to_date(raw_date)
+            dates[i] = (created, _week_key_for_date(created))
+        except Exception as e:
+            outcomes[i] = ("error", e, None)
+            continue
+        if isinstance(raw_date, str):
+            parsed[raw_date] = dates[i]
+        alive.append(i)
+    if not alive:
+        return outcomes  # type: ignore[return-value]
+
+    degraded_by_pos: List[List[str]] = [[] for _ in alive]
+    texts_in: List[str] = []
+    for pos, i in enumerate(alive):
+        text = records[i].text or ""
+        if budget.max_chars and len(text) > budget.max_chars:
+            text = text[: budget.max_chars]
+            degraded_by_pos[pos].append(DEGRADED_CHARS)
+        texts_in.append(text)
+    raw = pd.Series(texts_in, dtype=object)
+    has_text = np.fromiter((bool(records[i].text) for i in alive), dtype=bool, count=len(alive))
+    norm = _normalize_series(raw)
+    fold_text = getattr(lexicon, "fold_text", None)
+    if fold_text is not None and getattr(lexicon, "case_mode", None) == CASE_MODE_FOLDED:
+        # паттерны такого лексикона ждут текст, уже приведённый к регистру
+        norm = norm.map(fold_text)
+
+    # предложения: (позиция отзыва в alive, текст), порядок внутри отзыва сохраняется
+    parts = norm.str.split(_SENTENCE_SPLIT_RE, regex=True).explode()
+    parts = parts[parts.notna()].astype(object).str.strip()
+    parts = parts[(parts != "") & has_text[parts.index.to_numpy()]]
+    if budget.max_sentences:
+        over = parts.groupby(level=0).cumcount().to_numpy() >= budget.max_sentences
+        if over.any():
+            for pos in np.unique(parts.index.to_numpy()[over]):
+                degraded_by_pos[pos].append(DEGRADED_SENTENCES)
+            parts = parts[~over]
+    sent_owner = parts.index.to_numpy()
+    sentences = pd.Series(parts.to_numpy(), dtype=object)
+
+    flags_by_pos: List[Dict[str, bool]] = [{b: False for b in _SENTIMENT_BUCKETS} for _ in alive]
+    sent_topics: List[List[Tuple[str, str]]] = [[] for _ in range(len(sentences))]
+    sent_aspects: List[List[Tuple[str, str, str, str, str, str]]] = [[] for _ in range(len(sentences))]
+
+    # группы по кандидатам языка: у каждой своя таблица паттернов
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for pos, i in enumerate(alive):
+        groups.setdefault(tuple(_candidate_langs(records[i].lang)), []).append(pos)
+
+    for cands, positions in groups.items():
+        tables = _rule_tables(lexicon, cands)
+        pos_arr = np.asarray(positions)
+        lang = records[alive[positions[0]]].lang  # любой язык группы даёт те же кандидаты
+
+        # тональность — по нормализованному тексту целиком
+        texted = pos_arr[has_text[pos_arr]]
+        if len(texted):
+            texts = norm.iloc[texted].reset_index(drop=True)
+            sentiment_cands, _, _ = _rule_candidates(lexicon, texts.tolist(), lang, tables)
+            for b, _pats in tables.sentiment:
+                if b in sentiment_cands:
+                    for pos in texted[_contains_any(texts, sentiment_cands[b])]:
+                        flags_by_pos[pos][b] = True
+
+        # темы — матрица предложение x подтема
+        rows = np.flatnonzero(np.isin(sent_owner, pos_arr))
+        if not len(rows):
+            continue
+        group_sents = sentences.iloc[rows].reset_index(drop=True)
+        _, topic_cands, aspect_cands = _rule_candidates(lexicon, group_sents.tolist(), lang, tables)
+        topic_hits: Dict[Tuple[str, str], np.ndarray] = {}
+        for pair, _pats in tables.topics:
+            if pair not in topic_cands:
+                continue
+            hit = _contains_any(group_sents, topic_cands[pair])
+            if hit.any():
+                topic_hits[pair] = hit
+                for r in rows[hit]:
+                    sent_topics[r].append(pair)
+        if not topic_hits:
+            continue
+
+        # аспекты — только на предложениях, где есть их подтемы
+        for aspect_code, rule, _pats, allowed_pairs in tables.aspects:
+            if aspect_code not in aspect_cands:
+                continue
+            gate = np.zeros(len(rows), dtype=bool)
+            for pair in allowed_pairs:
+                hit = topic_hits.get(pair)
+                if hit is not None:
+                    gate |= hit
+            if not gate.any():
+                continue
+            for r in rows[_contains_any(group_sents, aspect_cands[aspect_code], gate)]:
+                # выбор подтемы — ровно как в _sentence_aspect_matches
+                common_pairs = set(sent_topics[r]).intersection(allowed_pairs)
+                topic_key, subtopic_key = next(iter(common_pairs))
+                sent_aspects[r].append((
+                    aspect_code,
+                    topic_key,
+                    subtopic_key,
+                    getattr(rule, "display_short", aspect_code),
+                    getattr(rule, "long_hint", ""),
+                    rule.polarity_hint,
+                ))
+
+    sents_by_pos: List[List[int]] = [[] for _ in alive]
+    for r, pos in enumerate(sent_owner):
+        sents_by_pos[pos].append(r)
+
+    for pos, i in enumerate(alive):
+        rec = records[i]
+        created_at_date, week_key = dates[i]
+        flags = flags_by_pos[pos]
+        sentiment_overall = _overall_from_flags(flags)
+        base_meta = _HitMeta(
+            review_id=rec.review_id,
+            created_at=created_at_date,
+            week_key=week_key,
+            source=rec.source,
+            rating10=rec.rating10,
+            sentiment_overall=sentiment_overall,
+            lang=rec.lang,
+        )
+        all_topic_hits: Set[Tuple[str, str]] = set()
+        all_aspect_hits: List[AspectHit] = []
+        for r in sents_by_pos[pos]:
+            if sent_topics[r]:
+                all_topic_hits.update(sent_topics[r])
+            if sent_aspects[r]:
+                all_aspect_hits.extend(_aspect_hits(sent_aspects[r], base_meta))
+        outcomes[i] = ("ok", ReviewAnalysisResult(
+            review_id=rec.review_id,
+            source=base_meta.source,
+            created_at=created_at_date,
+            week_key=base_meta.week_key,
+            rating10=rec.rating10,
+            lang=base_meta.lang,
+            sentiment_overall=sentiment_overall,
+            sentiment_detail=flags,
+            sentiment_score=_score_from_flags_and_rating(flags, rec.rating10),
+            topic_hits=all_topic_hits,
+            aspects=all_aspect_hits,
+            raw_text=rec.text,
+            degraded=",".join(degraded_by_pos[pos]),
+        ))
+    return outcomes  # type: ignore[return-value]
+
+
+def _analyze_outcomes(
+    records: List[ReviewRecordInput],
+    lexicon: Any,
+    backend: str,
+    measure: bool = False,
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Исходы анализа по records выбранным бэкендом (без пула процессов).
+    Если векторный бэкенд упал целиком — пачка уходит в поштучный анализ,
+    чтобы ошибки отдельных отзывов обработались как обычно.
+
+    measure: у поштучного анализа "ok" несёт третьим элементом
+    (секунды, проверок паттернов, совпадений) — для SlowReviewLog.
+    """
+    if backend == BACKEND_PANDAS and records:
+        try:
+            yield from _analyze_records_frame(records, lexicon)
+            return
+        except Exception:
+            LOG.exception("Векторный анализ пачки упал, анализируем поштучно")
+    if not measure:
+        for rec in records:
+            try:
+                yield ("ok", analyze_single_review(rec, lexicon))
+            except Exception as e:
+                yield ("error", e, None)
+        return
+
+    start_counting = getattr(lexicon, "start_counting", None)
+    counter = start_counting() if start_counting is not None else None
+    try:
+        for rec in records:
+            calls, hits = (counter.calls, counter.hits) if counter is not None else (0, 0)
+            t0 = time.perf_counter()
+            try:
+                res = analyze_single_review(rec, lexicon)
+            except Exception as e:
+                yield ("error", e, None)
+                continue
+            elapsed = time.perf_counter() - t0
+            if counter is not None:
+                stats = (elapsed, counter.calls - calls, counter.hits - hits)
+            else:
+                stats = (elapsed, -1, -1)
+            yield ("ok", res, stats)
+    finally:
+        if counter is not None:
+            lexicon.stop_profiling()
+
+
 # -----------------------------------------------------------------------------
 # 6. Анализ пачки отзывов и подготовка DataFrame'ов
+#
+# Параллельный режим (пул процессов).
+# Матчинг регексов держит GIL, поэтому параллелим процессами. Лексикон
+# в процессах-воркерах: при fork наследуется уже собранным (родитель
+# заранее загружает нужные языки), иначе приходит через pickle в
+# initializer и собирается один раз на воркер (см. Lexicon.__reduce__).
+# Отзывы уходят пачками примерно равного объёма текста; назад приходит
+# компактный кортеж, ReviewAnalysisResult собираем в родителе.
 # -----------------------------------------------------------------------------
 
+ANALYSIS_WORKERS_ENV = "REVIEWS_ANALYSIS_WORKERS"
+
+# меньше стольких отзывов на воркер пул не окупается — считаем в процессе
+_MIN_REVIEWS_PER_WORKER = 200
+# пачек на воркер: достаточно, чтобы выровнять нагрузку, и мало, чтобы
+# не тратить время на пересылку
+_CHUNKS_PER_WORKER = 8
+_MAX_CHUNK_REVIEWS = 2000
+
+_WORKER_LEXICON: Any = None
+
+
+def analysis_workers_from_env() -> int:
+    """
+    Число процессов из REVIEWS_ANALYSIS_WORKERS: по умолчанию 1 (без пула),
+    0 — по числу ядер.
+    """
+    raw = (os.environ.get(ANALYSIS_WORKERS_ENV) or "").strip()
+    try:
+        workers = int(raw) if raw else 1
+    except ValueError:
+        LOG.warning("Некорректное %s=%r, считаем в одном процессе", ANALYSIS_WORKERS_ENV, raw)
+        return 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _compact_result(res: ReviewAnalysisResult) -> Tuple[Any, ...]:
+    """
+    Только вычисленное анализом; остальное родитель берёт из входа.
+    """
+    return (
+        res.created_at,
+        res.week_key,
+        res.sentiment_overall,
+        res.sentiment_detail,
+        res.sentiment_score,
+        tuple(res.topic_hits),
+        tuple(
+            (a.aspect_code, a.topic_key, a.subtopic_key, a.display_short, a.long_hint, a.polarity_hint)
+            for a in res.aspects
+        ),
+        res.degraded,
+    )
+
+
+def _expand_result(rec: ReviewRecordInput, compact: Tuple[Any, ...]) -> ReviewAnalysisResult:
+    created_at, week_key, sentiment_overall, sentiment_detail, sentiment_score, topic_hits, aspects, degraded = compact
+    base_meta = {
+        "review_id": rec.review_id,
+        "created_at": created_at,
+        "week_key": week_key,
+        "source": rec.source,
+        "rating10": rec.rating10,
+        "sentiment_overall": sentiment_overall,
+        "lang": rec.lang,
+    }
+    return ReviewAnalysisResult(
+        review_id=rec.review_id,
+        source=rec.source,
+        created_at=created_at,
+        week_key=week_key,
+        rating10=rec.rating10,
+        lang=rec.lang,
+        sentiment_overall=sentiment_overall,
+        sentiment_detail=sentiment_detail,
+        sentiment_score=sentiment_score,
+        topic_hits=set(topic_hits),
+        aspects=_aspect_hits(aspects, base_meta),
+        raw_text=rec.text,
+        degraded=degraded,
+    )
+
+
+def _init_analysis_worker(lexicon: Any) -> None:
+    global _WORKER_LEXICON
+    if lexicon is not None:
+        _WORKER_LEXICON = lexicon
+
+
+def _analyze_chunk(
+    chunk: List[ReviewRecordInput],
+    backend: str = BACKEND_PYTHON,
+    measure: bool = False,
+) -> List[Tuple[Any, ...]]:
+    """
+    Воркер: на каждый отзыв ("ok", compact[, замер]) / ("skip",) / ("error", текст, traceback).
+    """
+    out: List[Tuple[Any, ...]] = []
+    for outcome in _analyze_outcomes(chunk, _WORKER_LEXICON, backend, measure):
+        if outcome[0] == "error":
+            e = outcome[1]
+            out.append(("error", str(e), "".join(traceback.format_exception(e))))
+        elif outcome[1] is None:
+            out.append(("skip",))
+        else:
+            out.append(("ok", _compact_result(outcome[1])) + outcome[2:])
+    return out
+
+
+def _chunk_records(records: List[ReviewRecordInput], workers: int) -> List[List[ReviewRecordInput]]:
+    """
+    Пачки примерно равного суммарного объёма текста (время анализа
+    растёт с длиной отзыва), не больше _MAX_CHUNK_REVIEWS отзывов.
+    """
+    total_chars = sum(len(rec.text or "") for rec in records) or 1
+    budget = max(1, total_chars // (workers * _CHUNKS_PER_WORKER))
+    chunks: List[List[ReviewRecordInput]] = []
+    current: List[ReviewRecordInput] = []
+    size = 0
+    for rec in records:
+        current.append(rec)
+        size += len(rec.text or "")
+        if size >= budget or len(current) >= _MAX_CHUNK_REVIEWS:
+            chunks.append(current)
+            current, size = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _AnalysisPool:
+    """
+    Пул процессов на время одного прогона iter_analyze_reviews:
+    создаётся при первой пачке, которой он нужен, закрывается в close().
+    """
+
+    def __init__(self, lexicon: Any, workers: int) -> None:
+        self.lexicon = lexicon
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._fork = "fork" in multiprocessing.get_all_start_methods()
+
+    def _ensure_pool(self, records: List[ReviewRecordInput]) -> ProcessPoolExecutor:
+        global _WORKER_LEXICON
+        if self._fork:
+            # воркеры форкаются по мере надобности — лексикон и нужные языки
+            # должны быть готовы в родителе до этого
+            preload = getattr(self.lexicon, "preload", None)
+            if preload is not None:
+                preload({rec.lang for rec in records})
+        if self._pool is None:
+            if self._fork:
+                _WORKER_LEXICON = self.lexicon
+                ctx = multiprocessing.get_context("fork")
+                initargs: Tuple[Any, ...] = (None,)
+            else:
+                ctx = multiprocessing.get_context()
+                initargs = (self.lexicon,)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=ctx,
+                initializer=_init_analysis_worker,
+                initargs=initargs,
+            )
+        return self._pool
+
+    def outcomes(
+        self,
+        records: List[ReviewRecordInput],
+        workers: int,
+        backend: str = BACKEND_PYTHON,
+        measure: bool = False,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Исходы анализа по records (в том же порядке), как у _analyze_chunk,
+        но "ok" уже с собранным ReviewAnalysisResult.
+        """
+        pool = self._ensure_pool(records)
+        chunks = _chunk_records(records, workers)
+        LOG.info("Анализ в %d процессах: %d отзывов, %d пачек", workers, len(records), len(chunks))
+        analyze = partial(_analyze_chunk, backend=backend, measure=measure)
+        for chunk, outcomes in zip(chunks, pool.map(analyze, chunks)):
+            for rec, outcome in zip(chunk, outcomes):
+                if outcome[0] == "ok":
+                    yield ("ok", _expand_result(rec, outcome[1])) + outcome[2:]
+                else:
+                    yield outcome
+
+    def close(self) -> None:
+        global _WORKER_LEXICON
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        _WORKER_LEXICON = None
+
+
+DEFAULT_ANALYSIS_BATCH_SIZE = 2000
+
+# что возвращает analyze_reviews_bulk: список результатов или матрицы (раздел 6a)
+OUTPUT_RESULTS = "results"
+OUTPUT_MATRICES = "matrices"
+ANALYSIS_OUTPUTS = (OUTPUT_RESULTS, OUTPUT_MATRICES)
+
+
+def iter_analyze_reviews(
+    records: Iterable[ReviewRecordInput],
+    lexicon: Any,
+    batch_size: int = DEFAULT_ANALYSIS_BATCH_SIZE,
+    cache: Optional[Any] = None,
+    workers: Optional[int] = None,
+    backend: Optional[str] = None,
+    slow_log: Optional[SlowReviewLog] = None,
+) -> Iterator[List["ReviewAnalysisResult"]]:
+    """
+    Потоковый вариант analyze_reviews_bulk: читает records (любой iterable,
+    в том числе генератор) пачками по batch_size и отдаёт результаты
+    пачками в исходном порядке. В памяти одновременно — одна пачка,
+    поэтому пиковое потребление зависит от batch_size, а не от объёма истории.
+
+    Правила пропуска, кэш результатов, пул процессов и логирование ошибок —
+    как в analyze_reviews_bulk (счётчик "первых 10 стеков" общий на весь
+    прогон, пул процессов — один на весь прогон). Пустые пачки
+    (все отзывы упали) не отдаются.
+
+    backend: "python" — поштучно (analyze_single_review), "pandas" —
+    векторно по всей пачке (см. _analyze_records_frame); None — из
+    REVIEWS_ANALYSIS_BACKEND. Результаты у бэкендов одинаковые.
+
+    slow_log: SlowReviewLog — замерять каждый проанализированный отзыв и
+    держать в журнале самые медленные (только бэкенд "python").
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if workers is None:
+        workers = analysis_workers_from_env()
+    if backend is None:
+        backend = analysis_backend_from_env()
+    elif backend not in ANALYSIS_BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {ANALYSIS_BACKENDS}")
+
+    error_shown = 0  # чтобы не заспамить лог
+    from_cache = 0
+    analyzed = 0
+    degraded = 0
+    pool = _AnalysisPool(lexicon, workers) if workers > 1 else None
+    measure = slow_log is not None
+
+    it = iter(records)
+    try:
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                break
+
+            cached_results: List[Optional[ReviewAnalysisResult]] = [None] * len(batch)
+            if cache is not None:
+                try:
+                    cached_results = cache.lookup(batch, lexicon)
+                except Exception as e:
+                    LOG.warning("Кэш результатов недоступен, анализируем всё заново: %s", e)
+            from_cache += sum(1 for c in cached_results if c is not None)
+
+            todo = [rec for rec, cached in zip(batch, cached_results) if cached is None]
+            if measure and pool is None:
+                # иначе в журнал попадут отзывы, на которых грузился язык
+                preload = getattr(lexicon, "preload", None)
+                if preload is not None:
+                    preload({rec.lang for rec in todo})
+            batch_workers = min(workers, len(todo) // _MIN_REVIEWS_PER_WORKER)
+            if pool is not None and batch_workers > 1:
+                outcomes = pool.outcomes(todo, batch_workers, backend, measure)
+            else:
+                outcomes = _analyze_outcomes(todo, lexicon, backend, measure)
+
+            results: List[ReviewAnalysisResult] = []
+            fresh: List[Tuple[ReviewRecordInput, ReviewAnalysisResult]] = []
+            for rec, cached in zip(batch, cached_results):
+                if cached is not None:
+                    results.append(cached)
+                    continue
+                outcome = next(outcomes)
+
+                if outcome[0] == "error":
+                    e, tb = outcome[1], outcome[2]
+                    if error_shown < 10:
+                        if tb is None:
+                            LOG.exception(
+                                "Ошибка при анализе отзыва %s: %s",
+                                getattr(rec, "review_id", "?"),
+                                e,
+                                exc_info=e,
+                            )
+                        else:
+                            # трейсбек из процесса-воркера
+                            LOG.error(
+                                "Ошибка при анализе отзыва %s: %s\n%s",
+                                getattr(rec, "review_id", "?"),
+                                e,
+                                tb.rstrip(),
+                            )
+                        error_shown += 1
+                    else:
+                        # дальше только короткий debug, чтобы не было 3000 стеков
+                        LOG.debug(
+                            "Ошибка при анализе отзыва %s (подавлена после первых 10).",
+                            getattr(rec, "review_id", "?"),
+                        )
+                    continue
+
+                res = outcome[1] if outcome[0] == "ok" else None
+                if res is None:
+                    # analyze_single_review сам решил пропустить запись
+                    continue
+
+                # НИКАКОГО доп. фильтра по аспектам/темам здесь не делаем
+                results.append(res)
+                fresh.append((rec, res))
+                if slow_log is not None and len(outcome) > 2:
+                    slow_log.offer(rec, res, *outcome[2])
+                if res.degraded:
+                    _count_degraded(res.degraded)
+                    degraded += 1
+                    LOG.log(
+                        logging.WARNING if degraded <= 10 else logging.DEBUG,
+                        "Отзыв %s (%d символов) разобран не целиком: сработал бюджет (%s)",
+                        getattr(rec, "review_id", "?"), len(rec.text or ""), res.degraded,
+                    )
+
+            analyzed += len(fresh)
+            if cache is not None and fresh:
+                try:
+                    cache.store(fresh, lexicon)
+                except Exception as e:
+                    LOG.warning("Не удалось сохранить результаты в кэш: %s", e)
+
+            if results:
+                yield results
+    finally:
+        if pool is not None:
+            pool.close()
+
+    if cache is not None:
+        LOG.info("Кэш результатов: из кэша %d, проанализировано %d", from_cache, analyzed)
+    if degraded:
+        LOG.info("Бюджет на отзыв сработал для %d отзывов: %s", degraded, budget_stats())
+
+    sentence_cache = sentence_cache_for(lexicon)
+    if sentence_cache is not None and pool is None:
+        st = sentence_cache.stats()
+        LOG.info(
+            "Кэш предложений: hit-rate %.1f%% (hits=%d, misses=%d), evictions=%d, size=%d/%d",
+            st["hit_rate"] * 100, st["hits"], st["misses"], st["evictions"], st["size"], st["maxsize"],
+        )
+
+
 def analyze_reviews_bulk(
-    records: List[ReviewRecordInput],
+    records: "List[ReviewRecordInput] | ReviewBatch",
     lexicon: Any,
-) -> List["ReviewAnalysisResult"]:
+    cache: Optional[Any] = None,
+    workers: Optional[int] = None,
+    backend: Optional[str] = None,
+    output: str = OUTPUT_RESULTS,
+    slow_log: Optional[SlowReviewLog] = None,
+) -> Any:
     """
     Анализирует набор отзывов.
 
@@ -569,41 +2057,104 @@ def analyze_reviews_bulk(
     - Не отбрасываем отзывы без аспектов/тем — для истории нам нужен каждый отзыв,
       даже если лексический модуль не нашёл ни одного совпадения.
     - Единственное, что пропускаем: явные ошибки анализа (исключения) или res=None.
+
+    records:
+        список ReviewRecordInput или ReviewBatch (колоночная пачка,
+        записи создаются по ходу анализа).
+
+    cache:
+        персистентный кэш результатов (reviews_cache.ReviewResultCache или
+        любой объект с lookup(records, lexicon) / store(pairs, lexicon)).
+        Отзывы, найденные в кэше, не анализируются заново; свежие
+        результаты дописываются в кэш.
+
+    workers:
+        число процессов (None — из REVIEWS_ANALYSIS_WORKERS, по умолчанию 1).
+        Порядок результатов и логирование ошибок — как в однопроцессном
+        режиме. Лексикон должен переживать pickle, если на платформе
+        нет fork.
+
+    backend:
+        "python" / "pandas" (векторный), None — из REVIEWS_ANALYSIS_BACKEND.
+
+    output:
+        "results" — список ReviewAnalysisResult; "matrices" — AnalysisMatrices
+        (см. build_analysis_matrices, словари колонок — по лексикону).
+
+    slow_log:
+        SlowReviewLog — куда складывать самые медленные отзывы прогона
+        (см. slow_log_from_env / publish_slow_log).
+
+    Для больших объёмов см. iter_analyze_reviews (пачками, с ограниченной памятью).
     """
+    if output not in ANALYSIS_OUTPUTS:
+        raise ValueError(f"Unknown output {output!r}, expected one of {ANALYSIS_OUTPUTS}")
     results: List["ReviewAnalysisResult"] = []
-    if not records:
-        return results
+    if records:
+        for batch in iter_analyze_reviews(
+            records, lexicon, batch_size=len(records), cache=cache, workers=workers, backend=backend,
+            slow_log=slow_log,
+        ):
+            results.extend(batch)
+    if output == OUTPUT_MATRICES:
+        return build_analysis_matrices(results, lexicon)
+    return results
 
-    error_shown = 0  # чтобы не заспамить лог
 
-    for rec in records:
-        try:
-            res = analyze_single_review(rec, lexicon)
-        except Exception as e:
-            if error_shown < 10:
-                LOG.exception(
-                    "Ошибка при анализе отзыва %s: %s",
-                    getattr(rec, "review_id", "?"),
-                    e,
-                )
-                error_shown += 1
-            else:
-                # дальше только короткий debug, чтобы не было 3000 стеков
-                LOG.debug(
-                    "Ошибка при анализе отзыва %s (подавлена после первых 10).",
-                    getattr(rec, "review_id", "?"),
-                )
-            continue
 
-        if res is None:
-            # analyze_single_review сам решил пропустить запись
-            continue
+REVIEWS_DF_COLUMNS = [
+    "review_id","source","created_at","week_key","rating10",
+    "sentiment_overall","sentiment_score","lang","topics","aspects","raw_text",
+    "degraded",
+]
+ASPECTS_DF_COLUMNS = [
+    "review_id","aspect_code","topic_key","subtopic_key",
+    "display_short","long_hint","polarity_hint",
+    "created_at","week_key","source","rating10",
+    "sentiment_overall","lang",
+]
 
-        # НИКАКОГО доп. фильтра по аспектам/темам здесь не делаем
-        results.append(res)
 
-    return results
+# Колонки-перечисления отдаём как pandas categorical: меньше памяти и быстрее
+# groupby/merge/сравнения. Для известных словарей значений категории
+# фиксированы (плюс всё неожиданное, что встретилось в данных), чтобы
+# fillna("neutral") и сравнения со значением, которого нет в срезе, работали.
+# ВАЖНО для кода ниже по течению: groupby по этим колонкам — с observed=True,
+# иначе в результат попадут пустые группы по всем категориям.
+_SENTIMENT_CATEGORIES = ("positive", "negative", "neutral", "mixed")
+_POLARITY_CATEGORIES = ("positive", "negative", "neutral")
+
+REVIEWS_CATEGORICAL = {
+    "source": (),
+    "week_key": (),
+    "sentiment_overall": _SENTIMENT_CATEGORIES,
+    "lang": (),
+}
+ASPECTS_CATEGORICAL = {
+    "aspect_code": (),
+    "topic_key": (),
+    "polarity_hint": _POLARITY_CATEGORIES,
+    "week_key": (),
+    "source": (),
+    "sentiment_overall": _SENTIMENT_CATEGORIES,
+    "lang": (),
+}
+
+
+def _as_category(values: Any, base: Tuple[str, ...] = ()) -> pd.Categorical:
+    """
+    values -> Categorical с категориями base + остальные встреченные (по алфавиту).
+    """
+    seen = pd.unique(pd.Series(values, dtype=object).dropna())
+    extra = sorted((v for v in seen if v not in base), key=str)
+    return pd.Categorical(values, categories=list(base) + extra)
+
 
+def _categorize(df: pd.DataFrame, spec: Dict[str, Tuple[str, ...]]) -> pd.DataFrame:
+    for col, base in spec.items():
+        if col in df.columns:
+            df[col] = _as_category(df[col].astype(object).to_numpy(), base)
+    return df
 
 
 def build_reviews_dataframe(
@@ -626,34 +2177,57 @@ def build_reviews_dataframe(
     aspects:
         список кодов аспектов, сработавших в отзыве.
         (уникализируем коды на уровне отзыва, чтобы не плодить дубликаты).
-    """
-    rows: List[Dict[str, Any]] = []
-
-    for r in analyzed_reviews:
-        topics_list = sorted(list(r.topic_hits))
-        aspects_list = sorted({a.aspect_code for a in r.aspects})
-
-        rows.append({
-            "review_id": r.review_id,
-            "source": r.source,
-            "created_at": r.created_at,
-            "week_key": r.week_key,
-            "rating10": r.rating10,
-            "sentiment_overall": r.sentiment_overall,
-            "lang": r.lang,
-            "topics": topics_list,
-            "aspects": aspects_list,
-            "raw_text": r.raw_text,
-            "sentiment_score": r.sentiment_score,
-        })
 
-    if not rows:
-        return pd.DataFrame(columns=[
-            "review_id","source","created_at","week_key","rating10",
-            "sentiment_overall","sentiment_score","lang","topics","aspects","raw_text",
-        ])
-
-    df = pd.DataFrame(rows)
+    degraded:
+        причины, по которым бюджет урезал анализ ("chars,time" и т.п.),
+        "" — отзыв разобран целиком.
+    """
+    reviews = analyzed_reviews if isinstance(analyzed_reviews, (list, tuple)) else list(analyzed_reviews)
+    n = len(reviews)
+    if not n:
+        return pd.DataFrame(columns=REVIEWS_DF_COLUMNS)
+
+    # колонки заполняем сразу, без промежуточного dict на строку
+    review_id: List[Any] = [None] * n
+    source: List[Any] = [None] * n
+    created_at: List[Any] = [None] * n
+    week_key: List[Any] = [None] * n
+    rating10: List[Any] = [None] * n
+    sentiment_overall: List[Any] = [None] * n
+    lang: List[Any] = [None] * n
+    topics: List[Any] = [None] * n
+    aspects: List[Any] = [None] * n
+    raw_text: List[Any] = [None] * n
+    sentiment_score: List[Any] = [None] * n
+    degraded: List[Any] = [None] * n
+    for i, r in enumerate(reviews):
+        review_id[i] = r.review_id
+        source[i] = r.source
+        created_at[i] = r.created_at
+        week_key[i] = r.week_key
+        rating10[i] = r.rating10
+        sentiment_overall[i] = r.sentiment_overall
+        lang[i] = r.lang
+        topics[i] = sorted(r.topic_hits)
+        aspects[i] = sorted({a.aspect_code for a in r.aspects})
+        raw_text[i] = r.raw_text
+        sentiment_score[i] = r.sentiment_score
+        degraded[i] = r.degraded or ""
+
+    df = pd.DataFrame({
+        "review_id": review_id,
+        "source": _as_category(source, REVIEWS_CATEGORICAL["source"]),
+        "created_at": pd.Series(created_at, dtype=object),
+        "week_key": _as_category(week_key, REVIEWS_CATEGORICAL["week_key"]),
+        "rating10": rating10,
+        "sentiment_overall": _as_category(sentiment_overall, REVIEWS_CATEGORICAL["sentiment_overall"]),
+        "lang": _as_category(lang, REVIEWS_CATEGORICAL["lang"]),
+        "topics": pd.Series(topics, dtype=object),
+        "aspects": pd.Series(aspects, dtype=object),
+        "raw_text": raw_text,
+        "sentiment_score": sentiment_score,
+        "degraded": degraded,
+    })
     return df
 
 
@@ -684,36 +2258,110 @@ def build_aspects_dataframe(
         sentiment_overall (тональность целого отзыва)
         lang
     """
-    rows: List[Dict[str, Any]] = []
+    hits = [a for r in analyzed_reviews for a in r.aspects]
+    if not hits:
+        return pd.DataFrame(columns=ASPECTS_DF_COLUMNS)
+
+    # колонки заполняем сразу, без промежуточного dict на строку;
+    # поля хита читаем напрямую из его кортежа совпадения и метаданных отзыва
+    n = len(hits)
+    columns: Dict[str, List[Any]] = {name: [None] * n for name in ASPECTS_DF_COLUMNS}
+    c_review_id, c_created_at, c_week_key = columns["review_id"], columns["created_at"], columns["week_key"]
+    c_source, c_rating10 = columns["source"], columns["rating10"]
+    c_sentiment, c_lang = columns["sentiment_overall"], columns["lang"]
+    c_match = [columns[name] for name in (
+        "aspect_code", "topic_key", "subtopic_key", "display_short", "long_hint", "polarity_hint",
+    )]
+    for i, a in enumerate(hits):
+        meta = a._meta
+        c_review_id[i] = meta.review_id
+        c_created_at[i] = meta.created_at
+        c_week_key[i] = meta.week_key
+        c_source[i] = meta.source
+        c_rating10[i] = meta.rating10
+        c_sentiment[i] = meta.sentiment_overall
+        c_lang[i] = meta.lang
+        for col, value in zip(c_match, a._match):
+            col[i] = value
+
+    data: Dict[str, Any] = {}
+    for name in ASPECTS_DF_COLUMNS:
+        if name in ASPECTS_CATEGORICAL:
+            data[name] = _as_category(columns[name], ASPECTS_CATEGORICAL[name])
+        elif name == "created_at":
+            data[name] = pd.Series(columns[name], dtype=object)
+        else:
+            data[name] = columns[name]
+    return pd.DataFrame(data)
+
+
+class AnalysisFramesBuilder:
+    """
+    Инкрементальная сборка build_reviews_dataframe / build_aspects_dataframe
+    по пачкам из iter_analyze_reviews:
+
+        builder = AnalysisFramesBuilder()
+        for batch in iter_analyze_reviews(records, lexicon):
+            builder.add(batch)
+        df_reviews = builder.reviews_frame()
+
+    Каждая пачка сразу превращается в небольшие DataFrame'ы, сами
+    ReviewAnalysisResult не копятся. sink(df_reviews_part, df_aspects_part) —
+    если задан, части уходят в него (запись в файл/таблицу) и в памяти
+    не остаются вовсе; reviews_frame()/aspects_frame() тогда пустые.
+    reviews/aspects=False — не собирать соответствующую таблицу.
+    """
 
-    for r in analyzed_reviews:
-        for a in r.aspects:
-            rows.append({
-                "review_id": a.review_id,
-                "aspect_code": a.aspect_code,
-                "topic_key": a.topic_key,
-                "subtopic_key": a.subtopic_key,
-                "display_short": a.display_short,
-                "long_hint": a.long_hint,
-                "polarity_hint": a.polarity_hint,
-                "created_at": a.created_at,
-                "week_key": a.week_key,
-                "source": a.source,
-                "rating10": a.rating10,
-                "sentiment_overall": a.sentiment_overall,
-                "lang": a.lang,
-            })
-
-    if not rows:
-        return pd.DataFrame(columns=[
-            "review_id","aspect_code","topic_key","subtopic_key",
-            "display_short","long_hint","polarity_hint",
-            "created_at","week_key","source","rating10",
-            "sentiment_overall","lang",
-        ])
+    def __init__(
+        self,
+        reviews: bool = True,
+        aspects: bool = True,
+        sink: Optional[Any] = None,
+    ) -> None:
+        self.reviews = reviews
+        self.aspects = aspects
+        self.sink = sink
+        self.rows_reviews = 0
+        self.rows_aspects = 0
+        self._reviews_parts: List[pd.DataFrame] = []
+        self._aspects_parts: List[pd.DataFrame] = []
+
+    def add(self, batch: Iterable[ReviewAnalysisResult]) -> None:
+        batch = list(batch)
+        df_reviews = build_reviews_dataframe(batch) if self.reviews else None
+        df_aspects = build_aspects_dataframe(batch) if self.aspects else None
+        self.rows_reviews += len(df_reviews) if df_reviews is not None else 0
+        self.rows_aspects += len(df_aspects) if df_aspects is not None else 0
+        if self.sink is not None:
+            self.sink(df_reviews, df_aspects)
+            return
+        if df_reviews is not None and len(df_reviews):
+            self._reviews_parts.append(df_reviews)
+        if df_aspects is not None and len(df_aspects):
+            self._aspects_parts.append(df_aspects)
+
+    @staticmethod
+    def _concat(
+        parts: List[pd.DataFrame],
+        columns: List[str],
+        spec: Dict[str, Tuple[str, ...]],
+    ) -> pd.DataFrame:
+        if not parts:
+            return pd.DataFrame(columns=columns)
+        if len(parts) == 1:
+            return parts[0]
+        # infer_objects: колонка, пустая (None) в одной пачке и числовая в
+        # другой, получает тот же dtype, что и при сборке одним DataFrame;
+        # категории у пачек разные — после concat собираем их заново
+        df = pd.concat(parts, ignore_index=True).infer_objects()
+        return _categorize(df, spec)
+
+    def reviews_frame(self) -> pd.DataFrame:
+        return self._concat(self._reviews_parts, REVIEWS_DF_COLUMNS, REVIEWS_CATEGORICAL)
+
+    def aspects_frame(self) -> pd.DataFrame:
+        return self._concat(self._aspects_parts, ASPECTS_DF_COLUMNS, ASPECTS_CATEGORICAL)
 
-    df = pd.DataFrame(rows)
-    return df
 
 def compute_aspect_impacts(
     df_reviews_period: "pd.DataFrame",
@@ -818,7 +2466,7 @@ def compute_aspect_impacts(
     value_cols = ["review_id", "is_pos_hit", "is_neg_hit", "w_pos", "w_neg", "hi", "lo"]
 
     agg = (
-        m.groupby(group_cols, dropna=False)[value_cols]
+        m.groupby(group_cols, dropna=False, observed=True)[value_cols]
         .apply(_agg)
         .reset_index()
     )
@@ -832,6 +2480,223 @@ def compute_aspect_impacts(
 
     return agg
 
+# -----------------------------------------------------------------------------
+# 6a. Матричный вывод (NumPy)
+#
+# analyze_reviews_bulk(..., output="matrices") / build_analysis_matrices —
+# результаты пачки как массивы: флаги корзин тональности (review × bucket),
+# разреженные инциденции review × aspect и review × subtopic (CSR: indptr /
+# indices / data) и словари id <-> код. Строка i — i-й результат в исходном
+# порядке. Для агрегатов (скоры, частоты, совместная встречаемость) без
+# объектов и merge'ей.
+# -----------------------------------------------------------------------------
+
+@dataclass
+class CSRIncidence:
+    """
+    Разреженная матрица n_rows × n_cols в формате CSR (как scipy.sparse):
+    колонки строки i — indices[indptr[i]:indptr[i + 1]] (по возрастанию),
+    data — число хитов в ячейке.
+    """
+    indptr: np.ndarray   # int64, длина n_rows + 1
+    indices: np.ndarray  # int32
+    data: np.ndarray     # int32
+    n_cols: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n_rows, self.n_cols)
+
+    def row_ids(self) -> np.ndarray:
+        """Номер строки для каждого ненулевого элемента (COO-вид)."""
+        return np.repeat(np.arange(self.n_rows, dtype=np.int64), np.diff(self.indptr))
+
+    def to_dense(self) -> np.ndarray:
+        """Плотная булева матрица (есть хит / нет)."""
+        out = np.zeros(self.shape, dtype=bool)
+        out[self.row_ids(), self.indices] = True
+        return out
+
+    def column_counts(self) -> np.ndarray:
+        """В скольких строках встречается каждая колонка."""
+        return np.bincount(self.indices, minlength=self.n_cols)
+
+    def cooccurrence(self) -> np.ndarray:
+        """
+        n_cols × n_cols: в скольких строках встретились обе колонки
+        (на диагонали — column_counts), int64.
+
+        Плотную n_rows × n_cols не строим: со scipy — m.T @ m по разреженной
+        матрице, без него — пары колонок внутри каждой строки (колонки строки
+        уникальны, пар на строку — квадрат числа её хитов) через bincount.
+        """
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError:
+            csr_matrix = None
+        if csr_matrix is not None:
+            ones = np.ones(len(self.indices), dtype=np.int64)
+            m = csr_matrix((ones, self.indices, self.indptr), shape=self.shape)
+            return np.asarray((m.T @ m).toarray(), dtype=np.int64)
+
+        lengths = np.diff(self.indptr)
+        sizes = lengths * lengths
+        total = int(sizes.sum())
+        # для каждой пары: её строка, номер пары внутри строки -> (i, j)
+        pair_row = np.repeat(np.arange(self.n_rows, dtype=np.int64), sizes)
+        pair_starts = np.cumsum(sizes) - sizes
+        offset = np.arange(total, dtype=np.int64) - pair_starts[pair_row]
+        k = lengths[pair_row]
+        start = self.indptr[:-1][pair_row]
+        a = self.indices[start + offset // k].astype(np.int64)
+        b = self.indices[start + offset % k].astype(np.int64)
+        counts = np.bincount(a * self.n_cols + b, minlength=self.n_cols * self.n_cols)
+        return counts.reshape(self.n_cols, self.n_cols)
+
+    def to_scipy(self) -> Any:
+        """scipy.sparse.csr_matrix (scipy — опциональная зависимость)."""
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+@dataclass
+class AnalysisMatrices:
+    """
+    review_ids / rating10 (NaN — нет оценки) — по строкам.
+
+    sentiment:
+        bool, review × bucket, колонки — bucket_codes (SENTIMENT_BUCKETS).
+    aspects:
+        review × aspect, колонки — aspect_codes; aspect_polarity — polarity_hint
+        аспекта по тем же колонкам.
+    topics:
+        review × subtopic (topic_hits отзыва), колонки — topic_keys
+        ((topic_key, subtopic_key)).
+    """
+    review_ids: List[str]
+    rating10: np.ndarray
+    bucket_codes: Tuple[str, ...]
+    sentiment: np.ndarray
+    aspect_codes: List[str]
+    aspect_polarity: np.ndarray
+    aspects: CSRIncidence
+    topic_keys: List[Tuple[str, str]]
+    topics: CSRIncidence
+
+    def aspect_index(self) -> Dict[str, int]:
+        return {code: i for i, code in enumerate(self.aspect_codes)}
+
+    def topic_index(self) -> Dict[Tuple[str, str], int]:
+        return {key: i for i, key in enumerate(self.topic_keys)}
+
+    def sentiment_scores(self) -> np.ndarray:
+        """
+        sentiment_score всех отзывов разом — та же формула, что
+        _score_from_flags_and_rating.
+        """
+        col = {b: i for i, b in enumerate(self.bucket_codes)}
+
+        def flag(bucket: str) -> np.ndarray:
+            i = col.get(bucket)
+            return self.sentiment[:, i] if i is not None else np.zeros(len(self.review_ids), dtype=bool)
+
+        pos = np.where(flag("positive_strong"), 1.0, 0.0) + np.where(flag("positive_soft"), 0.6, 0.0)
+        neg = np.where(flag("negative_strong"), 1.0, 0.0) + np.where(flag("negative_soft"), 0.6, 0.0)
+        text_score = np.clip(pos - neg, -1.0, 1.0)
+        rating_norm = np.clip((self.rating10 - 5.5) / 4.5, -1.0, 1.0)
+        rated = np.round(0.6 * text_score + 0.4 * rating_norm, 4)
+        return np.where(np.isnan(self.rating10), text_score, rated)
+
+
+def _csr_from_rows(rows: List[Dict[int, int]], n_cols: int) -> CSRIncidence:
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=indptr[1:])
+    indices = np.empty(int(indptr[-1]), dtype=np.int32)
+    data = np.empty(int(indptr[-1]), dtype=np.int32)
+    pos = 0
+    for row in rows:
+        for col in sorted(row):
+            indices[pos] = col
+            data[pos] = row[col]
+            pos += 1
+    return CSRIncidence(indptr=indptr, indices=indices, data=data, n_cols=n_cols)
+
+
+def build_analysis_matrices(
+    analyzed_reviews: Iterable[ReviewAnalysisResult],
+    lexicon: Optional[Any] = None,
+) -> AnalysisMatrices:
+    """
+    Результаты анализа -> AnalysisMatrices. Словари колонок: если задан
+    lexicon — все аспекты (aspect_rules) и подтемы (topic_schema) в порядке
+    лексикона, так что матрицы разных прогонов сопоставимы по колонкам;
+    иначе — в порядке первого появления. Коды, которых нет в лексиконе,
+    дописываются в конец.
+    """
+    reviews = analyzed_reviews if isinstance(analyzed_reviews, (list, tuple)) else list(analyzed_reviews)
+    n = len(reviews)
+
+    aspect_ids: Dict[str, int] = {}
+    aspect_polarity: List[str] = []
+    topic_ids: Dict[Tuple[str, str], int] = {}
+    if lexicon is not None:
+        for code, rule in lexicon.aspect_rules.items():
+            aspect_ids[code] = len(aspect_ids)
+            aspect_polarity.append(rule.polarity_hint)
+        for topic_key, topic in lexicon.topic_schema.items():
+            for subtopic_key in topic.get("subtopics", {}):
+                topic_ids[(topic_key, subtopic_key)] = len(topic_ids)
+
+    bucket_codes = tuple(_SENTIMENT_BUCKETS)
+    sentiment = np.zeros((n, len(bucket_codes)), dtype=bool)
+    rating10 = np.full(n, np.nan)
+    review_ids: List[str] = [""] * n
+    aspect_rows: List[Dict[int, int]] = [{}] * n
+    topic_rows: List[Dict[int, int]] = [{}] * n
+    for i, r in enumerate(reviews):
+        review_ids[i] = r.review_id
+        if r.rating10 is not None:
+            rating10[i] = r.rating10
+        detail = r.sentiment_detail
+        for j, bucket in enumerate(bucket_codes):
+            if detail.get(bucket):
+                sentiment[i, j] = True
+
+        row: Dict[int, int] = {}
+        for a in r.aspects:
+            code = a.aspect_code
+            col = aspect_ids.get(code)
+            if col is None:
+                col = aspect_ids[code] = len(aspect_ids)
+                aspect_polarity.append(a.polarity_hint)
+            row[col] = row.get(col, 0) + 1
+        aspect_rows[i] = row
+
+        row = {}
+        for key in r.topic_hits:
+            col = topic_ids.get(key)
+            if col is None:
+                col = topic_ids[key] = len(topic_ids)
+            row[col] = 1
+        topic_rows[i] = row
+
+    return AnalysisMatrices(
+        review_ids=review_ids,
+        rating10=rating10,
+        bucket_codes=bucket_codes,
+        sentiment=sentiment,
+        aspect_codes=list(aspect_ids),
+        aspect_polarity=np.asarray(aspect_polarity, dtype=object),
+        aspects=_csr_from_rows(aspect_rows, len(aspect_ids)),
+        topic_keys=list(topic_ids),
+        topics=_csr_from_rows(topic_rows, len(topic_ids)),
+    )
+
 # -----------------------------------------------------------------------------
 # 7. Публичный API этого модуля
 # -----------------------------------------------------------------------------
@@ -839,15 +2704,25 @@ def compute_aspect_impacts(
 __all__ = [
     # датаклассы
     "ReviewRecordInput",
+    "ReviewBatch",
     "AspectHit",
     "ReviewAnalysisResult",
+    "ReviewBudget",
+    "SlowReview",
+    "SlowReviewLog",
     # функции анализа
     "analyze_single_review",
     "analyze_reviews_bulk",
+    "iter_analyze_reviews",
+    "AnalysisFramesBuilder",
     # функции агрегации в датафреймы
     "build_reviews_dataframe",
     "build_aspects_dataframe",
     "slice_periods",
     "build_source_pivot",
     "compute_aspect_impacts",
+    # матричный вывод
+    "AnalysisMatrices",
+    "CSRIncidence",
+    "build_analysis_matrices",
 ]
@@ -0,0 +1,335 @@
+# agent/reviews_daemon.py
+"""
+Долгоживущий демон анализа отзывов с «тёплым» лексиконом.
+
+Разовый анализ из скрипта платит за старт Python и компиляцию лексикона;
+демон делает это один раз (все языки загружены, кэш предложений в памяти)
+и отвечает на запросы по HTTP — на localhost или через Unix-сокет.
+Только стандартная библиотека (http.server).
+
+Эндпоинты (JSON):
+    GET  /health          — состояние, отпечаток лексикона, счётчики запросов
+    POST /analyze         — один отзыв: {"text": ..., "lang": ..., "rating10": ...,
+                            "created_at": "YYYY-MM-DD", "source": ..., "review_id": ...}
+                            (обязателен только text; без lang — по письменности текста)
+    POST /analyze/batch   — {"reviews": [отзыв, ...]} -> {"results": [...], "failed": [review_id, ...]}
+
+Анализ идёт под одним локом: параллельные запросы обслуживаются по
+очереди, /health отвечает и во время длинной пачки.
+
+Запуск:
+    python -m agent.reviews_daemon --port 8765
+    python -m agent.reviews_daemon --socket /tmp/reviews.sock
+    curl -s localhost:8765/analyze -d '{"text": "Отличный завтрак", "lang": "ru"}'
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import logging
+import math
+import os
+import socketserver
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from . import reviews_core, reviews_cache
+from .lexicon_module import get_default_lexicon, script_lang
+from .reviews_core import ReviewAnalysisResult, ReviewRecordInput
+
+LOG = logging.getLogger("reviews_daemon")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# больше — 413: демон для точечных запросов, не для бэкфилла
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_BATCH_REVIEWS = 20000
+
+
+class RequestError(ValueError):
+    """Некорректный запрос — отвечаем status (по умолчанию 400) с текстом ошибки."""
+
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# -----------------------------------------------------------------------------
+# JSON <-> типы ядра
+# -----------------------------------------------------------------------------
+
+def record_from_json(item: Any) -> ReviewRecordInput:
+    """
+    Отзыв из JSON. Без review_id — "adhoc:<дайджест входа>": одинаковый
+    вход между запросами и перезапусками получает тот же id, поэтому
+    в общем кэше результатов такие записи не затирают друг друга.
+    """
+    if not isinstance(item, dict):
+        raise RequestError("review must be a JSON object")
+    text = item.get("text")
+    if not isinstance(text, str):
+        raise RequestError("review.text must be a string")
+    created_at = item.get("created_at") or date.today().isoformat()
+    try:
+        created = date.fromisoformat(str(created_at)[:10])
+    except ValueError:
+        raise RequestError(f"review.created_at must be YYYY-MM-DD, got {created_at!r}")
+    rating10 = item.get("rating10")
+    if rating10 is not None:
+        try:
+            rating10 = float(rating10)
+        except (TypeError, ValueError):
+            raise RequestError(f"review.rating10 must be a number, got {rating10!r}")
+        # NaN/Infinity json.loads пропускает, а в ответе они дают невалидный JSON
+        if not math.isfinite(rating10):
+            raise RequestError(f"review.rating10 must be finite, got {rating10!r}")
+    rec = ReviewRecordInput(
+        review_id=str(item.get("review_id") or ""),
+        source=str(item.get("source") or ""),
+        created_at=created,
+        rating10=rating10,
+        lang=str(item.get("lang") or script_lang(text, default="other")),
+        text=text,
+    )
+    if not rec.review_id:
+        rec = dataclasses.replace(rec, review_id=f"adhoc:{reviews_cache.input_digest(rec)[:16]}")
+    return rec
+
+
+def result_to_json(res: ReviewAnalysisResult) -> Dict[str, Any]:
+    return {
+        "review_id": res.review_id,
+        "source": res.source,
+        "created_at": res.created_at.isoformat(),
+        "week_key": res.week_key,
+        "rating10": res.rating10,
+        "lang": res.lang,
+        "sentiment_overall": res.sentiment_overall,
+        "sentiment_detail": res.sentiment_detail,
+        "sentiment_score": res.sentiment_score,
+        "topics": [list(pair) for pair in sorted(res.topic_hits)],
+        "aspects": [
+            {
+                "aspect_code": a.aspect_code,
+                "topic_key": a.topic_key,
+                "subtopic_key": a.subtopic_key,
+                "display_short": a.display_short,
+                "long_hint": a.long_hint,
+                "polarity_hint": a.polarity_hint,
+            }
+            for a in res.aspects
+        ],
+        "degraded": res.degraded,
+    }
+
+
+# -----------------------------------------------------------------------------
+# Сервис
+# -----------------------------------------------------------------------------
+
+class AnalysisService:
+    """
+    Лексикон (и кэш результатов, если задан) на весь срок жизни процесса.
+    """
+
+    def __init__(self, lexicon: Any = None, result_cache: Any = None) -> None:
+        self.lexicon = lexicon if lexicon is not None else get_default_lexicon()
+        self.result_cache = result_cache
+        self.started = time.time()
+        self.requests = 0
+        self.reviews = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> float:
+        """
+        Загрузить и скомпилировать все языки и прогнать по отзыву на
+        каждом, чтобы первый запрос не платил за ленивую инициализацию.
+        """
+        t0 = time.perf_counter()
+        langs = sorted({lang for by_lang in self.lexicon.rule_patterns().values() for lang in by_lang})
+        self.lexicon.preload(langs)
+        for lang in langs:
+            reviews_core.analyze_single_review(
+                ReviewRecordInput(review_id="warm-up", source="", created_at=date.today(),
+                                  rating10=None, lang=lang, text="warm up."),
+                self.lexicon,
+            )
+        elapsed = time.perf_counter() - t0
+        LOG.info("Лексикон прогрет за %.2fs: языки %s", elapsed, ", ".join(langs))
+        return elapsed
+
+    def analyze(self, items: List[Any]) -> Tuple[List[ReviewAnalysisResult], List[str]]:
+        """
+        (результаты в порядке items, review_id отзывов, упавших при анализе).
+        Упавшие ищем по review_id, поэтому повтор review_id в пачке — 400
+        (у ad-hoc отзывов повтор id — тот же вход и тот же исход).
+        """
+        records = [record_from_json(item) for item in items]
+        seen: Set[str] = set()
+        for item, rec in zip(items, records):
+            if not item.get("review_id"):
+                continue
+            if rec.review_id in seen:
+                raise RequestError(f"duplicate review_id {rec.review_id!r}")
+            seen.add(rec.review_id)
+        with self._lock:
+            t0 = time.perf_counter()
+            results = reviews_core.analyze_reviews_bulk(
+                records, self.lexicon, cache=self.result_cache, workers=1,
+            )
+            self.busy_seconds += time.perf_counter() - t0
+            self.requests += 1
+            self.reviews += len(records)
+        done = {res.review_id for res in results}
+        failed = [rec.review_id for rec in records if rec.review_id not in done]
+        return results, failed
+
+    def health(self) -> Dict[str, Any]:
+        cache = reviews_core.sentence_cache_for(self.lexicon)
+        return {
+            "status": "ok",
+            "lexicon": getattr(self.lexicon, "fingerprint", None),
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "reviews": self.reviews,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "sentence_cache": cache.stats() if cache is not None else None,
+            "result_cache": self.result_cache is not None,
+        }
+
+
+# -----------------------------------------------------------------------------
+# HTTP
+# -----------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "ReviewsDaemon/1"
+    protocol_version = "HTTP/1.1"
+    # ответы короткие — без Nagle keep-alive клиент не ждёт ~40 мс на ACK
+    disable_nagle_algorithm = True
+    service: AnalysisService  # задаётся в make_server
+
+    def address_string(self) -> str:
+        # у Unix-сокета client_address — пустая строка
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, fmt: str, *args: Any) -> None:
+        LOG.debug("%s %s", self.address_string(), fmt % args)
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Any:
+        raw_length = self.headers.get("Content-Length")
+        try:
+            length = int(raw_length) if raw_length is not None else -1
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            # тело не дочитываем — соединение после ответа закрываем
+            self.close_connection = True
+            if raw_length is None:
+                raise RequestError("Content-Length required")
+            if length < 0:
+                raise RequestError(f"invalid Content-Length {raw_length!r}")
+            raise RequestError(f"request body over {MAX_BODY_BYTES} bytes", status=413)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw or b"null")
+        except ValueError as e:
+            raise RequestError(f"invalid JSON: {e}")
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/health":
+            self._send(200, self.service.health())
+        else:
+            self._send(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        path = self.path.rstrip("/")
+        try:
+            if path == "/analyze":
+                results, failed = self.service.analyze([self._read_json()])
+                if failed:
+                    self._send(422, {"error": "analysis failed", "review_id": failed[0]})
+                else:
+                    self._send(200, result_to_json(results[0]))
+            elif path == "/analyze/batch":
+                body = self._read_json()
+                items = body.get("reviews") if isinstance(body, dict) else None
+                if not isinstance(items, list):
+                    raise RequestError("body must be {\"reviews\": [...]}")
+                if len(items) > MAX_BATCH_REVIEWS:
+                    raise RequestError(f"batch over {MAX_BATCH_REVIEWS} reviews", status=413)
+                results, failed = self.service.analyze(items)
+                self._send(200, {"results": [result_to_json(r) for r in results], "failed": failed})
+            else:
+                self._send(404, {"error": f"unknown path {self.path}"})
+        except RequestError as e:
+            self._send(e.status, {"error": str(e)})
+        except Exception as e:
+            LOG.exception("Ошибка обработки %s", self.path)
+            self._send(500, {"error": str(e)})
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    service: AnalysisService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    if socket_path:
+        # TCP_NODELAY к Unix-сокету не применим
+        handler = type("ReviewsHandler", (_Handler,), {"service": service, "disable_nagle_algorithm": False})
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return _UnixHTTPServer(socket_path, handler)
+    handler = type("ReviewsHandler", (_Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Демон анализа отзывов с прогретым лексиконом")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--socket", default=None, help="слушать Unix-сокет вместо TCP")
+    parser.add_argument("--result-cache", action="store_true",
+                        help=f"использовать SQLite-кэш результатов ({reviews_cache.RESULT_CACHE_PATH_ENV})")
+    args = parser.parse_args(argv)
+
+    result_cache = reviews_cache.get_default_result_cache() if args.result_cache else None
+    service = AnalysisService(result_cache=result_cache)
+    service.warm_up()
+
+    server = make_server(service, args.host, args.port, args.socket)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    LOG.info("Слушаем %s", where)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,8 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 import pandas as pd
 
 # Пакетный импорт из agent
-from .reviews_core import ReviewRecordInput
+from .reviews_core import ReviewBatch, ReviewRecordInput, _str_column
+from .lexicon_module import LATIN_LANG_CLASSES, SCRIPT_LANG_CLASSES
 
 
 
@@ -248,6 +249,29 @@ def _norm_lang(x: Any) -> str:
     return _LANG_MAP.get(s, "other")
 
 
+def detect_script_langs(texts: pd.Series, default: str = "other") -> pd.Series:
+    """
+    Язык по письменности для целой колонки текстов — векторный аналог
+    lexicon_module.script_lang: по каждому классу символов один проход
+    str.count / str.contains, побеждает преобладающая своя письменность
+    (кириллица, арабская, CJK), иначе турецкие буквы, иначе латиница.
+    Текст без букв этих письменностей -> default.
+    """
+    texts = texts.fillna("").astype(str)
+    out = pd.Series(default, index=texts.index, dtype=object)
+    if texts.empty:
+        return out
+    # латиница: идём с конца, чтобы более специфичный класс перекрыл общий
+    for lang, rx in reversed(LATIN_LANG_CLASSES):
+        out = out.mask(texts.str.contains(rx), lang)
+    counts = pd.DataFrame(
+        {lang: texts.str.count(rx) for lang, rx in SCRIPT_LANG_CLASSES},
+        index=texts.index,
+    )
+    own_script = counts.max(axis=1) > 0
+    return out.mask(own_script, counts.idxmax(axis=1))
+
+
 def read_reviews_xls(xls_bytes: bytes) -> pd.DataFrame:
     """
     Возвращает нормализованный DataFrame со стандартными колонками:
@@ -368,6 +392,12 @@ def read_reviews_xls(xls_bytes: bytes) -> pd.DataFrame:
     # фильтр пустых текстов
     df = df[df["text"].astype(str).str.strip().ne("")].copy()
 
+    # язык не распознан по колонке — определяем по письменности текста,
+    # иначе такие отзывы матчатся только английскими правилами
+    unknown = df["lang"].eq("other")
+    if unknown.any():
+        df.loc[unknown, "lang"] = detect_script_langs(df.loc[unknown, "text"])
+
     return df.reset_index(drop=True)
 
 
@@ -392,37 +422,40 @@ def make_review_id(source_code: str, author: str, dt: Optional[date], text: str)
     return f"{source_code}:{digest}"
 
 
+def df_to_batch(df: pd.DataFrame) -> ReviewBatch:
+    """
+    Нормализованный DataFrame (read_reviews_xls) -> ReviewBatch для ядра:
+    колонки берутся целиком, построчно считается только review_id.
+    Строки без даты пропускаются — без неё неделя/период не посчитается.
+    """
+    if df is None or df.empty:
+        return ReviewBatch.empty()
+    dates = pd.to_datetime(pd.Series(df["date"].to_numpy(dtype=object)), errors="coerce")
+    keep = dates.notna().to_numpy()
+    df = df.loc[keep]
+    dates = dates[keep].reset_index(drop=True)
+
+    sources = _str_column(df["source"].to_numpy(dtype=object), "") if "source" in df.columns else [""] * len(df)
+    authors = _str_column(df["author"].to_numpy(dtype=object), "") if "author" in df.columns else [""] * len(df)
+    texts = _str_column(df["text"].to_numpy(dtype=object), "") if "text" in df.columns else [""] * len(df)
+    review_ids = [
+        make_review_id(source_code, author, dt, text)
+        for source_code, author, dt, text in zip(sources, authors, dates.dt.date, texts)
+    ]
+    frame = pd.DataFrame({
+        "review_id": review_ids,
+        "source": sources,
+        "created_at": dates,
+        "rating10": df["rating10"].to_numpy() if "rating10" in df.columns else None,
+        "lang": df["lang"].to_numpy(dtype=object) if "lang" in df.columns else None,
+        "text": texts,
+    })
+    return ReviewBatch.from_frame(frame)
+
+
 def df_to_inputs(df: pd.DataFrame) -> List[ReviewRecordInput]:
     """
     Преобразует нормализованный DataFrame (read_reviews_xls) в список ReviewRecordInput для ядра.
+    Входы анализа принимают и ReviewBatch напрямую — см. df_to_batch.
     """
-    out: List[ReviewRecordInput] = []
-    if df is None or df.empty:
-        return out
-    for _, row in df.iterrows():
-        dt = row.get("date", None)
-        if pd.isna(dt) or not dt:
-            # пропускаем, без даты неделя/период не посчитается
-            continue
-        dt = row["date"] if isinstance(row["date"], date) else pd.to_datetime(row["date"]).date()
-
-        source_code = str(row.get("source") or "")
-        author = str(row.get("author") or "")
-        text = str(row.get("text") or "")
-        lang = str(row.get("lang") or "other")
-        rating10 = row.get("rating10", None)
-        rating10 = None if pd.isna(rating10) else float(rating10)
-
-        review_id = make_review_id(source_code, author, dt, text)
-
-        out.append(
-            ReviewRecordInput(
-                review_id=review_id,
-                source=source_code,
-                created_at=dt,
-                rating10=rating10,
-                lang=lang,
-                text=text,
-            )
-        )
-    return out
+    return df_to_batch(df).records()
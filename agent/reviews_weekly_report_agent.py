@@ -26,7 +26,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # --- наши модули (пакетные импорты) ---
-from . import reviews_io, reviews_core
+from . import reviews_io, reviews_core, reviews_cache, lexicon_diff
 from .metrics_core import iso_week_monday, period_ranges_for_week
 from .connectors import build_credentials_from_b64, get_drive_client, get_sheets_client
 
@@ -53,6 +53,14 @@ DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
 HISTORY_SHEET_NAME = "reviews_history"  # отдельная вкладка в общем SHEETS_HISTORY_ID
+# порядок колонок reviews_history (review_key — 11-я колонка, K)
+HISTORY_COLUMNS = [
+    "date", "iso_week", "source", "lang", "rating10",
+    "sentiment_score", "sentiment_overall",
+    "aspects", "topics", "has_response",
+    "review_key", "text_trimmed", "ingested_at",
+    "degraded",
+]
 
 # шаблон имён файлов в Google Drive:
 # Reviews_DD-MM-YYYY.xls  ИЛИ  reviews_YYYY-MM-DD.xls — поддерживаем оба
@@ -159,6 +167,29 @@ def _ensure_sheet_exists(sheets, spreadsheet_id: str, title: str) -> None:
     body = {"requests": [{"addSheet": {"properties": {"title": title}}}]}
     sheets.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
 
+def _ensure_history_degraded_column(sheets, spreadsheet_id: str) -> None:
+    """
+    Листы reviews_history, заведённые до колонки degraded, получают её
+    заголовок последней колонкой (строки пишутся в порядке HISTORY_COLUMNS).
+    Пустой лист не трогаем — заголовок пишется вместе с первыми строками.
+    """
+    resp = sheets.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=f"'{HISTORY_SHEET_NAME}'!1:1"
+    ).execute()
+    header = (resp.get("values") or [[]])[0]
+    if not header or "degraded" in header:
+        return
+    if header != HISTORY_COLUMNS[:-1]:
+        LOG.warning("Неожиданный заголовок %s: колонку degraded не добавляем", HISTORY_SHEET_NAME)
+        return
+    cell = chr(ord("A") + len(header))
+    sheets.spreadsheets().values().update(
+        spreadsheetId=spreadsheet_id,
+        range=f"'{HISTORY_SHEET_NAME}'!{cell}1",
+        valueInputOption="RAW",
+        body={"values": [["degraded"]]},
+    ).execute()
+
 def _read_sheet_as_df(sheets, spreadsheet_id: str, title: str) -> pd.DataFrame:
     try:
         resp = sheets.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range=f"'{title}'!A:Z").execute()
@@ -175,12 +206,14 @@ def _parse_history_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     Приводим types и базовые поля. Ожидаемые колонки:
     date, iso_week, source, lang, rating10, sentiment_score, sentiment_overall,
-    aspects, topics, has_response, review_key, text_trimmed, ingested_at
+    aspects, topics, has_response, review_key, text_trimmed, ingested_at, degraded
+    (degraded может отсутствовать у строк, записанных до появления колонки)
     """
     if df is None or df.empty:
         return pd.DataFrame(columns=[
             "review_id","source","created_at","week_key","rating10",
             "sentiment_overall","sentiment_score","lang","topics","aspects","raw_text",
+            "degraded",
         ])
     d = df.copy()
     # Канонизируем имена
@@ -208,6 +241,7 @@ def _parse_history_df(df: pd.DataFrame) -> pd.DataFrame:
         "topics": d.get(col("topics")).fillna(""),
         "aspects": d.get(col("aspects")).fillna(""),
         "raw_text": d.get(col("text_trimmed")).fillna(""),
+        "degraded": d[col("degraded")].fillna("") if col("degraded") in d.columns else "",
     })
     # фильтр валидных дат
     out = out[~out["created_at"].isna()].copy()
@@ -290,6 +324,7 @@ def _upsert_reviews_history_week(
     Не дублирует строки с уже существующим review_key в рамках той же iso_week.
     """
     _ensure_sheet_exists(sheets, spreadsheet_id, HISTORY_SHEET_NAME)
+    _ensure_history_degraded_column(sheets, spreadsheet_id)
     df_sheet = _read_sheet_as_df(sheets, spreadsheet_id, HISTORY_SHEET_NAME)
 
     # текущие ключи недели (если лист пуст — просто пишем)
@@ -306,12 +341,7 @@ def _upsert_reviews_history_week(
         raw_map = dict(zip(df_raw_with_has_response["review_id"], df_raw_with_has_response["has_response"]))
 
     to_append: List[List[Any]] = []
-    cols = [
-        "date", "iso_week", "source", "lang", "rating10",
-        "sentiment_score", "sentiment_overall",
-        "aspects", "topics", "has_response",
-        "review_key", "text_trimmed", "ingested_at",
-    ]
+    cols = HISTORY_COLUMNS
 
     now = _now_iso()
     for _, row in df_reviews.iterrows():
@@ -343,6 +373,7 @@ def _upsert_reviews_history_week(
             review_key,
             text_trimmed,
             now,
+            str(row.get("degraded") or ""),
         ]
         to_append.append(vals)
 
@@ -602,30 +633,17 @@ def _section_B0_dynamics(week_df: pd.DataFrame, df_hist_all: pd.DataFrame, ancho
         return (f"<p>Средняя оценка текущей недели — {'' if a_cur!=a_cur else f'{a_cur:.2f}/10'}. "
                 f"Показатели позитивных/негативных отзывов близки к уровню последних четырёх недель.</p>")
 
-def _df_to_inputs_for_lexicon(df_subset: pd.DataFrame) -> List[reviews_core.ReviewRecordInput]:
+def _df_to_inputs_for_lexicon(df_subset: pd.DataFrame) -> reviews_core.ReviewBatch:
     """
-    Готовим минимальный набор ReviewRecordInput для повторного анализа лексиконом.
-    Берём review_id, source, created_at(date), rating10, lang, raw_text.
+    Готовим минимальный набор входов (ReviewBatch) для повторного анализа лексиконом.
+    Берём review_id, source, created_at(date), rating10, lang, raw_text;
+    строки без даты или с пустым текстом пропускаем.
     """
-    out: List[reviews_core.ReviewRecordInput] = []
     if df_subset is None or len(df_subset) == 0:
-        return out
-    for _, r in df_subset.iterrows():
-        dt = pd.to_datetime(r.get("created_at")).date() if pd.notna(r.get("created_at")) else None
-        if dt is None:
-            continue
-        txt = str(r.get("raw_text") or "").strip()
-        if not txt:
-            continue
-        out.append(reviews_core.ReviewRecordInput(
-            review_id=str(r.get("review_id")),
-            source=str(r.get("source")),
-            created_at=dt,
-            rating10=(None if pd.isna(r.get("rating10")) else float(r.get("rating10"))),
-            lang=str(r.get("lang") or "en"),
-            text=txt,
-        ))
-    return out
+        return reviews_core.ReviewBatch.empty()
+    text = df_subset["raw_text"].fillna("").astype(str).str.strip()
+    df = df_subset.assign(raw_text=text)[text.ne("").to_numpy()]
+    return reviews_core.ReviewBatch.from_frame(df, text_col="raw_text", default_lang="en")
 
 def _recompute_aspects_for_period(df_subset: pd.DataFrame, lexicon) -> pd.DataFrame:
     """
@@ -641,7 +659,9 @@ def _recompute_aspects_for_period(df_subset: pd.DataFrame, lexicon) -> pd.DataFr
         return pd.DataFrame(columns=[
             "aspect_code","review_id","polarity_hint","topic_key","subtopic_key","display_short","long_hint","week_key"
         ])
-    analyzed = reviews_core.analyze_reviews_bulk(inputs, lexicon)
+    analyzed = reviews_core.analyze_reviews_bulk(
+        inputs, lexicon, cache=reviews_cache.get_default_result_cache(),
+    )
     return reviews_core.build_aspects_dataframe(analyzed)
 
 def _section_B3_deviations(
@@ -896,7 +916,7 @@ def _make_plot_weekly_rating(df_hist_all: pd.DataFrame) -> Tuple[str, bytes]:
     # последние 8 недель
     tmp = df_hist_all.copy()
     tmp["created_at"] = pd.to_datetime(tmp["created_at"])
-    agg = tmp.groupby("week_key", as_index=False)["rating10"].mean().tail(8)
+    agg = tmp.groupby("week_key", as_index=False, observed=True)["rating10"].mean().tail(8)
     plt.figure()
     plt.plot(agg["week_key"], agg["rating10"], marker="o")
     plt.title("Динамика средней оценки (последние 8 недель)")
@@ -909,7 +929,7 @@ def _make_plot_negative_factors(aspects_week: pd.DataFrame, aspects_prev4: pd.Da
     # top-3 рисков по negative_impact_index на неделе; сравним с базой prev4
     if aspects_week is None or len(aspects_week) == 0 or aspects_prev4 is None or len(aspects_prev4) == 0:
         return ("negative_factors.png", b"")
-    base = aspects_prev4[["aspect_code","negative_impact_index"]].groupby("aspect_code", as_index=False).mean()
+    base = aspects_prev4[["aspect_code","negative_impact_index"]].groupby("aspect_code", as_index=False, observed=True).mean()
     cur = aspects_week.sort_values("negative_impact_index", ascending=False).head(3).copy()
     m = cur.merge(base, on="aspect_code", how="left", suffixes=("_week","_prev4")).fillna(0.0)
     labels = [a or c for a, c in zip(m.get("display_short", m["aspect_code"]), m["aspect_code"])]
@@ -998,18 +1018,39 @@ def main() -> None:
     # --- Анализ ---
     # В реальном запуске сюда передаётся ваш Lexicon() из lexicon_module.
     # Чтобы каркас не падал на пустом лексиконе, поддержим lazy import.
-    from .lexicon_module import Lexicon
+    from .lexicon_module import get_default_lexicon
 
-    lexicon = Lexicon()  # ВАЖНО: предполагается, что в модуле реализованы compiled_topics/topic_schema и т.д.
-    analyzed = reviews_core.analyze_reviews_bulk(inputs, lexicon)
+    lexicon = get_default_lexicon()  # ВАЖНО: предполагается, что в модуле реализованы compiled_topics/topic_schema и т.д.
+    # --- История из Google Sheets ---
+    hist_df_raw = _read_sheet_as_df(sheets, sheets_id, HISTORY_SHEET_NAME)
+    df_hist = _parse_history_df(hist_df_raw)
+
+    # результаты по review_id переживают запуски: пересчёт истории ниже
+    # (B3, графики) анализирует заново только новые отзывы. После правки
+    # лексикона сначала переносим результаты прошлой версии (заново —
+    # только отзывы, задетые изменившимися правилами), потом чистим её
+    result_cache = reviews_cache.get_default_result_cache()
+    if result_cache is not None:
+        # кэш — оптимизация: при любой ошибке отзывы просто проанализируются заново
+        try:
+            migration = lexicon_diff.migrate_result_cache(
+                list(inputs) + _df_to_inputs_for_lexicon(df_hist).records(), lexicon, result_cache,
+            )
+            if migration is not None:
+                LOG.info(f"Кэш результатов перенесён на новую версию лексикона: {migration.summary()}")
+            pruned = result_cache.prune(lexicon)
+            if pruned:
+                LOG.info(f"Кэш результатов: удалено {pruned} записей прежних версий лексикона")
+        except Exception as e:
+            LOG.warning(f"Перенос/очистка кэша результатов не удались, продолжаем без них: {e}")
+    slow_log = reviews_core.slow_log_from_env()
+    analyzed = reviews_core.analyze_reviews_bulk(inputs, lexicon, cache=result_cache, slow_log=slow_log)
+    slow_summary = reviews_core.publish_slow_log(slow_log)
 
     df_reviews = reviews_core.build_reviews_dataframe(analyzed)
     df_aspects = reviews_core.build_aspects_dataframe(analyzed)
 
-        # --- История из Google Sheets + объединение с текущей неделей ---
-    hist_df_raw = _read_sheet_as_df(sheets, sheets_id, HISTORY_SHEET_NAME)
-    df_hist = _parse_history_df(hist_df_raw)
-
+    # --- объединение истории с текущей неделей ---
     # объединяем: history ∪ текущая неделя (без дублей по review_id)
     # df_reviews — текущие отзывы из файла недели
     # df_hist — история из Google Sheets
@@ -1108,7 +1149,7 @@ def main() -> None:
                                        else "negative" if ((r.get("sentiment_overall") == "negative") or ((r.get("rating10") or 11) <= 6))
                                        else "neutral"), axis=1)
         df_week = df_week.assign(__label__=lab)
-        g = df_week.groupby("source", dropna=False)
+        g = df_week.groupby("source", dropna=False, observed=True)
         df_sources = g.agg(
             reviews=("review_id", "nunique"),
             avg10=("rating10", "mean"),
@@ -1177,7 +1218,10 @@ def main() -> None:
                 with open(summary_path, "a", encoding="utf-8") as fh:
                     fh.write(f"### Reviews weekly report {anchor_week_key}\n\n")
                     fh.write(f"- Период: {week_start.isoformat()} .. {week_end.isoformat()}\n")
-                    fh.write("- За эту неделю отзывов нет.\n\n")
+                    fh.write("- За эту неделю отзывов нет.\n")
+                    fh.write(reviews_core.format_budget_summary() + "\n")
+                    if slow_summary:
+                        fh.write(slow_summary + "\n")
             except Exception as e:
                 LOG.debug("Не удалось записать summary для пустой недели %s: %s", anchor_week_key, e)
     else:
@@ -1223,7 +1267,10 @@ def main() -> None:
                         else:
                             fh.write(f"- Средняя оценка: n/a\n")
                         fh.write(f"- Доля позитивных: {pos_txt}\n")
-                        fh.write(f"- Доля негативных: {neg_txt}\n\n")
+                        fh.write(f"- Доля негативных: {neg_txt}\n")
+                        fh.write(reviews_core.format_budget_summary() + "\n")
+                        if slow_summary:
+                            fh.write(slow_summary + "\n")
                 except Exception as e2:
                     LOG.debug("Не удалось записать summary для недели %s: %s", anchor_week_key, e2)
 